@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class CancellationToken:
+    """
+    A flag that a job checks regularly to find out whether it should stop.
+    """
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def check(self) -> None:
+        """
+        Raise JobCancelled if the job has been cancelled.
+        """
+        if self.cancelled:
+            raise JobCancelled
+
+
+class JobRunner:
+    """
+    Run one job at a time in a worker thread. Submitting a job cancels the
+    previous one.
+
+    :param dispatch: A function that runs a callable on the main thread, e.g.
+        `PyObjCTools.AppHelper.callAfter`. The result callbacks are passed through
+        it. By default, they are called directly from the worker thread.
+    """
+
+    def __init__(self, dispatch: Callable[[Callable[[], Any]], Any] | None = None):
+        self.dispatch = dispatch
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="UnicodeInfoJob"
+        )
+        self._token: CancellationToken | None = None
+        self._future: Future | None = None
+
+    @property
+    def running(self) -> bool:
+        """
+        Return whether a job has been submitted and is neither finished nor
+        cancelled.
+        """
+        return self._token is not None
+
+    def submit(
+        self,
+        func: Callable[[CancellationToken], Any],
+        on_done: Callable[[Any], Any],
+        on_error: Callable[[Exception], Any] | None = None,
+        prepare: Iterable[Any] | None = None,
+    ) -> CancellationToken:
+        """
+        Run `func` with a cancellation token in the worker thread and call
+        `on_done` with its result, unless the job was cancelled meanwhile.
+
+        :param prepare: Steps to run on the main thread before `func` is started,
+            e.g. calls that must not be made from other threads. Iterating it runs
+            the steps; each step is passed through `dispatch` on its own, so the
+            main thread stays responsive in between, and no further steps are run
+            once the job is cancelled.
+        """
+        self.cancel()
+        token = self._token = CancellationToken()
+
+        def finish(callback: Callable[[Any], Any], value: Any) -> None:
+            # The job may have been cancelled while the result was on its way
+            if token.cancelled:
+                return
+
+            if self._token is token:
+                self._token = None
+            callback(value)
+
+        def deliver(callback: Callable[[Any], Any], value: Any) -> None:
+            if self.dispatch is None:
+                finish(callback, value)
+            else:
+                self.dispatch(lambda: finish(callback, value))
+
+        def run() -> None:
+            try:
+                token.check()
+                result = func(token)
+            except JobCancelled:
+                return
+            except Exception as e:
+                if on_error is None:
+                    text = traceback.format_exc()
+                    deliver(lambda _: print(text), e)
+                else:
+                    deliver(on_error, e)
+                return
+
+            deliver(on_done, result)
+
+        def start() -> None:
+            self._future = self._executor.submit(run)
+
+        if prepare is None:
+            start()
+            return token
+
+        steps = iter(prepare)
+
+        def step() -> None:
+            while not token.cancelled:
+                try:
+                    next(steps)
+                except StopIteration:
+                    start()
+                    return
+                except Exception as e:
+                    if on_error is None:
+                        print(traceback.format_exc())
+                    else:
+                        finish(on_error, e)
+                    return
+
+                if self.dispatch is not None:
+                    # Run the next step in a later turn of the main thread
+                    self.dispatch(step)
+                    return
+
+        if self.dispatch is None:
+            step()
+        else:
+            self.dispatch(step)
+        return token
+
+    def cancel(self) -> bool:
+        """
+        Cancel the current job. Return whether there was one.
+        """
+        token = self._token
+        if token is None:
+            return False
+
+        token.cancel()
+        self._token = None
+        return True
+
+    def wait(self, timeout: float | None = None) -> None:
+        """
+        Wait until the last submitted job has stopped, e.g. after cancelling it.
+        """
+        if self._future is not None:
+            wait([self._future], timeout)
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+from jkUnicode.uniBlock import uniNameToBlock
+from jkUnicode.uniName import uniName
+
+if TYPE_CHECKING:
+    from codepointBitmap import CodepointBitmap
+    from fontIndex import FontIndex
+    from tableCache import Table, TableCache
+
+
+_data_version: str | None = None
+
+
+def data_version() -> str:
+    """
+    Return the version of the installed jkUnicode data. It is looked up once per
+    process, as the imported data can't change.
+    """
+    global _data_version
+    if _data_version is None:
+        try:
+            from importlib.metadata import version
+
+            _data_version = version("jkUnicode")
+        except Exception:
+            _data_version = "unknown"
+    return _data_version
+
+
+class BlockIndex:
+    """
+    The sorted assigned codepoints of each Unicode block.
+
+    :param tables: The tables from `to_tables`, e.g. loaded from the cache. If
+        None, the index is built from the jkUnicode data.
+    """
+
+    def __init__(self, tables: dict[str, Table] | None = None) -> None:
+        self.version = data_version()
+        self.assigned: dict[str, tuple[int, ...]] = {}
+        if tables is None:
+            assigned = sorted(uniName)
+            self.ranges = sorted(uniNameToBlock.items(), key=lambda item: item[1][0])
+            for block, (low, high) in self.ranges:
+                self.assigned[block] = tuple(
+                    assigned[bisect_left(assigned, low) : bisect_right(assigned, high)]
+                )
+        else:
+            bounds = tables["ranges"]
+            codepoints = tables["assigned"]
+            ends = list(accumulate(tables["counts"]))
+            self.ranges = []
+            for i, block in enumerate(tables["blocks"]):
+                self.ranges.append((block, (bounds[2 * i], bounds[2 * i + 1])))
+                start = ends[i - 1] if i else 0
+                self.assigned[block] = tuple(codepoints[start : ends[i]])
+        self.bounds = dict(self.ranges)
+        self._starts = [low for _, (low, _) in self.ranges]
+
+    def to_tables(self) -> dict[str, Table]:
+        """
+        Return the index as tables for the cache.
+        """
+        bounds = array("I")
+        counts = array("I")
+        codepoints = array("I")
+        for block, (low, high) in self.ranges:
+            bounds.extend((low, high))
+            counts.append(len(self.assigned[block]))
+            codepoints.extend(self.assigned[block])
+        return {
+            "blocks": [block for block, _ in self.ranges],
+            "ranges": bounds,
+            "counts": counts,
+            "assigned": codepoints,
+        }
+
+    def block_for_codepoint(self, cp: int) -> str | None:
+        """
+        Return the name of the block that contains the codepoint, or None.
+        """
+        i = bisect_right(self._starts, cp) - 1
+        if i < 0:
+            return None
+
+        block, (_, high) = self.ranges[i]
+        if cp > high:
+            return None
+
+        return block
+
+
+_block_index: BlockIndex | None = None
+
+
+def get_block_index(cache: TableCache | None = None) -> BlockIndex:
+    """
+    Return the shared block index, building it once per jkUnicode data version.
+    If a cache is given, the index is loaded from it or written to it.
+    """
+    global _block_index
+    if _block_index is None or _block_index.version != data_version():
+        if cache is None:
+            _block_index = BlockIndex()
+        else:
+            _block_index = BlockIndex(
+                cache.load_or_build(
+                    "blocks", data_version(), lambda: BlockIndex().to_tables()
+                )
+            )
+    return _block_index
+
+
+class BlockCompleteness:
+    """
+    The number of assigned codepoints of each block that are present in a font.
+
+    The counts of a block are computed from the bitmap range of the block, as the
+    number of set bits of the assigned codepoints bitmap AND the font's bitmap.
+
+    :param block_index: The block index.
+    :param assigned: The bitmap of assigned codepoints. If None, the shared bitmap
+        is used.
+    """
+
+    def __init__(
+        self, block_index: BlockIndex, assigned: CodepointBitmap | None = None
+    ) -> None:
+        from codepointBitmap import CodepointBitmap, get_assigned_bitmap
+
+        self.block_index = block_index
+        self.assigned = get_assigned_bitmap() if assigned is None else assigned
+        self.font_bitmap = CodepointBitmap()
+        self._counts: dict[str, tuple[int, int]] = {}
+        # The number of assigned codepoints doesn't depend on the font
+        self._totals: dict[str, int] = {}
+        self._key: tuple[int, int] | None = None
+
+    def sync(self, font_index: FontIndex) -> None:
+        """
+        Bring the counts up to date with the font index.
+        """
+        key = (font_index.serial, font_index.version)
+        if key == self._key:
+            return
+
+        self.font_bitmap = font_index.bitmap()
+        self._counts.clear()
+        self._key = key
+
+    def counts(self, block: str) -> tuple[int, int]:
+        """
+        Return the number of found and missing codepoints of the block.
+        """
+        counts = self._counts.get(block)
+        if counts is None:
+            low, high = self.block_index.bounds[block]
+            total = self._totals.get(block)
+            if total is None:
+                total = self._totals[block] = self.assigned.count(low, high)
+            found = self.assigned.count_in(self.font_bitmap, low, high)
+            counts = self._counts[block] = (found, total - found)
+        return counts
+
+    def missing_codepoints(self, block: str) -> list[int]:
+        """
+        Return the sorted assigned codepoints of the block that are missing.
+        """
+        return self.assigned.codepoints_not_in(
+            self.font_bitmap, *self.block_index.bounds[block]
+        )
+
+    def symbol(self, block: str) -> str:
+        """
+        Return the support indicator of the block.
+        """
+        found, missing = self.counts(block)
+        if not found:
+            return "○"
+        if missing:
+            return "◑"
+        return "●"
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from tableCache import TableCache
+
+# The number of codepoints and the size of a bitmap in bytes (136 KB)
+SIZE = 0x110000
+NUM_BYTES = SIZE // 8
+
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    # Python < 3.10
+
+    def popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+# The positions of the set bits of each byte value
+_BYTE_BITS = [tuple(i for i in range(8) if value >> i & 1) for value in range(256)]
+
+
+def _bits_to_codepoints(bits: int, low: int) -> list[int]:
+    # Walk the bytes, clearing bits of a large integer one by one is quadratic
+    result = []
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = low + 8 * offset
+            result.extend(base + i for i in _BYTE_BITS[byte])
+    return result
+
+
+class CodepointBitmap:
+    """
+    A set of codepoints as a bitmap with one bit per codepoint, bit 0 of byte 0
+    being U+0000.
+
+    Set operations work on whole bitmaps as Python integers. Counting and
+    enumerating the codepoints of a range only touch the bytes of the range.
+
+    :param data: The bitmap, NUM_BYTES long. If None, the bitmap is empty.
+    """
+
+    def __init__(self, data: bytes | None = None) -> None:
+        if data is None:
+            data = bytes(NUM_BYTES)
+        elif len(data) != NUM_BYTES:
+            raise ValueError(f"A codepoint bitmap must be {NUM_BYTES} bytes long.")
+        self.data = bytes(data)
+
+    @classmethod
+    def from_codepoints(cls, codepoints: Iterable[int]) -> CodepointBitmap:
+        data = bytearray(NUM_BYTES)
+        for u in codepoints:
+            data[u >> 3] |= 1 << (u & 7)
+        return cls(data)
+
+    @classmethod
+    def _from_int(cls, value: int) -> CodepointBitmap:
+        return cls(value.to_bytes(NUM_BYTES, "little"))
+
+    def _int(self) -> int:
+        return int.from_bytes(self.data, "little")
+
+    # Set operations
+
+    def __and__(self, other: CodepointBitmap) -> CodepointBitmap:
+        return self._from_int(self._int() & other._int())
+
+    def __or__(self, other: CodepointBitmap) -> CodepointBitmap:
+        return self._from_int(self._int() | other._int())
+
+    def __sub__(self, other: CodepointBitmap) -> CodepointBitmap:
+        return self._from_int(self._int() & ~other._int())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CodepointBitmap):
+            return NotImplemented
+        return self.data == other.data
+
+    def __contains__(self, u: int) -> bool:
+        return 0 <= u < SIZE and bool(self.data[u >> 3] >> (u & 7) & 1)
+
+    def __len__(self) -> int:
+        return popcount(self._int())
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.codepoints())
+
+    # Range queries
+
+    def _range_bits(self, low: int, high: int) -> int:
+        # The bits of the range as an integer, bit 0 being the codepoint `low`
+        chunk = int.from_bytes(self.data[low >> 3 : (high >> 3) + 1], "little")
+        return (chunk >> (low & 7)) & ((1 << (high - low + 1)) - 1)
+
+    def count(self, low: int = 0, high: int = SIZE - 1) -> int:
+        """
+        Return the number of codepoints from low to high, both included.
+        """
+        return popcount(self._range_bits(low, high))
+
+    def codepoints(self, low: int = 0, high: int = SIZE - 1) -> list[int]:
+        """
+        Return the sorted codepoints from low to high, both included.
+        """
+        return _bits_to_codepoints(self._range_bits(low, high), low)
+
+    def count_in(
+        self, other: CodepointBitmap, low: int = 0, high: int = SIZE - 1
+    ) -> int:
+        """
+        Return the number of codepoints from low to high that are also in the other
+        bitmap.
+        """
+        return popcount(self._range_bits(low, high) & other._range_bits(low, high))
+
+    def codepoints_not_in(
+        self, other: CodepointBitmap, low: int = 0, high: int = SIZE - 1
+    ) -> list[int]:
+        """
+        Return the sorted codepoints from low to high that are not in the other
+        bitmap.
+        """
+        return _bits_to_codepoints(
+            self._range_bits(low, high) & ~other._range_bits(low, high), low
+        )
+
+    def __repr__(self) -> str:
+        return f"<CodepointBitmap {len(self)} codepoints>"
+
+
+_assigned: CodepointBitmap | None = None
+_assigned_version: str | None = None
+
+
+def get_assigned_bitmap(cache: TableCache | None = None) -> CodepointBitmap:
+    """
+    Return the shared bitmap of assigned codepoints, i.e. those with a name in
+    jkUnicode, building it once per data version. If a cache is given, the bitmap
+    is loaded from it or written to it.
+    """
+    global _assigned, _assigned_version
+    from blockIndex import data_version
+
+    version = data_version()
+    if _assigned is None or _assigned_version != version:
+
+        def build() -> dict:
+            from jkUnicode.uniName import uniName
+
+            return {"bitmap": array("B", CodepointBitmap.from_codepoints(uniName).data)}
+
+        if cache is None:
+            tables = build()
+        else:
+            tables = cache.load_or_build("assigned", version, build)
+        _assigned = CodepointBitmap(tables["bitmap"].tobytes())
+        _assigned_version = version
+    return _assigned
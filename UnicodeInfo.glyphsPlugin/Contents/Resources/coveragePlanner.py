@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable
+
+from codepointBitmap import popcount
+from jkUnicode.uniScriptData import uniScripts
+from orthographyIndex import OrthographyMasks
+
+if TYPE_CHECKING:
+    from jkUnicode.orthography import Orthography
+    from orthographyDatabase import OrthographyDatabase
+
+# Scripts that don't decide the script of an orthography
+NEUTRAL_SCRIPTS = {"Common", "Inherited", "Unknown"}
+
+
+# The script ranges sorted by start, for bisection. jkUnicode's get_script searches
+# all ranges linearly.
+_script_ranges = sorted(uniScripts.items())
+_script_starts = [low for (low, _), _ in _script_ranges]
+
+
+def get_script(codepoint: int) -> str:
+    """
+    Return the Unicode script name of a codepoint, like jkUnicode's get_script.
+    """
+    i = bisect_right(_script_starts, codepoint) - 1
+    if i >= 0:
+        (_, high), script = _script_ranges[i]
+        if codepoint <= high:
+            return script
+    return "Unknown"
+
+
+def orthography_script(orthography: Orthography) -> str | None:
+    """
+    Return the Unicode script name of most base characters of an orthography, e.g.
+    "Latin", or None if it only uses neutral characters.
+    """
+    scripts = Counter(get_script(u) for u in orthography.unicodes_base)
+    for script in NEUTRAL_SCRIPTS:
+        scripts.pop(script, None)
+    if not scripts:
+        return None
+    return scripts.most_common(1)[0][0]
+
+
+class CoverageStep:
+    """
+    One step of a coverage plan.
+
+    :param codepoints: The codepoints to add, sorted.
+    :param orthographies: The orthographies that get basic support by adding them.
+        The first one is the target of the step, the others are supported as a side
+        effect.
+    """
+
+    def __init__(self, codepoints: list[int], orthographies: list[Orthography]) -> None:
+        self.codepoints = codepoints
+        self.orthographies = orthographies
+
+    @property
+    def speakers(self) -> int:
+        return sum(o.speakers for o in self.orthographies)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CoverageStep add={len(self.codepoints)} "
+            f"orthographies={[o.name for o in self.orthographies]}>"
+        )
+
+
+class CoveragePlan:
+    """
+    The codepoints to add to a font to support the most speakers within a budget.
+
+    :param steps: The steps of the plan, in order.
+    :param budget: The maximum number of codepoints the plan may add.
+    """
+
+    def __init__(self, steps: list[CoverageStep], budget: int) -> None:
+        self.steps = steps
+        self.budget = budget
+
+    @property
+    def codepoints(self) -> list[int]:
+        """
+        Return all codepoints to add, in the order of the steps.
+        """
+        return [u for step in self.steps for u in step.codepoints]
+
+    @property
+    def speakers(self) -> int:
+        """
+        Return the number of newly supported speakers.
+        """
+        return sum(step.speakers for step in self.steps)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CoveragePlan add={len(self.codepoints)}/{self.budget} "
+            f"steps={len(self.steps)} speakers={self.speakers}>"
+        )
+
+
+class CoveragePlanner:
+    """
+    Plan which codepoints to add to a font to give the most speakers basic support,
+    as a greedy weighted set cover over the orthographies.
+
+    The base and punctuation characters of the orthographies are taken from the
+    shared `OrthographyMasks` of the database, so the missing characters of all
+    orthographies can be recomputed quickly after each step.
+    """
+
+    def __init__(self, ortho: OrthographyDatabase) -> None:
+        self.ortho = ortho
+        self.masks = ortho.shared("orthography masks", OrthographyMasks)
+        self._scripts: list[str | None] | None = None
+
+    def scripts(self) -> list[str | None]:
+        """
+        Return the script of each orthography, see `orthography_script`.
+        """
+        if self._scripts is None:
+            self._scripts = [orthography_script(o) for o in self.ortho.orthographies]
+        return self._scripts
+
+    def plan(
+        self,
+        codepoints: Iterable[int],
+        budget: int,
+        scripts: Iterable[str] | None = None,
+    ) -> CoveragePlan:
+        """
+        Return the plan for a font with the given codepoints.
+
+        In each step, the orthography with the most speakers per missing character
+        that still fits into the budget is chosen, and all its missing characters
+        are added.
+
+        :param codepoints: The codepoints of the font.
+        :param budget: The maximum number of codepoints to add.
+        :param scripts: If given, only orthographies whose script (see
+            `orthography_script`) is one of these scripts are considered.
+        """
+        orthographies = self.ortho.orthographies
+        masks = self.masks.basic
+        present = self.masks.mask_for_codepoints(codepoints)
+        script_filter = None if scripts is None else set(scripts)
+        script_list = None if script_filter is None else self.scripts()
+        active = [
+            i
+            for i, o in enumerate(orthographies)
+            if o.speakers
+            and masks[i] & ~present
+            and (script_filter is None or script_list[i] in script_filter)
+        ]
+
+        steps: list[CoverageStep] = []
+        left = budget
+        while active and left > 0:
+            best = None
+            best_score = 0.0
+            best_missing = 0
+            remaining = []
+            for i in active:
+                missing = masks[i] & ~present
+                if not missing:
+                    # Supported as a side effect of the previous step
+                    steps[-1].orthographies.append(orthographies[i])
+                    continue
+
+                remaining.append(i)
+                cost = popcount(missing)
+                if cost > left:
+                    continue
+
+                score = orthographies[i].speakers / cost
+                if score > best_score:
+                    best = i
+                    best_score = score
+                    best_missing = missing
+            active = remaining
+            if best is None:
+                break
+
+            present |= best_missing
+            left -= popcount(best_missing)
+            steps.append(
+                CoverageStep(
+                    self.masks.codepoints_for_mask(best_missing),
+                    [orthographies[best]],
+                )
+            )
+            active.remove(best)
+
+        # Collect the side effects of the last step
+        if steps:
+            for i in active:
+                if not masks[i] & ~present:
+                    steps[-1].orthographies.append(orthographies[i])
+        return CoveragePlan(steps, budget)
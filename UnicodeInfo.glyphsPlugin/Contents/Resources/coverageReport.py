@@ -0,0 +1,318 @@
+"""
+Report the Unicode block and orthography support of many fonts at once.
+
+Usage:
+
+    python coverageReport.py [-s Hyperglot|CLDR] [-f json|csv] [-o report.json]
+        [-j JOBS] [--plan BUDGET [--script SCRIPT ...]] FONT [FONT ...]
+
+FONT can be a .ufo or .glyphs source, a compiled font (.ttf, .otf, .woff,
+.woff2, needs fontTools), or a plain cmap dump: a .json file with a map of
+codepoints (int or hex string) to glyph names, or a text file with one hex
+codepoint and an optional glyph name per line.
+
+With --plan, the JSON report also lists for each font the codepoints to add that
+give the most speakers basic support, within a budget of BUDGET codepoints.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import plistlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from standInFont import StandInFont, StandInGlyph
+
+# Loading of fonts
+
+
+def parse_codepoint(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+    value = str(value).strip()
+    if value[:2].upper() in ("U+", "0X"):
+        value = value[2:]
+    return int(value, 16)
+
+
+def load_cmap_dump(path: Path) -> StandInFont:
+    if path.suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        cmap = {parse_codepoint(k): v for k, v in data.items()}
+    else:
+        cmap = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.split("#", 1)[0].split()
+                if not parts:
+                    continue
+                u = parse_codepoint(parts[0])
+                cmap[u] = parts[1] if len(parts) > 1 else f"uni{u:04X}"
+    return StandInFont.from_cmap(cmap)
+
+
+def load_ufo(path: Path) -> StandInFont:
+    import xml.etree.ElementTree as ET
+
+    with open(path / "glyphs" / "contents.plist", "rb") as f:
+        contents = plistlib.load(f)
+    skip = set()
+    lib_path = path / "lib.plist"
+    if lib_path.exists():
+        with open(lib_path, "rb") as f:
+            skip = set(plistlib.load(f).get("public.skipExportGlyphs", []))
+    glyphs = []
+    for name, file_name in contents.items():
+        root = ET.parse(path / "glyphs" / file_name).getroot()
+        unicodes = ["%04X" % int(e.get("hex"), 16) for e in root.iter("unicode")]
+        glyphs.append(StandInGlyph(name, unicodes, export=name not in skip))
+    return StandInFont(glyphs)
+
+
+def load_glyphs_source(path: Path) -> StandInFont:
+    try:
+        import openstep_plist
+    except ImportError:
+        raise RuntimeError(
+            "Reading .glyphs files needs the openstep-plist Python package."
+        )
+
+    with open(path, encoding="utf-8") as f:
+        data = openstep_plist.load(f)
+    glyphs_3 = int(data.get(".formatVersion", 1)) >= 3
+    glyphs = []
+    for g in data.get("glyphs", []):
+        value = g.get("unicode")
+        if value is None:
+            values = []
+        elif isinstance(value, (list, tuple)):
+            values = list(value)
+        else:
+            values = str(value).split(",")
+        if glyphs_3:
+            # Glyphs 3 stores decimal numbers
+            unicodes = ["%04X" % int(u) for u in values]
+        else:
+            # Glyphs 2 stores hex strings
+            unicodes = ["%04X" % int(u, 16) for u in values]
+        glyphs.append(
+            StandInGlyph(str(g["glyphname"]), unicodes, export=g.get("export") != "0")
+        )
+    return StandInFont(glyphs)
+
+
+def load_binary_font(path: Path) -> StandInFont:
+    try:
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        raise RuntimeError("Reading compiled fonts needs the fontTools Python package.")
+
+    f = TTFont(path)
+    cmap = f.getBestCmap() or {}
+    f.close()
+    return StandInFont.from_cmap(cmap)
+
+
+def load_font(path: str) -> StandInFont:
+    """
+    Load a font or cmap dump into a StandInFont.
+    """
+    p = Path(path)
+    suffix = p.suffix.lower()
+    if suffix == ".ufo":
+        return load_ufo(p)
+    if suffix == ".glyphs":
+        return load_glyphs_source(p)
+    if suffix in (".ttf", ".otf", ".woff", ".woff2"):
+        return load_binary_font(p)
+    return load_cmap_dump(p)
+
+
+# Coverage computation in worker processes
+
+_engine = None
+_ortho = None
+_plan_options: tuple[int, list[str] | None] | None = None
+
+
+def _init_worker(
+    source: str, plan_options: tuple[int, list[str] | None] | None = None
+) -> None:
+    # Load the data once per worker process
+    global _engine, _ortho, _plan_options
+    from orthographyDatabase import get_orthography_database
+    from unicodeInfoEngine import UnicodeInfoEngine
+
+    _engine = UnicodeInfoEngine()
+    _ortho = get_orthography_database(source)
+    _plan_options = plan_options
+
+
+def coverage_plan(font: StandInFont) -> list[dict[str, Any]]:
+    budget, scripts = _plan_options
+    plan = _engine.plan_coverage(_ortho, font, budget, scripts)
+    return [
+        {
+            "codepoints": ["%04X" % u for u in step.codepoints],
+            "orthographies": [o.identifier for o in step.orthographies],
+            "speakers": step.speakers,
+        }
+        for step in plan.steps
+    ]
+
+
+def font_coverage(path: str) -> dict[str, Any]:
+    """
+    Return the block and orthography support of one font.
+    """
+    from fontIndex import get_font_index
+
+    font = load_font(path)
+    index = get_font_index(font)
+    status = _engine.block_status
+    status.sync(index)
+    blocks = {}
+    for block in status.block_index.assigned:
+        found, missing = status.counts(block)
+        if found:
+            blocks[block] = {
+                "status": status.symbol(block),
+                "found": found,
+                "missing": missing,
+            }
+
+    support = _engine.orthography_support(_ortho, font)
+    orthographies = {}
+    for i, o in enumerate(_ortho.orthographies):
+        orthographies[o.identifier] = {
+            "name": o.name,
+            "support_basic": support.support_basic(o),
+            "support_full": support.support_full(o),
+            "missing_base": support.missing_base[i],
+            "missing_punctuation": support.missing_punctuation[i],
+            "missing_optional": support.missing_optional[i],
+            "speakers": o.speakers,
+        }
+    result = {
+        "font": path,
+        "glyphs": len(font.glyphs),
+        "codepoints": len(index.cmap),
+        "blocks": blocks,
+        "orthographies": orthographies,
+    }
+    if _plan_options is not None:
+        result["plan"] = coverage_plan(font)
+    return result
+
+
+def coverage_report(
+    paths: list[str],
+    source: str = "Hyperglot",
+    jobs: int | None = None,
+    plan_options: tuple[int, list[str] | None] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Compute the coverage of all fonts in a process pool.
+
+    :param plan_options: The budget and optional script filter for a coverage
+        plan. If None, no plan is made.
+    """
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(source, plan_options)
+    ) as executor:
+        return list(executor.map(font_coverage, paths))
+
+
+# Output
+
+
+def write_csv(report: list[dict[str, Any]], f) -> None:
+    writer = csv.writer(f)
+    writer.writerow(["font", "kind", "id", "name", "status", "found", "missing"])
+    for entry in report:
+        for block, info in entry["blocks"].items():
+            writer.writerow(
+                [
+                    entry["font"],
+                    "block",
+                    block,
+                    block,
+                    info["status"],
+                    info["found"],
+                    info["missing"],
+                ]
+            )
+        for identifier, info in entry["orthographies"].items():
+            if info["support_full"]:
+                status = "●"
+            elif info["support_basic"]:
+                status = "◑"
+            else:
+                status = "○"
+            writer.writerow(
+                [
+                    entry["font"],
+                    "orthography",
+                    identifier,
+                    info["name"],
+                    status,
+                    "",
+                    info["missing_base"]
+                    + info["missing_punctuation"]
+                    + info["missing_optional"],
+                ]
+            )
+
+
+def main(args: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Report Unicode block and orthography support of fonts."
+    )
+    parser.add_argument("fonts", nargs="+", help="Font sources or cmap dumps")
+    parser.add_argument(
+        "-s", "--source", choices=("Hyperglot", "CLDR"), default="Hyperglot"
+    )
+    parser.add_argument("-f", "--format", choices=("json", "csv"), default="json")
+    parser.add_argument("-o", "--output", help="Output file, default: stdout")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="Number of worker processes"
+    )
+    parser.add_argument(
+        "--plan",
+        type=int,
+        metavar="BUDGET",
+        help="Plan up to BUDGET codepoints to add for the most supported speakers",
+    )
+    parser.add_argument(
+        "--script",
+        action="append",
+        help="Only plan for orthographies of this script, e.g. Latin",
+    )
+    options = parser.parse_args(args)
+
+    plan_options = None if options.plan is None else (options.plan, options.script)
+    report = coverage_report(options.fonts, options.source, options.jobs, plan_options)
+    if options.output:
+        f = open(options.output, "w", encoding="utf-8", newline="")
+    else:
+        f = sys.stdout
+    try:
+        if options.format == "csv":
+            write_csv(report, f)
+        else:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write(os.linesep)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+if __name__ == "__main__":
+    main()
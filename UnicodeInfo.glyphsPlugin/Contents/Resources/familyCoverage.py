@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+from blockIndex import BlockCompleteness
+from codepointBitmap import CodepointBitmap
+from fontIndex import get_font_index, next_serial
+from orthographyIndex import OrthographySupport
+
+if TYPE_CHECKING:
+    from backgroundJob import CancellationToken
+    from blockIndex import BlockIndex
+    from orthographyDatabase import OrthographyDatabase
+    from standInFont import FontProtocol
+
+
+class FontSnapshot:
+    """
+    An immutable copy of the codepoints of a font, so the coverage of the font can
+    be computed in another thread while the font is being edited.
+
+    It has the serial number, version and bitmap of a font index, so it can be
+    passed to `BlockCompleteness.sync`.
+
+    :param name: The name of the font in the comparison.
+    :param codepoints: The codepoints of the font's exported glyphs.
+    """
+
+    version = 0
+
+    def __init__(self, name: str, codepoints: Iterable[int]) -> None:
+        self.name = name
+        self.serial = next_serial()
+        self.codepoints = frozenset(codepoints)
+        self._bitmap: CodepointBitmap | None = None
+
+    @classmethod
+    def from_font(cls, font: FontProtocol, name: str) -> FontSnapshot:
+        """
+        Take a snapshot of a font from its font index. Must be called on the main
+        thread.
+        """
+        return cls(name, get_font_index(font).codepoints)
+
+    def bitmap(self) -> CodepointBitmap:
+        if self._bitmap is None:
+            self._bitmap = CodepointBitmap.from_codepoints(self.codepoints)
+        return self._bitmap
+
+
+class CoverageMatrix:
+    """
+    The support of Unicode blocks and orthographies by several fonts.
+
+    :param fonts: The names of the fonts, one column each.
+    :param blocks: The block rows: the name of the block, its number of assigned
+        codepoints, and the number found in each font.
+    :param orthographies: The orthography rows: the name of the orthography and
+        its support indicator for each font.
+    """
+
+    def __init__(
+        self,
+        fonts: list[str],
+        blocks: list[tuple[str, int, list[int]]],
+        orthographies: list[tuple[str, list[str]]],
+    ) -> None:
+        self.fonts = fonts
+        self.blocks = blocks
+        self.orthographies = orthographies
+
+    def divergent_blocks(self) -> list[str]:
+        """
+        Return the names of the blocks whose number of found codepoints is not the
+        same in all fonts.
+        """
+        return [name for name, _, found in self.blocks if len(set(found)) > 1]
+
+    def divergent_orthographies(self) -> list[str]:
+        """
+        Return the names of the orthographies whose support is not the same in all
+        fonts.
+        """
+        return [name for name, symbols in self.orthographies if len(set(symbols)) > 1]
+
+    def __repr__(self) -> str:
+        return (
+            f"<CoverageMatrix fonts={len(self.fonts)} "
+            f"blocks={len(self.blocks)} "
+            f"orthographies={len(self.orthographies)}>"
+        )
+
+
+def compute_coverage_matrix(
+    snapshots: list[FontSnapshot],
+    block_index: BlockIndex,
+    assigned: CodepointBitmap,
+    ortho: OrthographyDatabase | None = None,
+    token: CancellationToken | None = None,
+) -> CoverageMatrix:
+    """
+    Return the coverage matrix of the fonts. Only blocks that are used by any font
+    and orthographies that any font supports at least basically are included.
+
+    This doesn't touch the fonts, so it can run in a worker thread.
+
+    :param ortho: The orthography database. If None, no orthographies are
+        compared.
+    :param token: Checked after each font to stop when the job is cancelled.
+    """
+    block_counts: list[list[int]] = []
+    ortho_symbols: list[list[str]] = []
+    for snapshot in snapshots:
+        status = BlockCompleteness(block_index, assigned)
+        status.sync(snapshot)
+        block_counts.append(
+            [status.counts(block)[0] for block, _ in block_index.ranges]
+        )
+        if ortho is not None:
+            support = OrthographySupport(ortho.index, snapshot.codepoints)
+            ortho_symbols.append([support.symbol(o) for o in ortho.orthographies])
+        if token is not None:
+            token.check()
+
+    blocks = []
+    for i, (block, _) in enumerate(block_index.ranges):
+        found = [counts[i] for counts in block_counts]
+        if any(found):
+            blocks.append((block, len(block_index.assigned[block]), found))
+
+    orthographies = []
+    if ortho is not None:
+        for i, o in enumerate(ortho.orthographies):
+            symbols = [font_symbols[i] for font_symbols in ortho_symbols]
+            if any(symbol != "○" for symbol in symbols):
+                orthographies.append((o.name, symbols))
+        orthographies.sort()
+
+    return CoverageMatrix([s.name for s in snapshots], blocks, orthographies)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from familyCoverage import CoverageMatrix
+
+# Marks the rows in which the fonts differ
+DIVERGENT = "≠"
+
+
+def block_cell(found: int, total: int) -> str:
+    if not found:
+        symbol = "○"
+    elif found < total:
+        symbol = "◑"
+    else:
+        symbol = "●"
+    return f"{symbol} {found}"
+
+
+class FamilyCoverageWindow:
+    """
+    A table of the block and orthography support of several fonts. The rows in
+    which the fonts differ are marked and can be shown exclusively.
+    """
+
+    def __init__(self, matrix: CoverageMatrix) -> None:
+        from vanilla import CheckBox, List, Tabs, Window
+
+        self.matrix = matrix
+        font_columns = [
+            {"title": name, "key": f"font{i}", "width": 80}
+            for i, name in enumerate(matrix.fonts)
+        ]
+        width = min(1200, 260 + 80 * len(matrix.fonts))
+        self.w = Window(
+            (width, 480), "Unicode Coverage of Open Fonts", minSize=(320, 240)
+        )
+        self.w.only_divergent = CheckBox(
+            (10, 10, -10, 20),
+            "Show only differences",
+            callback=self.update_lists,
+            sizeStyle="small",
+        )
+        self.w.tabs = Tabs((10, 36, -10, -10), ["Blocks", "Orthographies"])
+        diff_column = {"title": "", "key": "diff", "width": 16}
+        self.w.tabs[0].list = List(
+            (0, 0, -0, -0),
+            [],
+            columnDescriptions=[
+                diff_column,
+                {"title": "Block", "key": "name", "width": 180},
+                {"title": "Total", "key": "total", "width": 50},
+            ]
+            + font_columns,
+        )
+        self.w.tabs[1].list = List(
+            (0, 0, -0, -0),
+            [],
+            columnDescriptions=[
+                diff_column,
+                {"title": "Orthography", "key": "name", "width": 230},
+            ]
+            + font_columns,
+        )
+        self.update_lists()
+        self.w.open()
+
+    def update_lists(self, sender=None) -> None:
+        only_divergent = bool(self.w.only_divergent.get())
+        block_rows = []
+        for name, total, found in self.matrix.blocks:
+            divergent = len(set(found)) > 1
+            if only_divergent and not divergent:
+                continue
+
+            row = {"diff": DIVERGENT if divergent else "", "name": name}
+            row["total"] = str(total)
+            for i, count in enumerate(found):
+                row[f"font{i}"] = block_cell(count, total)
+            block_rows.append(row)
+        self.w.tabs[0].list.set(block_rows)
+
+        ortho_rows = []
+        for name, symbols in self.matrix.orthographies:
+            divergent = len(set(symbols)) > 1
+            if only_divergent and not divergent:
+                continue
+
+            row = {"diff": DIVERGENT if divergent else "", "name": name}
+            for i, symbol in enumerate(symbols):
+                row[f"font{i}"] = symbol
+            ortho_rows.append(row)
+        self.w.tabs[1].list.set(ortho_rows)
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import copy
+import itertools
+from contextlib import contextmanager
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
+
+from codepointBitmap import CodepointBitmap
+
+if TYPE_CHECKING:
+    from GlyphsApp import GSFont, GSGlyph
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def exported_unicodes(glyph: GSGlyph) -> frozenset[int]:
+    """
+    Return the Unicode values of an exported glyph as frozenset of int.
+    """
+    if not glyph.export or not glyph.unicodes:
+        return frozenset()
+
+    # Glyphs stores Unicode values as hex string
+    return frozenset(int(u, 16) for u in glyph.unicodes)
+
+
+def split_suffix(name: str) -> tuple[str, str | None]:
+    """
+    Split a glyph name into base name and suffix. The suffix is None if the name
+    has no suffix.
+    """
+    if "." in name[1:]:
+        base, suffix = name.split(".", 1)
+        return base, suffix
+    return name, None
+
+
+# Serial numbers that tell indexes apart, unlike ids, which are reused after an
+# object has been garbage-collected
+_serials = itertools.count(1)
+
+
+def next_serial() -> int:
+    return next(_serials)
+
+
+# Marks glyphs without a change time
+_NO_CHANGE_TIME = object()
+
+
+def change_token(font: GSFont) -> tuple | None:
+    """
+    Return a value that changes whenever glyphs are added to, removed from or
+    modified in the font: the number of glyphs and the latest change time of its
+    glyphs. Return None if the glyphs have no change time, so changes of the font
+    can't be detected.
+    """
+    last_change = None
+    for glyph in font.glyphs:
+        changed = getattr(glyph, "lastChange", _NO_CHANGE_TIME)
+        if changed is _NO_CHANGE_TIME:
+            return None
+        if changed is not None and (last_change is None or changed > last_change):
+            last_change = changed
+    return len(font.glyphs), last_change
+
+
+class FontIndex:
+    """
+    A persistent index of a font's glyph names and the codepoints of its exported
+    glyphs.
+
+    The index is built once per font. It is rebuilt when the font has changed since,
+    unless the only change was made to the current glyph, or when it is invalidated
+    explicitly, e.g. after Unicode values have been reassigned. Changes of the
+    current glyph and glyphs added by the plugin are applied incrementally.
+    """
+
+    def __init__(self, font: GSFont) -> None:
+        self.font = font
+        self.serial = next_serial()
+        self.version = 0
+        # The check round in which the font was last checked for changes
+        self.checked_round = 0
+        self._bitmap: tuple[int, CodepointBitmap] | None = None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Scan all glyphs of the font.
+        """
+        self.cmap: dict[int, str] = {}
+        self.glyph_unicodes: dict[str, frozenset[int]] = {}
+        self.names: dict[str, None] = {}
+        # Base glyph name -> glyph names with suffix
+        self.variants: dict[str, list[str]] = {}
+        # Suffix -> base glyph names
+        self.suffixes: dict[str, list[str]] = {}
+        # Glyph name -> codepoint of the name in the font's glyph data, filled on
+        # demand
+        self.name_unicodes: dict[str, int | None] = {}
+        for glyph in self.font.glyphs:
+            self._add(glyph)
+        self.change_token = change_token(self.font)
+        self.version += 1
+
+    def _add(self, glyph: GSGlyph) -> None:
+        name = glyph.name
+        self.names[name] = None
+        self.name_unicodes.pop(name, None)
+        unicodes = exported_unicodes(glyph)
+        if unicodes:
+            self.glyph_unicodes[name] = unicodes
+            for u in unicodes:
+                self.cmap.setdefault(u, name)
+        base, suffix = split_suffix(name)
+        if suffix is None:
+            self.variants.setdefault(name, [])
+        else:
+            self.variants.setdefault(base, []).append(name)
+            self.suffixes.setdefault(suffix, []).append(base)
+
+    @property
+    def codepoints(self):
+        """
+        Return the codepoints of the font as a set-like view.
+        """
+        return self.cmap.keys()
+
+    def bitmap(self) -> CodepointBitmap:
+        """
+        Return the codepoints of the font as bitmap, built once per index version.
+        """
+        if self._bitmap is None or self._bitmap[0] != self.version:
+            self._bitmap = (self.version, CodepointBitmap.from_codepoints(self.cmap))
+        return self._bitmap[1]
+
+    def snapshot(self) -> FontIndex:
+        """
+        Return a copy of the index that is detached from the font, for code that
+        runs in a worker thread while the index is updated on the main thread.
+        """
+        index = copy.copy(self)
+        index.font = None
+        index.cmap = dict(self.cmap)
+        index.glyph_unicodes = dict(self.glyph_unicodes)
+        index.names = dict(self.names)
+        index.variants = {base: list(names) for base, names in self.variants.items()}
+        index.suffixes = {
+            suffix: list(bases) for suffix, bases in self.suffixes.items()
+        }
+        index.name_unicodes = dict(self.name_unicodes)
+        return index
+
+    def is_current(self) -> bool:
+        """
+        Check whether the font has changed since the index was updated, reading only
+        the change time of each glyph. An index of a font whose changes can't be
+        detected is never current.
+        """
+        token = change_token(self.font)
+        return token is not None and token == self.change_token
+
+    def sync_glyph(self, glyph: GSGlyph) -> bool:
+        """
+        Bring the index up to date if the font's last change was made to the glyph,
+        e.g. while it is being edited, and the number of glyphs is unchanged. Return
+        False if other glyphs may have changed, so the index must be rebuilt.
+        """
+        token = change_token(self.font)
+        if (
+            token is None
+            or token[1] is None
+            or self.change_token is None
+            or token[0] != self.change_token[0]
+            or getattr(glyph, "lastChange", None) != token[1]
+        ):
+            return False
+
+        self.update_glyph(glyph)
+        self.change_token = token
+        return True
+
+    def add_glyphs(self, glyphs: Iterable[GSGlyph]) -> None:
+        """
+        Add glyphs that have just been added to the font.
+        """
+        for glyph in glyphs:
+            self._add(glyph)
+        self.change_token = change_token(self.font)
+        self.version += 1
+
+    def update_glyph(self, glyph: GSGlyph) -> bool:
+        """
+        Update the index for a single glyph whose Unicode values or export status
+        may have changed. Return True if the index was modified.
+        """
+        name = glyph.name
+        if name not in self.names:
+            # The glyph has been renamed, and we don't know its old name
+            self.rebuild()
+            return True
+
+        old = self.glyph_unicodes.get(name, frozenset())
+        new = exported_unicodes(glyph)
+        if old == new:
+            return False
+
+        for u in old - new:
+            if self.cmap.get(u) == name:
+                del self.cmap[u]
+        for u in new - old:
+            self.cmap.setdefault(u, name)
+        if new:
+            self.glyph_unicodes[name] = new
+        else:
+            self.glyph_unicodes.pop(name, None)
+        self.version += 1
+        return True
+
+
+class IndexedFont:
+    """
+    A snapshot of a font's index taken on the main thread, for code that runs in a
+    worker thread and must not access the font or its live index. It provides the
+    attributes of the font that the glyph list functions need.
+    """
+
+    def __init__(self, font: GSFont) -> None:
+        self.index = get_font_index(font).snapshot()
+        self.disablesNiceNames = font.disablesNiceNames
+
+
+_indexes: dict[int, FontIndex] = {}
+
+# Numbers the check rounds, 0 while no round is active
+_rounds = itertools.count(1)
+_round = 0
+
+
+@contextmanager
+def check_fonts_once() -> Iterator[None]:
+    """
+    Check each font for changes only once inside the block, e.g. during one
+    interface callback, in which the user can't change the fonts. Checking a font
+    reads every glyph, so repeated checks would be expensive. Changes made through
+    the index and invalidated indexes are still taken into account. Rounds can be
+    nested, the outermost one counts.
+    """
+    global _round
+    if _round:
+        yield
+        return
+
+    _round = next(_rounds)
+    try:
+        yield
+    finally:
+        _round = 0
+
+
+def checks_fonts_once(func: F) -> F:
+    """
+    Decorate a function to run it in a check round, see `check_fonts_once`.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with check_fonts_once():
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+def get_font_index(
+    font: GSFont | IndexedFont, current_glyph: GSGlyph | None = None
+) -> FontIndex:
+    """
+    Return the up-to-date index for a font, building it if needed.
+
+    :param current_glyph: The glyph of the font that is being edited. If the font's
+        last change was made to it, only the glyph is updated in the index.
+    """
+    if isinstance(font, IndexedFont):
+        return font.index
+
+    index = _indexes.get(id(font))
+    if index is None or index.font is not font:
+        index = FontIndex(font)
+        _indexes[id(font)] = index
+    elif (not _round or index.checked_round != _round) and not index.is_current():
+        if current_glyph is None or not index.sync_glyph(current_glyph):
+            index.rebuild()
+    elif current_glyph is not None:
+        # Cheap, and catches edits that have not updated the glyph's change time
+        # yet
+        index.update_glyph(current_glyph)
+    index.checked_round = _round
+    return index
+
+
+def invalidate_font_index(font: GSFont) -> None:
+    """
+    Force a rebuild of the font's index on next access.
+    """
+    index = _indexes.get(id(font))
+    if index is not None:
+        index.change_token = None
+        index.checked_round = 0
+
+
+def clear_font_indexes() -> None:
+    """
+    Drop all cached indexes, e.g. when the window is closed.
+    """
+    _indexes.clear()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from jkUnicode.aglfn import getGlyphnameForUnicode, getUnicodeForGlyphname
+
+if TYPE_CHECKING:
+    from standInFont import GlyphProtocol
+    from tableCache import Table
+
+
+def fallback_name(value: int) -> str:
+    """
+    Return a uniXXXX or uXXXXX glyph name for a codepoint.
+    """
+    if value <= 0xFFFF:
+        return f"uni{value:04X}"
+    return f"u{value:05X}"
+
+
+# Marks names that are not in the cache
+_MISSING = object()
+
+
+def _no_nice_name(value: int) -> None:
+    return None
+
+
+def _no_nice_unicode(name: str) -> None:
+    return None
+
+
+class GlyphNameResolver:
+    """
+    A memoized lookup between codepoints and glyph names in both directions.
+
+    Results are cached in bounded LRUs keyed on the codepoint or glyph name, the
+    naming mode (nice names or AGLFN names) and the version of the glyph data that
+    was used to look up nice names. The caches are protected by a lock, so the
+    resolver can be used from several threads; the lookup functions themselves are
+    called outside of the lock.
+
+    `dirty` is set when a nice name lookup is added to the caches and reset by
+    `to_tables`, so the caller knows when the tables need to be saved again.
+
+    :param glyph_unicode_func: Returns the nice name codepoint of a glyph of a font,
+        e.g. from the font's own glyph data. Its results are not cached here, as
+        they depend on the font. If None, the glyph name is looked up with
+        nice_unicode_func.
+    """
+
+    def __init__(
+        self,
+        nice_name_func: Callable[[int], str | None],
+        nice_unicode_func: Callable[[str], int | None],
+        data_version: str = "",
+        maxsize: int = 0x10000,
+        glyph_unicode_func: Callable[[GlyphProtocol], int | None] | None = None,
+    ) -> None:
+        self.nice_name_func = nice_name_func
+        self.nice_unicode_func = nice_unicode_func
+        self.glyph_unicode_func = glyph_unicode_func
+        self.data_version = data_version
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple[int, bool, str], str | None] = OrderedDict()
+        self._reverse_cache: OrderedDict[tuple[str, bool, str], int | None] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+        self.dirty = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._reverse_cache.clear()
+
+    def to_tables(self) -> dict[str, Table]:
+        """
+        Return the nice name lookups for the current data version as tables for
+        the cache, and reset `dirty`.
+        """
+        with self._lock:
+            cache_items = list(self._cache.items())
+            reverse_cache_items = list(self._reverse_cache.items())
+            self.dirty = False
+        codepoints = array("I")
+        names = []
+        for (value, nice_names, version), name in cache_items:
+            if nice_names and version == self.data_version and name is not None:
+                codepoints.append(value)
+                names.append(name)
+        reverse_names = []
+        # -1 for names without codepoint
+        reverse_codepoints = array("i")
+        for (name, nice_names, version), u in reverse_cache_items:
+            if nice_names and version == self.data_version:
+                reverse_names.append(name)
+                reverse_codepoints.append(-1 if u is None else u)
+        return {
+            "codepoints": codepoints,
+            "names": names,
+            "reverse_names": reverse_names,
+            "reverse_codepoints": reverse_codepoints,
+        }
+
+    def load_tables(self, tables: dict[str, Table]) -> None:
+        """
+        Add nice name lookups from tables made by `to_tables` to the caches.
+        """
+        version = self.data_version
+        with self._lock:
+            cache = self._cache
+            for value, name in zip(tables["codepoints"], tables["names"]):
+                cache[(value, True, version)] = name
+            reverse_cache = self._reverse_cache
+            for name, u in zip(tables["reverse_names"], tables["reverse_codepoints"]):
+                reverse_cache[(name, True, version)] = None if u < 0 else u
+            for c in (cache, reverse_cache):
+                while len(c) > self.maxsize:
+                    c.popitem(last=False)
+
+    def _lookup(self, value: int, nice_names: bool) -> str | None:
+        if nice_names:
+            name = self.nice_name_func(value)
+            if name is None:
+                # Something went wrong, e.g. PUA
+                name = fallback_name(value)
+            return name
+
+        return getGlyphnameForUnicode(value)
+
+    def name_for_codepoint(self, value: int, nice_names: bool = True) -> str | None:
+        """
+        Return the glyph name for a codepoint.
+        """
+        key = (value, nice_names, self.data_version)
+        cache = self._cache
+        with self._lock:
+            try:
+                cache.move_to_end(key)
+                return cache[key]
+            except KeyError:
+                pass
+
+        name = self._lookup(value, nice_names)
+        with self._lock:
+            cache[key] = name
+            self.dirty |= nice_names
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        return name
+
+    def uncached(self, values: Iterable[int], nice_names: bool = True) -> list[int]:
+        """
+        Return the codepoints whose names are not in the cache.
+        """
+        version = self.data_version
+        with self._lock:
+            cache = self._cache
+            return [
+                value for value in values if (value, nice_names, version) not in cache
+            ]
+
+    def snapshot(
+        self, values: Iterable[int], nice_names: bool = True
+    ) -> GlyphNameResolver:
+        """
+        Look up the names of the codepoints and return a new resolver that knows
+        them without calling the nice name functions, e.g. for a worker thread that
+        must not call into Glyphs. Other codepoints get uniXXXX names in nice names
+        mode.
+        """
+        version = self.data_version
+        keys = [(value, nice_names, version) for value in values]
+        # Copy the cached names in one go, without reordering the LRU
+        with self._lock:
+            get = self._cache.get
+            names = {key: get(key, _MISSING) for key in keys}
+        for key, name in names.items():
+            if name is _MISSING:
+                names[key] = self.name_for_codepoint(key[0], nice_names)
+        resolver = GlyphNameResolver(
+            _no_nice_name, _no_nice_unicode, version, max(self.maxsize, len(names))
+        )
+        resolver._cache.update(names)
+        return resolver
+
+    def codepoint_for_name(self, name: str, nice_names: bool = True) -> int | None:
+        """
+        Return the codepoint for a glyph name.
+        """
+        key = (name, nice_names, self.data_version)
+        cache = self._reverse_cache
+        with self._lock:
+            try:
+                cache.move_to_end(key)
+                return cache[key]
+            except KeyError:
+                pass
+
+        if nice_names:
+            u = self.nice_unicode_func(name)
+        else:
+            u = getUnicodeForGlyphname(name)
+        with self._lock:
+            cache[key] = u
+            self.dirty |= nice_names
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        return u
+
+    def codepoint_for_glyph(
+        self, glyph: GlyphProtocol, nice_names: bool = True
+    ) -> int | None:
+        """
+        Return the codepoint for the name of a glyph in a font.
+        """
+        if nice_names and self.glyph_unicode_func is not None:
+            return self.glyph_unicode_func(glyph)
+        return self.codepoint_for_name(glyph.name, nice_names)
+
+    def codepoints_for_names(
+        self, names: Iterable[str], nice_names: bool = True
+    ) -> dict[str, int | None]:
+        """
+        Return a map of glyph names to codepoints for a sequence of glyph names in
+        one pass.
+        """
+        codepoint_for_name = self.codepoint_for_name
+        return {name: codepoint_for_name(name, nice_names) for name in names}
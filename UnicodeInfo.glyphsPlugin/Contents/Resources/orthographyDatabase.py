@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from threading import Lock, RLock
+from typing import Any, Callable, TypeVar
+
+from jkUnicode import UniInfo
+from jkUnicode.orthography import OrthographyInfo
+from orthographyIndex import OrthographyIndex
+
+T = TypeVar("T")
+
+# The codepoint sets of an orthography
+UNICODE_SETS = (
+    "unicodes_base",
+    "unicodes_optional",
+    "unicodes_punctuation",
+    "unicodes_base_punctuation",
+    "unicodes_any",
+)
+
+
+class OrthographyDatabase:
+    """
+    The static data of an orthography source, shared by all windows, engines and
+    fonts of the process.
+
+    The codepoint sets of the orthographies are frozen, and equal sets are stored
+    once. The cmap of the OrthographyInfo object is never set: the support of the
+    orthographies by a font is tracked separately by `OrthographySupport` objects,
+    so the orthographies must be treated as read-only.
+
+    :param source: The name of the source, "Hyperglot" or "CLDR".
+    :param info: The loaded orthography info for the source.
+    """
+
+    def __init__(self, source: str, info: OrthographyInfo) -> None:
+        self.source = source
+        self.source_display_name = info.source_display_name
+        interned: dict[frozenset[int], frozenset[int]] = {}
+        for o in info.orthographies:
+            for name in UNICODE_SETS:
+                unicodes = frozenset(getattr(o, name))
+                setattr(o, name, interned.setdefault(unicodes, unicodes))
+        self.orthographies: tuple = tuple(info.orthographies)
+        self.index = OrthographyIndex(self.orthographies)
+        self._shared: dict[str, Any] = {}
+        self._lock = RLock()
+
+    def shared(self, key: str, factory: Callable[[OrthographyDatabase], T]) -> T:
+        """
+        Return data derived from the database, building it with the factory on
+        first use. The data is shared by all users and must not be modified. The
+        factory may get other shared data of the database.
+        """
+        with self._lock:
+            value = self._shared.get(key)
+            if value is None:
+                value = self._shared[key] = factory(self)
+        return value
+
+    def __repr__(self) -> str:
+        return (
+            f"<OrthographyDatabase {self.source} "
+            f"orthographies={len(self.orthographies)}>"
+        )
+
+
+_databases: dict[str, OrthographyDatabase] = {}
+_databases_lock = Lock()
+
+
+def get_orthography_database(source: str) -> OrthographyDatabase:
+    """
+    Return the shared database for a source, loading it on first use.
+    """
+    with _databases_lock:
+        database = _databases.get(source)
+        if database is None:
+            # The UniInfo object is modified while the orthographies are loaded
+            database = OrthographyDatabase(
+                source, OrthographyInfo(ui=UniInfo(0), source=source)
+            )
+            _databases[source] = database
+    return database
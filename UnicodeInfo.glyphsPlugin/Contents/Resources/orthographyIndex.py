@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from jkUnicode.orthography import Orthography
+    from orthographyDatabase import OrthographyDatabase
+
+# Roles of a codepoint in an orthography
+BASE = 0
+PUNCTUATION = 1
+OPTIONAL = 2
+
+
+class OrthographyIndex:
+    """
+    An inverted index from codepoints to the orthographies that use them.
+
+    Each codepoint maps to a tuple of (orthography index, role) tuples, in the order
+    of the orthographies. The index only depends on the orthography data, so it can
+    be shared by all fonts; the support of the orthographies by a font is tracked
+    by an `OrthographySupport` object.
+
+    :param orthographies: The orthographies of a database.
+    """
+
+    def __init__(self, orthographies: Sequence[Orthography]) -> None:
+        self.orthographies = orthographies
+        self.positions = {id(o): i for i, o in enumerate(orthographies)}
+        entries: dict[int, list[tuple[int, int]]] = {}
+        for i, o in enumerate(orthographies):
+            for role, unicodes in (
+                (BASE, o.unicodes_base),
+                (PUNCTUATION, o.unicodes_punctuation - o.unicodes_base),
+                (OPTIONAL, o.unicodes_optional - o.unicodes_base_punctuation),
+            ):
+                # The same tuple object is shared by all codepoints of the role
+                entry = (i, role)
+                for u in unicodes:
+                    entries.setdefault(u, []).append(entry)
+        self.entries: dict[int, tuple[tuple[int, int], ...]] = {
+            u: tuple(e) for u, e in entries.items()
+        }
+
+    def position(self, orthography: Orthography) -> int:
+        """
+        Return the index of an orthography in the database.
+        """
+        return self.positions[id(orthography)]
+
+    def orthographies_for_unicode(
+        self, u: int | None, include_optional=False
+    ) -> list[Orthography]:
+        """
+        Return the orthographies that use the codepoint as base or punctuation
+        character, or in any role if include_optional is True.
+        """
+        orthographies = self.orthographies
+        return [
+            orthographies[i]
+            for i, role in self.entries.get(u, ())
+            if include_optional or role != OPTIONAL
+        ]
+
+    def selection_counts(
+        self, codepoints: Iterable[int], include_optional=False
+    ) -> dict[int, int]:
+        """
+        Return a map of the indices of the orthographies that use any of the
+        codepoints to the number of their base characters among the codepoints.
+        """
+        counts: dict[int, int] = {}
+        entries = self.entries
+        for u in codepoints:
+            for i, role in entries.get(u, ()):
+                if role == BASE:
+                    counts[i] = counts.get(i, 0) + 1
+                elif include_optional or role != OPTIONAL:
+                    counts.setdefault(i, 0)
+        return counts
+
+
+class OrthographyMasks:
+    """
+    The base and punctuation characters of each orthography as an integer bitset
+    over all base and punctuation characters of the database, so the missing
+    characters of many orthographies can be computed with a few integer
+    operations. The masks only depend on the orthography data; get them from
+    `OrthographyDatabase.shared` so they are built once per process.
+
+    :param ortho: The orthography database.
+    """
+
+    def __init__(self, ortho: OrthographyDatabase) -> None:
+        self.universe: list[int] = sorted(
+            {u for o in ortho.orthographies for u in o.unicodes_base_punctuation}
+        )
+        # The bit number of each codepoint. The bit values themselves would take
+        # quadratic memory.
+        self.positions = {u: i for i, u in enumerate(self.universe)}
+        self.basic = [
+            self.mask_for_codepoints(o.unicodes_base_punctuation)
+            for o in ortho.orthographies
+        ]
+
+    def mask_for_codepoints(self, codepoints: Iterable[int]) -> int:
+        positions = self.positions
+        mask = 0
+        for u in codepoints:
+            i = positions.get(u)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def codepoints_for_mask(self, mask: int) -> list[int]:
+        universe = self.universe
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(universe[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+
+class OrthographySupport:
+    """
+    The support of the orthographies of an index by one font: the numbers of
+    missing base, punctuation and optional characters of each orthography, like
+    `Orthography.scan_cmap` computes them, but without modifying the shared
+    orthographies.
+
+    When the codepoints change, only the orthographies that use added or removed
+    codepoints are updated. The number of speakers supported by a codepoint is
+    cached until the codepoints change.
+
+    :param index: The orthography index.
+    :param codepoints: The codepoints of the font.
+    """
+
+    # Above this number of changed codepoints, a full rescan is faster
+    max_delta = 256
+
+    def __init__(self, index: OrthographyIndex, codepoints: Iterable[int] = ()):
+        self.index = index
+        orthographies = index.orthographies
+        self.missing_base = array("I", [len(o.unicodes_base) for o in orthographies])
+        self.missing_punctuation = array(
+            "I", [len(o.unicodes_punctuation) for o in orthographies]
+        )
+        self.missing_optional = array(
+            "I", [len(o.unicodes_optional) for o in orthographies]
+        )
+        self.codepoints: frozenset[int] = frozenset()
+        self._speakers: dict[int, int] = {}
+        self.set_codepoints(codepoints)
+
+    def set_codepoints(self, codepoints: Iterable[int]) -> None:
+        """
+        Update the support for a new set of codepoints of the font.
+        """
+        codepoints = frozenset(codepoints)
+        added = codepoints - self.codepoints
+        removed = self.codepoints - codepoints
+        if not added and not removed:
+            return
+
+        if len(added) + len(removed) > self.max_delta:
+            self._scan(codepoints)
+        else:
+            self._apply(added, -1)
+            self._apply(removed, 1)
+        self.codepoints = codepoints
+        self._speakers.clear()
+
+    def _scan(self, codepoints: frozenset[int]) -> None:
+        for i, o in enumerate(self.index.orthographies):
+            self.missing_base[i] = len(o.unicodes_base - codepoints)
+            self.missing_punctuation[i] = len(o.unicodes_punctuation - codepoints)
+            self.missing_optional[i] = len(o.unicodes_optional - codepoints)
+
+    def _apply(self, codepoints: Iterable[int], delta: int) -> None:
+        orthographies = self.index.orthographies
+        entries = self.index.entries
+        for u in codepoints:
+            for i, _ in entries.get(u, ()):
+                o = orthographies[i]
+                if u in o.unicodes_base:
+                    self.missing_base[i] += delta
+                if u in o.unicodes_punctuation:
+                    self.missing_punctuation[i] += delta
+                if u in o.unicodes_optional:
+                    self.missing_optional[i] += delta
+
+    # Support of single orthographies
+
+    def support_basic(self, orthography: Orthography) -> bool:
+        i = self.index.position(orthography)
+        return self.missing_base[i] == 0 and self.missing_punctuation[i] == 0
+
+    def support_full(self, orthography: Orthography) -> bool:
+        i = self.index.position(orthography)
+        return (
+            self.missing_base[i] == 0
+            and self.missing_punctuation[i] == 0
+            and self.missing_optional[i] == 0
+        )
+
+    def symbol(self, orthography: Orthography) -> str:
+        """
+        Return the support indicator of an orthography.
+        """
+        if self.support_full(orthography):
+            return "●"
+        if self.support_basic(orthography):
+            return "◑"
+        return "○"
+
+    # Speakers
+
+    def speakers_supported_by_unicode(self, u: int | None) -> int:
+        """
+        Return the number of speakers of all orthographies with basic support that
+        use the codepoint, i.e. how many fewer speakers the font would support if
+        the character was removed.
+        """
+        try:
+            return self._speakers[u]
+        except KeyError:
+            pass
+
+        orthographies = self.index.orthographies
+        speakers = 0
+        for i, _ in self.index.entries.get(u, ()):
+            if self.missing_base[i] == 0:
+                speakers += orthographies[i].speakers
+        self._speakers[u] = speakers
+        return speakers
+
+    def speakers_by_codepoint(self, codepoints: Iterable[int]) -> dict[int, int]:
+        """
+        Return the number of speakers supported by each of the codepoints, like
+        `speakers_supported_by_unicode`, in one pass.
+        """
+        # The speakers of each orthography if it has basic support, else 0
+        supported = [
+            o.speakers if missing == 0 else 0
+            for o, missing in zip(self.index.orthographies, self.missing_base)
+        ]
+        entries = self.index.entries
+        result = {}
+        for u in codepoints:
+            result[u] = sum(supported[i] for i, _ in entries.get(u, ()))
+        self._speakers.update(result)
+        return result
+
+    def speakers_supported_by_codepoints(self, codepoints: Iterable[int]) -> int:
+        """
+        Return the number of speakers of all orthographies with basic support that
+        use any of the codepoints. Each orthography is counted once.
+        """
+        entries = self.index.entries
+        indices = {i for u in codepoints for i, _ in entries.get(u, ())}
+        orthographies = self.index.orthographies
+        return sum(
+            orthographies[i].speakers for i in indices if self.missing_base[i] == 0
+        )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from orthographyDatabase import OrthographyDatabase, get_orthography_database
+
+SOURCES = ("Hyperglot", "CLDR")
+
+
+class OrthographyLoader:
+    """
+    Load orthography databases in a background thread.
+
+    :param dispatch: A function that runs a callable on the main thread, e.g.
+        `PyObjCTools.AppHelper.callAfter`. Completion callbacks are passed through
+        it. By default, they are called directly from the worker thread.
+    :param load_func: The function that loads the database for a source. By
+        default, the databases are shared by all loaders of the process.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Callable[[], Any]], Any] | None = None,
+        load_func: Callable[[str], OrthographyDatabase] = get_orthography_database,
+    ) -> None:
+        self.dispatch = dispatch
+        self.load_func = load_func
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="OrthographyLoader"
+        )
+        self._futures: dict[str, Future] = {}
+        # Loading times in seconds
+        self.timings: dict[str, float] = {}
+
+    def _load(self, source: str) -> OrthographyDatabase:
+        start = time.perf_counter()
+        result = self.load_func(source)
+        self.timings[source] = time.perf_counter() - start
+        return result
+
+    def load(
+        self,
+        source: str,
+        callback: Callable[[str, OrthographyDatabase], Any] | None = None,
+        on_error: Callable[[str, BaseException], Any] | None = None,
+    ) -> Future:
+        """
+        Start loading the database for a source, if it isn't loading already or
+        has failed before. The optional callback is called with the source and the
+        loaded database, on_error with the source and the exception if loading
+        fails.
+        """
+        future = self._futures.get(source)
+        if future is None or self.error(source) is not None:
+            future = self._executor.submit(self._load, source)
+            self._futures[source] = future
+
+        def deliver(func: Callable[..., Any], value: Any) -> None:
+            if self.dispatch is None:
+                func(source, value)
+            else:
+                self.dispatch(lambda: func(source, value))
+
+        def done(f: Future) -> None:
+            if f.cancelled():
+                return
+            e = f.exception()
+            if e is None:
+                if callback is not None:
+                    deliver(callback, f.result())
+            elif on_error is not None:
+                deliver(on_error, e)
+
+        if callback is not None or on_error is not None:
+            future.add_done_callback(done)
+        return future
+
+    def get(self, source: str) -> OrthographyDatabase | None:
+        """
+        Return the database for a source if it has been loaded, or None if it is
+        still loading or loading has failed.
+        """
+        future = self._futures.get(source)
+        if future is None or not future.done() or self.error(source) is not None:
+            return None
+        return future.result()
+
+    def error(self, source: str) -> BaseException | None:
+        """
+        Return the exception if loading the database for a source has failed.
+        """
+        future = self._futures.get(source)
+        if future is None or not future.done() or future.cancelled():
+            return None
+        return future.exception()
+
+    def wait(self, source: str) -> OrthographyDatabase:
+        """
+        Return the database for a source, waiting for it to be loaded.
+        """
+        return self.load(source).result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
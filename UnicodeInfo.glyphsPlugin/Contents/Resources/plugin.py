@@ -1,32 +1,35 @@
 from __future__ import annotations
 
+import importlib.util
+import os
 import urllib.parse
 import webbrowser
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generator, Iterable, Iterator, Sequence
 
 import objc
-from AppKit import NSMenuItem
+from AppKit import NSEvent, NSEventModifierFlagOption, NSMenuItem
+from fontIndex import (
+    IndexedFont,
+    checks_fonts_once,
+    clear_font_indexes,
+    get_font_index,
+    split_suffix,
+)
 from GlyphsApp import UPDATEINTERFACE, WINDOW_MENU, Glyphs, GSGlyph
 from GlyphsApp.plugins import GeneralPlugin
+from profiling import PROFILING_KEY, profiler, profiling_requested, timed
+from PyObjCTools.AppHelper import callAfter, callLater
 from unicodeInfoWindow import UnicodeInfoWindow
+from updateScheduler import UpdateScheduler
 
-hasModule = False
-try:
-    from jkUnicode import UniInfo, get_expanded_glyph_list
-    from jkUnicode.aglfn import getGlyphnameForUnicode, getUnicodeForGlyphname
-    from jkUnicode.orthography import OrthographyInfo
-    from jkUnicode.uniBlock import get_block, get_codepoints, uniNameToBlock
-    from jkUnicode.uniName import uniName
-
-    hasModule = True
-except (ImportError, ModuleNotFoundError):
-    import traceback
-
+# Only check whether jkUnicode is installed. The data tables are loaded when the
+# window is opened for the first time.
+hasModule = importlib.util.find_spec("jkUnicode") is not None
+if not hasModule:
     print(
         "The jkUnicode module is missing. "
         "Please try to reinstall UnicodeInfo via the Plugin Manager."
     )
-    print(traceback.format_exc())
 
 
 def showMissingModule():
@@ -42,28 +45,55 @@ def showMissingModule():
 
 
 if TYPE_CHECKING:
+    from backgroundJob import CancellationToken
+    from familyCoverage import CoverageMatrix
     from GlyphsApp import GSFont, GSGlyph
     from jkUnicode.orthography import Orthography
+    from orthographyDatabase import OrthographyDatabase
+    from unicodeInfoEngine import InsertionPlan, UnicodeInfoEngine
 
 
-def add_glyphs_to_font(glyph_names, font: GSFont) -> None:
-    existing = set(font.glyphs.keys())
-    glyph_list = [
-        n for n in glyph_names if n not in existing and not n.startswith("**")
-    ]
-    font.disableUpdateInterface()
-    glyphs = [GSGlyph(n) for n in glyph_list]
-    font.glyphs.extend(glyphs)
-    font.enableUpdateInterface()
-    set_selection(font, glyph_list, deselect=True)
+# Minimum time between two panel updates in seconds, can be overridden in the
+# defaults
+UPDATE_INTERVAL_KEY = "de.kutilek.unicodeinfo.updateInterval"
+UPDATE_INTERVAL = 1 / 60
+
+# The number of callbacks to capture with cProfile, can be overridden in the
+# defaults
+PROFILE_CALLBACKS_KEY = "de.kutilek.unicodeinfo.profileCallbacks"
+PROFILE_CALLBACKS = 10
+
+# Seconds before the progress indicator is shown for a glyph list computation
+PROGRESS_DELAY = 0.2
+
+# The number of glyph names that are looked up on the main thread in one go before
+# a glyph list computation
+NAME_BATCH_SIZE = 256
 
+# Seconds after an update or a glyph list before new nice names are saved to the
+# cache, so they are kept if Glyphs quits while the window is open
+NAMES_CACHE_SAVE_DELAY = 10.0
 
-def set_filter(font=None, glyph_names=None) -> None:
+
+def add_glyphs_to_font(
+    glyph_names, font: GSFont, engine: UnicodeInfoEngine, dry_run=False
+) -> InsertionPlan:
+    plan = engine.plan_glyph_insertion(glyph_names, font)
+    if dry_run:
+        # Only the dry run reports to the Macro panel
+        print(plan)
+        if plan.names:
+            print("Would add:", " ".join(plan.names))
+    else:
+        engine.insert_glyphs(plan, font, GSGlyph)
+    return plan
+
+
+def set_filter(font=None, glyph_names: Iterable[str] | None = None) -> None:
     if font is None:
         return
 
-    if glyph_names is None:
-        glyph_names = []
+    glyph_names = [] if glyph_names is None else list(glyph_names)
     # https://forum.glyphsapp.com/t/create-list-filter-via-script/2134/7
     GSSortDescriptorNameList = objc.lookUpClass("GSSortDescriptorNameList")
     glyphsArrayController = font.fontView.glyphsArrayController()
@@ -77,15 +107,53 @@ def set_filter(font=None, glyph_names=None) -> None:
 
 
 def set_selection(font, glyph_names: list[str], deselect=False) -> None:
+    glyphs = [font.glyphs[g] for g in glyph_names]
+    if not deselect:
+        glyphs = list(font.selection) + glyphs
     font.disableUpdateInterface()
-    if deselect:
-        for g in font.glyphs:
-            g.selected = False
-    for g in glyph_names:
-        font.glyphs[g].selected = True
+    font.selection = glyphs
     font.enableUpdateInterface()
 
 
+def option_key_down() -> bool:
+    return bool(NSEvent.modifierFlags() & NSEventModifierFlagOption)
+
+
+def glyphs_nice_name(value: int) -> str | None:
+    info = Glyphs.glyphInfoForUnicode("%04X" % value)
+    if info is None:
+        return None
+    return info.name
+
+
+def glyphs_unicode_for_name(name: str) -> int | None:
+    info = Glyphs.glyphInfoForName(name)
+    if info is None or info.unicode is None:
+        return None
+    return int(info.unicode, 16)
+
+
+def glyphs_unicode_for_glyph(glyph: GSGlyph) -> int | None:
+    # The glyph info of a glyph takes the custom glyph data of its font into account
+    info = glyph.glyphInfo
+    if info is None or info.unicode is None:
+        return None
+    return int(info.unicode, 16)
+
+
+def glyph_data_size(glyph) -> int:
+    """
+    Return a rough estimate of a glyph's share of the file size: the number of
+    nodes and components in all its layers.
+    """
+    size = 0
+    for layer in glyph.layers:
+        for path in layer.paths:
+            size += len(path.nodes)
+        size += len(layer.components)
+    return size
+
+
 def speakers_as_string(speakers) -> str:
     if speakers == 0:
         return ""
@@ -98,6 +166,22 @@ def speakers_as_string(speakers) -> str:
         return "{:,}\u00a0speakers".format(speakers)
 
 
+def font_display_names(fonts) -> list[str]:
+    """
+    Return a distinct name for each font, the file name if it has been saved.
+    """
+    names = []
+    for font in fonts:
+        if font.filepath:
+            name = os.path.splitext(os.path.basename(font.filepath))[0]
+        else:
+            name = font.familyName
+        if name in names:
+            name = f"{name} ({len(names) + 1})"
+        names.append(name)
+    return names
+
+
 class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
     @objc.python_method
     def settings(self) -> None:
@@ -109,32 +193,90 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
             showMissingModule()
             return
 
+        try:
+            from backgroundJob import JobRunner
+            from blockIndex import data_version
+            from glyphNames import GlyphNameResolver
+            from jkUnicode import UniInfo
+            from orthographyLoader import SOURCES, OrthographyLoader
+            from tableCache import TableCache
+            from unicodeInfoEngine import UnicodeInfoEngine
+        except ImportError:
+            import traceback
+
+            print(traceback.format_exc())
+            showMissingModule()
+            return
+
         self.glyph = None
         self.glyph_name = None
         self.filtered = False
         self.in_font_view = False
-        self.info = UniInfo(0)
+        if getattr(self, "info", None) is None:
+            self.info = UniInfo(0)
         self.unicode: int | None = None
-        self.ortho_cdlr = OrthographyInfo(ui=self.info, source="CLDR")
-        self.ortho_hyperglot = OrthographyInfo(ui=self.info, source="Hyperglot")
-        self.ortho = self.ortho_hyperglot
+        # The orthography databases are loaded in the background once per process
+        # and shared by all windows. The loader is shut down when the window closes.
+        if getattr(self, "ortho_loader", None) is None:
+            self.ortho_loader = OrthographyLoader(dispatch=callAfter)
+        self.ortho_sources = SOURCES
+        self.ortho_source = SOURCES[0]
+        self.ortho: OrthographyDatabase | None = None
+        # The message shown instead of the orthographies if loading has failed
+        self.ortho_error: str | None = None
         self.ortho_list: list[Orthography] = []
         self.case = None
         self.view = None
-        self.selectedGlyphs = ()
+        self.selectedGlyphs: tuple[str, ...] = ()
+        self.selection_codepoints: set[int] = set()
         self.selected_orthography = None
         self.include_optional = False
-        self.all_unicodes_in_font = set()
-        if self.font_fallback:
-            for glyph in self.font_fallback.glyphs:
-                if glyph.unicodes and glyph.export:
-                    for uni_hex_str in glyph.unicodes:
-                        self.all_unicodes_in_font.add(int(uni_hex_str, 16))
-
-        self.blocks_in_popup = [""] + sorted(uniNameToBlock.keys())
+        # Derived Unicode tables and nice names are cached on disk, keyed on the
+        # versions of jkUnicode and the Glyphs glyph data
+        self.table_cache = TableCache()
+        self.names_cache_key = f"{data_version()}/{Glyphs.buildNumber}"
+        if getattr(self, "name_resolver", None) is None:
+            self.name_resolver = GlyphNameResolver(
+                glyphs_nice_name,
+                glyphs_unicode_for_name,
+                str(Glyphs.buildNumber),
+                glyph_unicode_func=glyphs_unicode_for_glyph,
+            )
+            tables = self.table_cache.load("names", self.names_cache_key)
+            if tables is not None:
+                self.name_resolver.load_tables(tables)
+        self.names_cache_save_pending = False
+        self.engine = UnicodeInfoEngine(
+            self.name_resolver, ui=self.info, cache=self.table_cache
+        )
+        # The coverage of all open fonts is compared in a worker thread, which needs
+        # its own UniInfo object
+        self.worker_engine = UnicodeInfoEngine(
+            self.name_resolver, cache=self.table_cache
+        )
+        if getattr(self, "list_jobs", None) is None:
+            self.list_jobs = JobRunner(dispatch=callAfter)
+        self.list_job = None
+        # The coverage of all open fonts is compared in another worker thread
+        if getattr(self, "compare_jobs", None) is None:
+            self.compare_jobs = JobRunner(dispatch=callAfter)
+        self.comparison_window = None
+
+        self.blocks_in_popup = [""] + self.engine.block_names()
+        interval = Glyphs.defaults[UPDATE_INTERVAL_KEY]
+        self.update_scheduler = UpdateScheduler(
+            self.updateInfo,
+            callLater,
+            key_func=self._selectionKey,
+            interval=UPDATE_INTERVAL if interval is None else float(interval),
+        )
         self.build_window(manual_update=True)
+        self._activateDatabase(self.ortho_source)
+        # Load the inactive database as well, after the active one
+        for source in self.ortho_sources:
+            self.ortho_loader.load(source)
         if not self.hasNotification:
-            Glyphs.addCallback(self.updateInfo, UPDATEINTERFACE)
+            Glyphs.addCallback(self.scheduleUpdateInfo, UPDATEINTERFACE)
         self.hasNotification = True
         self.w.open()
         self.updateInfo()
@@ -147,6 +289,37 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         newMenuItem.setTarget_(self)
         Glyphs.menu[WINDOW_MENU].append(newMenuItem)
 
+        profiler.enabled = profiling_requested(Glyphs.defaults[PROFILING_KEY])
+        if profiler.enabled:
+            for title, action in (
+                ("Dump Timings", self.dumpTimings_),
+                ("Profile Next Callbacks", self.profileCallbacks_),
+            ):
+                menuItem = NSMenuItem.alloc().init()
+                menuItem.setTitle_(f"{self.name}: {title}")
+                menuItem.setAction_(action)
+                menuItem.setTarget_(self)
+                Glyphs.menu[WINDOW_MENU].append(menuItem)
+
+    def dumpTimings_(self, sender=None) -> None:
+        # Print the timing summary and the update counters to the Macro panel
+        profiler.dump()
+        # The scheduler is created when the window is opened
+        scheduler = getattr(self, "update_scheduler", None)
+        if scheduler is not None:
+            print(
+                "selection updates: "
+                + ", ".join(
+                    f"{count} {name}" for name, count in scheduler.stats().items()
+                )
+            )
+
+    def profileCallbacks_(self, sender=None) -> None:
+        count = Glyphs.defaults[PROFILE_CALLBACKS_KEY]
+        count = PROFILE_CALLBACKS if count is None else int(count)
+        print(f"Profiling the next {count} Unicode Info callbacks.")
+        profiler.profile_next(count)
+
     @objc.python_method
     def __file__(self) -> str:
         """
@@ -155,42 +328,97 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         return __file__
 
     @objc.python_method
+    def scheduleUpdateInfo(self, sender=None) -> None:
+        self.update_scheduler.notify(sender)
+        self._scheduleNamesCacheSave()
+
+    @objc.python_method
+    def _scheduleNamesCacheSave(self) -> None:
+        # The save runs after the pending update, so it includes its lookups
+        if not self.names_cache_save_pending:
+            self.names_cache_save_pending = True
+            callLater(NAMES_CACHE_SAVE_DELAY, self._saveNamesCache)
+
+    @objc.python_method
+    def _saveNamesCache(self) -> None:
+        self.names_cache_save_pending = False
+        if self.name_resolver.dirty:
+            self.table_cache.save(
+                "names", self.names_cache_key, self.name_resolver.to_tables()
+            )
+
+    @objc.python_method
+    def _selectionKey(self) -> tuple:
+        # A cheap key of the state that updateInfo depends on
+        font = Glyphs.font
+        if font is None:
+            return (None,)
+
+        if hasattr(font, "currentTab") and font.currentTab:
+            glyphs = [layer.parent for layer in font.selectedLayers]
+        elif font.parent.windowController():
+            glyphs = list(font.selection)
+        else:
+            glyphs = []
+        if len(glyphs) == 1:
+            glyph_key = tuple((g.name, g.unicode, g.export) for g in glyphs)
+        else:
+            glyph_key = tuple(g.name for g in glyphs)
+        return (id(font), bool(font.currentTab), glyph_key)
+
+    @objc.python_method
+    @timed("updateInfo")
+    @checks_fonts_once
     def updateInfo(self, sender=None) -> None:
         font = Glyphs.font
         self.font = font
         uni = None
         prev_glyph = self.glyph_name
+        prev_selection = self.selectedGlyphs
 
         # We’re in the Edit View
         if hasattr(font, "currentTab") and font.currentTab:
             self.in_font_view = False
-            # Check whether glyph is being edited
-            if len(font.selectedLayers) == 1:
-                glyph = font.selectedLayers[0].parent
-                self.glyph_name = glyph.name
-                self.glyph = glyph
-                uni = self.get_unicode_for_glyphname(self.glyph_name)
-            else:
-                self.glyph_name = None
-                self.glyph = None
+            glyphs = [layer.parent for layer in font.selectedLayers]
 
         # We’re in the Font view
         else:
             self.in_font_view = True
-            if font and font.parent.windowController() and len(font.selection) == 1:
-                glyph = font.selection[0]
-                self.glyph_name = glyph.name
-                self.glyph = glyph
-                uni = self.get_unicode_for_glyphname(self.glyph_name)
+            if font and font.parent.windowController():
+                glyphs = list(font.selection)
             else:
-                self.glyph_name = None
-                self.glyph = None
-
-        if self.unicode == uni and self.glyph_name == prev_glyph:
+                glyphs = []
+
+        # Check whether one glyph is being edited or selected. Several occurrences
+        # of the same glyph count as one.
+        names = tuple(dict.fromkeys(g.name for g in glyphs))
+        if len(names) == 1:
+            glyph = glyphs[0]
+            self.glyph_name = glyph.name
+            self.glyph = glyph
+            uni = self.get_unicode_for_glyphname(self.glyph_name)
+            self.selectedGlyphs = ()
+        else:
+            self.glyph_name = None
+            self.glyph = None
+            self.selectedGlyphs = names
+
+        if (
+            self.unicode == uni
+            and self.glyph_name == prev_glyph
+            and self.selectedGlyphs == prev_selection
+        ):
             return
 
         self.unicode = uni
-        self._updateInfo(u=self.unicode, fake=False)
+        # A new selection makes a running Show computation obsolete
+        self._cancelListJob()
+        if self.selectedGlyphs:
+            # The glyph setter has reset the font
+            self.font = font
+            self._updateSelection()
+        else:
+            self._updateInfo(u=self.unicode, fake=False)
 
     # Properties
 
@@ -202,14 +430,14 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         return self._font
 
     @font.setter
+    @timed("font setter")
     def font(self, value: GSFont) -> None:
         self._font = value
         if self._font is not None:
-            cmap = set()
-            for g in self.font_glyphs:
-                if g.unicodes and g.export:
-                    cmap |= self.glyph_unicodes(g)
-            self.ortho.cmap = {u: None for u in cmap}
+            glyph = self._glyph
+            if glyph is not None and glyph.parent is not self._font:
+                glyph = None
+            get_font_index(self._font, glyph)
 
     @property
     def font_fallback(self) -> GSFont:
@@ -228,6 +456,17 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
 
         return self.font_fallback.glyphs
 
+    @property
+    def all_unicodes_in_font(self):
+        """
+        Return the codepoints of the current glyph's font or the current font.
+        """
+        f = self.font_fallback
+        if f is None:
+            return set()
+
+        return get_font_index(f).codepoints
+
     @property
     def glyph(self) -> GSGlyph:
         return self._glyph
@@ -266,20 +505,18 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
 
     @objc.python_method
     def block_completeness(self, block, font) -> str:
-        any_found = None
-        any_missing = None
-        low, high = uniNameToBlock[block]
-        for cp in range(low, high + 1):
-            if cp in uniName:
-                if cp in self.all_unicodes_in_font:
-                    if any_missing:
-                        return "◑"
-                    any_found = True
-                else:
-                    if any_found:
-                        return "◑"
-                    any_missing = True
-        return "●" if any_found else "○"
+        return self.engine.block_completeness(block, font)
+
+    @objc.python_method
+    @timed("block_list_ui_strings")
+    def block_list_ui_strings(self) -> list[str]:
+        font = self.font_fallback
+        block_list_ui_strings = [""]
+        for block in self.blocks_in_popup[1:]:
+            block_list_ui_strings.append(
+                self.block_completeness(block, font) + " " + block
+            )
+        return block_list_ui_strings
 
     @objc.python_method
     def glyph_unicodes(self, glyph) -> set[int]:
@@ -293,160 +530,56 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
     def glyph_names_for_font(self, font) -> list[str]:
         if font is None:
             return []
-        return list(font.glyphs.keys())
+        return list(get_font_index(font).names)
 
     @objc.python_method
+    @timed("get_orthography_glyph_list")
     def get_orthography_glyph_list(self, orthography, font, markers=True) -> list[str]:
-        if markers:
-            glyph_list: list[str | None] = [f"** {orthography.name} **"]
-        else:
-            glyph_list = []
-
-        base = get_expanded_glyph_list(orthography.unicodes_base, ui=self.info)
-        base = self.get_extra_names(font, base)
-        glyph_list.extend([self.get_glyphname_for_unicode(u) for u, n in sorted(base)])
-
-        punc = get_expanded_glyph_list(orthography.unicodes_punctuation, ui=self.info)
-        punc = self.get_extra_names(font, punc)
-        if markers:
-            glyph_list.append("** Punctuation **")
-        if punc:
-            glyph_list.extend(
-                [self.get_glyphname_for_unicode(u) for u, n in sorted(punc)]
-            )
-
-        if self.include_optional:
-            optn = get_expanded_glyph_list(orthography.unicodes_optional, ui=self.info)
-            optn = self.get_extra_names(font, optn)
-            if markers:
-                glyph_list.append("** Optional **")
-            if optn:
-                glyph_list.extend(
-                    [
-                        self.get_glyphname_for_unicode(u)
-                        for u, n in sorted(optn)
-                        if self.get_glyphname_for_unicode(u) not in glyph_list
-                    ]
-                )
-        if markers:
-            glyph_list.extend(["** End **", ".notdef"])
-        return [n for n in glyph_list if n is not None]
+        return self.engine.get_orthography_glyph_list(
+            orthography, font, markers, self.include_optional
+        )
 
     @objc.python_method
     def get_glyphname_for_unicode(self, value: int | None = None) -> str | None:
-        if value is None:
-            return None
-
-        font = self.font_fallback
-        if font is None:
-            return None
-
-        if font.disablesNiceNames:
-            name = getGlyphnameForUnicode(value)
-        else:
-            g = GSGlyph()
-            g.unicode = "%04X" % value
-            g.updateGlyphInfo(changeName=True)
-            name = g.name
-            if name == "newGlyph":
-                # Something went wrong, e.g. PUA
-                if len(g.unicode) == 5:
-                    name = f"u{g.unicode}"
-                else:
-                    name = f"uni{g.unicode}"
-        return name
+        return self.engine.get_glyphname_for_unicode(value, self.font_fallback)
 
     @objc.python_method
     def get_missing_glyphs_for_block(self, block, font) -> list[str]:
-        glyph_list = self.get_block_glyph_list(block, font, False, False)
-        existing = set(self.font.glyphs.keys())
-        return [n for n in glyph_list if n not in existing]
+        return self.engine.get_missing_glyphs_for_block(block, font)
 
     @objc.python_method
+    def has_missing_glyphs_for_block(self, block, font) -> bool:
+        return self.engine.has_missing_glyphs_for_block(block, font)
+
+    @objc.python_method
+    @timed("get_block_glyph_list")
     def get_block_glyph_list(
         self, block, font, markers=True, reserved=True
     ) -> list[str]:
-        if markers:
-            glyph_list = [f"** {block} **"]
-        else:
-            glyph_list = []
-        tuples = [
-            (cp, self.get_glyphname_for_unicode(cp))
-            for cp in get_codepoints(block)
-            if reserved or cp in uniName
-        ]
-        names = self.get_extra_names(font, tuples)
-        names.sort()
-        glyph_list.extend([n for _, n in names])
-        if markers:
-            glyph_list.extend(["** End **", ".notdef"])
-        return [n for n in glyph_list if n is not None]
+        return self.engine.get_block_glyph_list(block, font, markers, reserved)
 
     @objc.python_method
     def get_unicode_for_glyphname(self, name=None) -> int | None:
-        if name is None:
-            return None
-
-        font = self.font_fallback
-        if font is None:
-            return None
-
-        if font.disablesNiceNames:
-            u = getUnicodeForGlyphname(name)
-        else:
-            g = font.glyphs[name]
-            if g is None:
-                return None
-            glyphInfo = g.glyphInfo
-            if glyphInfo is None:
-                return None
-
-            u = glyphInfo.unicode
-            if u is not None:
-                u = int(u, 16)
-        return u
+        return self.engine.get_unicode_for_glyphname(name, self.font_fallback)
 
     @objc.python_method
     def get_extensions(self, font) -> list[str]:
         """
         Return all used glyph name extensions in the font
         """
-        return [
-            n.split(".", 1)[1] for n in self.glyph_names_for_font(font) if "." in n[1:]
-        ]
+        return self.engine.get_extensions(font)
 
     @objc.python_method
     def get_extension_map(self, font) -> dict[str, list[str]]:
         """
         Return a map of base glyph names to extension names for the font
         """
-        d = {}
-        for g in self.glyph_names_for_font(font):
-            if "." in g[1:]:
-                base, ext = g.split(".", 1)
-                if base not in d:
-                    d[base] = [g]
-                else:
-                    d[base].append(g)
-            else:
-                if g not in d:
-                    d[g] = []
-        return d
-
-    @objc.python_method
-    def get_extra_names(
-        self, font, uni_name_tuples: list[tuple[int | None, str]]
-    ) -> list[tuple[int | None, str]]:
-        ext_map = self.get_extension_map(font)
-        additions = []
-        for u, n in uni_name_tuples:
-            additions.extend([(u, e) for e in ext_map.get(n, [])])
-        uni_name_tuples.extend(additions)
-        return list(set(uni_name_tuples))
+        return self.engine.get_extension_map(font)
 
     # UI Callbacks
 
     @objc.python_method
+    @checks_fonts_once
     def toggleCase(self, sender=None) -> None:
         font = self.font_fallback
         if font is None:
@@ -468,6 +601,8 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         self.updateInfo()
 
     @objc.python_method
+    @timed("Fill Block")
+    @checks_fonts_once
     def addMissingBlock(self, sender=None) -> None:
         i = self.w.block_list.get()
         if i > -1:
@@ -481,12 +616,17 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         if font is None:
             return
 
-        missing = self.get_block_glyph_list(block, font, False)
-        add_glyphs_to_font(missing, font)
-        # TODO: Update the block's indicator
-        # self.w.block_list.setItem("●" + block[1:])
+        missing = self.engine.iter_block_glyph_names(block, font, False)
+        # Hold down the Option key to only print the glyphs that would be added
+        add_glyphs_to_font(missing, font, self.engine, dry_run=option_key_down())
+        # Update the block's indicator
+        i = self.w.block_list.get()
+        self.w.block_list.setItems(self.block_list_ui_strings())
+        self.w.block_list.set(i)
 
     @objc.python_method
+    @timed("Fill Orth.")
+    @checks_fonts_once
     def addMissingOrthography(self, sender=None) -> None:
         # Add glyphs that are missing for an orthography
         # Get selected orthography
@@ -502,11 +642,71 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         if font is None:
             return
 
-        glyph_list = self.get_orthography_glyph_list(orthography, font, False)
+        glyph_list = self.engine.iter_orthography_glyph_names(
+            orthography, font, False, self.include_optional
+        )
+        add_glyphs_to_font(glyph_list, font, self.engine, dry_run=option_key_down())
+
+    @objc.python_method
+    @timed("Audit")
+    @checks_fonts_once
+    def auditFont(self, sender=None) -> None:
+        # List the characters that don't help support any speakers
+        font = self.font_fallback
+        if font is None or self.ortho is None:
+            return
+
+        useless = self.engine.audit_useless_characters(
+            self.ortho, font, glyph_data_size
+        )
+        print(
+            f"{len(useless)} characters do not help support any speakers "
+            f"in {self.ortho.source_display_name}:"
+        )
+        for c in useless:
+            used = f"used in {c.orthographies}" if c.orthographies else "not used"
+            print(f"    {c.codepoint:04X}\t{c.size}\t{used}\t{' '.join(c.glyphs)}")
+        # Hold down the Option key to only print the list
+        if useless and not option_key_down():
+            glyph_names = [n for c in useless for n in c.glyphs]
+            set_selection(font, glyph_names, deselect=True)
+
+    @objc.python_method
+    @timed("Compare")
+    @checks_fonts_once
+    def compareFonts(self, sender=None) -> None:
+        # Compare the block and orthography support of all open fonts
+        from familyCoverage import FontSnapshot
+        from familyCoverageWindow import FamilyCoverageWindow
+
+        fonts = list(Glyphs.fonts)
+        if not fonts:
+            return
+
+        # The fonts are only read here on the main thread
+        snapshots = [
+            FontSnapshot.from_font(font, name)
+            for font, name in zip(fonts, font_display_names(fonts))
+        ]
+        engine = self.worker_engine
+        ortho = self.ortho
+
+        def compute(token: CancellationToken) -> CoverageMatrix:
+            return engine.coverage_matrix(snapshots, ortho, token)
+
+        def done(matrix: CoverageMatrix) -> None:
+            self.w.compare.enable(True)
+            self.comparison_window = FamilyCoverageWindow(matrix)
+
+        def fail(e: Exception) -> None:
+            self.w.compare.enable(True)
+            print(f"Comparing the open fonts failed: {e}")
 
-        add_glyphs_to_font(glyph_list, font)
+        self.w.compare.enable(False)
+        self.compare_jobs.submit(compute, done, fail)
 
     @objc.python_method
+    @checks_fonts_once
     def includeOptional(self, sender=None) -> None:
         if sender is None:
             return
@@ -515,30 +715,23 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         self._updateOrthographies()
 
     @objc.python_method
+    @checks_fonts_once
     def reassignUnicodes(self, sender=None) -> None:
-        if self.font is not None:
-            unicodes = {g.unicode: g.name for g in self.font if g.unicode}
-            for g in self.font:
-                myUnicode = self.get_unicode_for_glyphname(g.name)
-                if g.unicode != myUnicode:
-                    print("%s:" % g.name, end="")
-                    if g.unicode is not None:
-                        print("%x ->" % g.unicode, end="")
-                    else:
-                        print("<None> ->", end="")
-                    if myUnicode is not None:
-                        print("%x" % myUnicode, end="")
-                    else:
-                        print("<None>", end="")
-                    if myUnicode in unicodes:
-                        print("-- Ignored: already in use (/%s)." % unicodes[myUnicode])
-                    else:
-                        print()
-                        g.unicode = myUnicode
-                        unicodes[myUnicode] = g.name
+        if self.font is None:
+            return
+
+        plan = self.engine.plan_unicode_reassignment(self.font)
+        # Hold down the Option key to only print the changes
+        if not option_key_down():
+            self.engine.apply_unicode_reassignment(plan, self.font)
+        print(plan)
+        for line in plan.describe():
+            print(line)
 
     @objc.python_method
+    @checks_fonts_once
     def resetFilter(self, sender=None) -> None:
+        self._cancelListJob()
         self.w.reset_filter.enable(False)
         self.w.show_orthography.enable(True)
         self.w.show_block.enable(True)
@@ -558,15 +751,16 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         font.fontView.glyphsGroupViewController().update()
 
     @objc.python_method
+    @checks_fonts_once
     def selectDatabase(self, sender=None) -> None:
-        if sender.getTitle() == "CLDR":
-            self.ortho = self.ortho_cdlr
-        else:
-            assert sender.getTitle() == "Hyperglot"
-            self.ortho = self.ortho_hyperglot
+        source = sender.getTitle()
+        assert source in self.ortho_sources
+        self.ortho_source = source
+        self._activateDatabase(source)
         self._updateOrthographies()
 
     @objc.python_method
+    @checks_fonts_once
     def selectBlock(self, sender=None, name="") -> None:
         i = 0
         if sender is None:
@@ -591,19 +785,20 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
                 is_supported = False
             else:
                 block = self.blocks_in_popup[i]
-                glyph_list = self.get_missing_glyphs_for_block(block, font)
-                is_supported = len(glyph_list) == 0
+                is_supported = not self.has_missing_glyphs_for_block(block, font)
                 self.w.block_add_missing.enable(not is_supported)
 
     @objc.python_method
+    @checks_fonts_once
     def selectOrthography(self, sender=None, index=-1) -> None:
         self.w.speakers_label.set("")
+        support = self.engine.orthography_support(self.ortho, self.font_fallback)
         if sender is None:
             i = index
             if i == -1:
                 # Select the first supported language:
                 for j in range(len(self.ortho_list)):
-                    if self.ortho_list[j].support_basic:
+                    if support.support_basic(self.ortho_list[j]):
                         i = j
                         break
                 else:
@@ -616,19 +811,10 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
                 self.w.orthography_list.set(i)
                 orthography = self.ortho_list[i]
                 if self.include_optional:
-                    is_supported = orthography.support_full
+                    is_supported = support.support_full(orthography)
                 else:
-                    is_supported = orthography.support_basic
+                    is_supported = support.support_basic(orthography)
                 self.w.orthography_add_missing.enable(not is_supported)
-                if not is_supported:
-                    missing = orthography.missing_base | orthography.missing_punctuation
-                    if self.include_optional:
-                        missing |= orthography.missing_optional
-                    # print(
-                    #     f"{len(missing)} codepoints missing from orthography "
-                    #     f"'{orthography.name}':\n"
-                    #     f"{[hex(m) for m in missing]}"
-                    # )
                 if orthography.speakers != 0:
                     speakers_label_text = speakers_as_string(orthography.speakers)
                     if orthography.script != "DFLT":
@@ -639,6 +825,8 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
             self.w.orthography_add_missing.enable(False)
 
     @objc.python_method
+    @timed("Show Block")
+    @checks_fonts_once
     def showBlock(self, sender=None) -> None:
         # Callback for the "Show" button of the Unicode blocks list
         if sender is None:
@@ -648,27 +836,47 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         if i <= 0:
             return
 
-        if i < len(self.blocks_in_popup):
-            font = self.font_fallback
-            if font is None:
-                return
+        if i >= len(self.blocks_in_popup):
+            self._filterShown()
+            return
 
-            block = self.blocks_in_popup[i]
+        font = self.font_fallback
+        if font is None:
+            return
+
+        block = self.blocks_in_popup[i]
+        indexed_font = IndexedFont(font)
+        engine = None
+
+        def prepare() -> Iterator[None]:
+            nonlocal engine
+            engine = yield from self._listEngine(
+                self.engine.block_codepoints(block, reserved=True), indexed_font
+            )
+
+        def compute(token: CancellationToken) -> tuple[list[str], bool]:
             glyph_list = [f"** {block} **"]
-            glyph_list.extend(self.get_block_glyph_list(block, font, reserved=True))
+            glyph_list.extend(
+                engine.iter_block_glyph_names(
+                    block, indexed_font, reserved=True, token=token
+                )
+            )
             glyph_list.append("** End **")
+            missing = engine.has_missing_glyphs_for_block(block, indexed_font, token)
+            return glyph_list, missing
 
+        def done(result: tuple[list[str], bool]) -> None:
+            glyph_list, missing = result
             # Update status
-            missing = self.get_missing_glyphs_for_block(block, font)
-            is_supported = len(missing) == 0
-            self.w.block_add_missing.enable(not is_supported)
+            self.w.block_add_missing.enable(missing)
             set_filter(font, glyph_list)
-        self.w.reset_filter.enable(True)
-        self.filtered = True
-        self.w.show_block.enable(False)
-        self.w.show_orthography.enable(False)
+            self._filterShown()
+
+        self._startListJob("Show Block", prepare(), compute, done)
 
     @objc.python_method
+    @timed("Show Orthography")
+    @checks_fonts_once
     def showOrthography(self, sender=None) -> None:
         # Callback for the "Show" button of the Orthographies list
         if self.filtered:
@@ -680,21 +888,121 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         if i < 0:
             return
 
-        if i < len(self.orthographies_in_popup):
-            font = self.font_fallback
-            if font is None:
-                return
+        if i >= len(self.orthographies_in_popup):
+            self.selectOrthography(sender=None, index=i)
+            self._filterShown()
+            return
+
+        font = self.font_fallback
+        if font is None:
+            return
+
+        orthography = self.ortho_list[i]
+        indexed_font = IndexedFont(font)
+        include_optional = self.include_optional
+        engine = None
+
+        def prepare() -> Iterator[None]:
+            nonlocal engine
+            engine = yield from self._listEngine(
+                self.engine.orthography_codepoints(orthography, include_optional),
+                indexed_font,
+            )
+
+        def compute(token: CancellationToken) -> list[str]:
+            return list(
+                engine.iter_orthography_glyph_names(
+                    orthography,
+                    indexed_font,
+                    include_optional=include_optional,
+                    token=token,
+                )
+            )
 
-            orthography = self.ortho_list[i]
-            glyph_list = self.get_orthography_glyph_list(orthography, font)
+        def done(glyph_list: list[str]) -> None:
             set_filter(font, glyph_list)
-        # Set the selection to the same index as before
-        self.selectOrthography(sender=None, index=i)
+            # Set the selection to the same index as before
+            self.selectOrthography(sender=None, index=i)
+            self._filterShown()
+
+        self._startListJob("Show Orthography", prepare(), compute, done)
+
+    @objc.python_method
+    def _filterShown(self) -> None:
         self.w.reset_filter.enable(True)
         self.filtered = True
         self.w.show_block.enable(False)
         self.w.show_orthography.enable(False)
 
+    @objc.python_method
+    def _listEngine(
+        self, codepoints: Sequence[int], font: IndexedFont
+    ) -> Generator[None, None, UnicodeInfoEngine]:
+        # The worker thread must not call into Glyphs, so the glyph names of the
+        # list that are not cached yet are looked up here on the main thread, in
+        # batches between which the job can be cancelled. Then the names are handed
+        # to an engine that is only used by the job.
+        from unicodeInfoEngine import UnicodeInfoEngine
+
+        nice_names = not font.disablesNiceNames
+        name_for_codepoint = self.name_resolver.name_for_codepoint
+        uncached = self.name_resolver.uncached(codepoints, nice_names)
+        for i in range(0, len(uncached), NAME_BATCH_SIZE):
+            for u in uncached[i : i + NAME_BATCH_SIZE]:
+                name_for_codepoint(u, nice_names)
+            yield
+        resolver = self.name_resolver.snapshot(codepoints, nice_names)
+        return UnicodeInfoEngine(resolver, cache=self.table_cache)
+
+    @objc.python_method
+    def _startListJob(self, name: str, prepare: Iterator[None], compute, done) -> None:
+        # Compute a glyph list in the background. Only the name lookups and the
+        # result are handled on the main thread. The time until the list is shown
+        # is recorded as a span.
+        self.w.show_block.enable(False)
+        self.w.show_orthography.enable(False)
+        start = profiler.clock()
+
+        def finish(result) -> None:
+            self.list_job = None
+            self.w.progress.stop()
+            done(result)
+            if profiler.enabled:
+                profiler.record(f"{name} (list shown)", profiler.clock() - start)
+            self._scheduleNamesCacheSave()
+
+        def fail(e: Exception) -> None:
+            print(f"Could not compute the glyph list: {e}")
+            self.list_job = None
+            self.w.progress.stop()
+            self._restoreShowButtons()
+
+        token = self.list_jobs.submit(compute, finish, fail, prepare)
+        self.list_job = token
+        callLater(PROGRESS_DELAY, self._showProgress, token)
+
+    @objc.python_method
+    def _showProgress(self, token) -> None:
+        # Only show the progress indicator for jobs that take a while
+        if self.list_job is token:
+            self.w.progress.start()
+
+    @objc.python_method
+    def _cancelListJob(self) -> None:
+        if self.list_jobs.cancel():
+            self.list_job = None
+            self.w.progress.stop()
+            self._restoreShowButtons()
+
+    @objc.python_method
+    def _restoreShowButtons(self) -> None:
+        self.w.show_block.enable(
+            self.in_font_view and not self.filtered and self.w.block_list.get() > 0
+        )
+        self.w.show_orthography.enable(
+            self.in_font_view and not self.filtered and bool(self.ortho_list)
+        )
+
     @objc.python_method
     def showWikiCharacter(self, sender=None) -> None:
         if not self.unicode:
@@ -719,7 +1027,46 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
     # Internal
 
     @objc.python_method
+    def _activateDatabase(self, source: str) -> None:
+        # Use the database if it has been loaded, otherwise show the loading state
+        # until _databaseLoaded is called.
+        self.ortho = self.ortho_loader.get(source)
+        self.ortho_error = None
+        if self.ortho is None:
+            # Loading is retried if it has failed before
+            self.ortho_loader.load(
+                source, self._databaseLoaded, self._databaseLoadingFailed
+            )
+
+    @objc.python_method
+    @checks_fonts_once
+    def _databaseLoaded(self, source: str, ortho: OrthographyDatabase) -> None:
+        # Called on the main thread when a database has finished loading
+        if not self.hasNotification or source != self.ortho_source:
+            # The window was closed or another database was selected meanwhile
+            return
+
+        self.ortho = ortho
+        self._updateOrthographies()
+
+    @objc.python_method
+    def _databaseLoadingFailed(self, source: str, e: BaseException) -> None:
+        # Called on the main thread when a database could not be loaded
+        import traceback
+
+        print(f"Could not load the {source} orthographies:")
+        traceback.print_exception(type(e), e, e.__traceback__)
+        if not self.hasNotification or source != self.ortho_source:
+            return
+
+        self.ortho_error = f"⚠ Could not load {source}"
+        self._updateOrthographies()
+
+    @objc.python_method
+    @timed("_updateBlock")
     def _updateBlock(self, u) -> None:
+        from jkUnicode.uniBlock import get_block
+
         if u is None:
             self.w.block_list.set(0)
             self.w.show_block.enable(False)
@@ -730,7 +1077,7 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
             if block in self.blocks_in_popup:
                 self.w.block_list.set(self.blocks_in_popup.index(block))
                 self.w.show_block.enable(self.in_font_view and not self.filtered)
-                missing = bool(self.get_missing_glyphs_for_block(block, self.font))
+                missing = self.has_missing_glyphs_for_block(block, self.font)
                 self.w.block_add_missing.enable(missing)
             else:
                 self.w.block_list.set(0)
@@ -753,20 +1100,16 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
             self.unicode = self.glyph_unicode
             fake = False
             if self.unicode is None:
-                if "." in self.glyph.name[1:]:
+                base, suffix = split_suffix(self.glyph.name)
+                if suffix is not None:
                     fake = True
-                    base, ext = self.glyph.name.split(".", 1)
-                    if self.font is None:
-                        self.unicode = self.get_unicode_for_glyphname(base)
-                    else:
-                        if base in self.font:
-                            self.unicode = self.font[base].unicode
-                            if self.unicode is None:
-                                self.unicode = self.get_unicode_for_glyphname(base)
-                        else:
-                            self.unicode = self.get_unicode_for_glyphname(base)
-                else:
-                    base = self.glyph.name
+                    if self.font is not None:
+                        base_unicodes = get_font_index(self.font).glyph_unicodes.get(
+                            base
+                        )
+                        if base_unicodes:
+                            self.unicode = min(base_unicodes)
+                if self.unicode is None:
                     self.unicode = self.get_unicode_for_glyphname(base)
             self._updateInfo(self.unicode, fake)
 
@@ -824,39 +1167,109 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
         self._updateOrthographies()
 
     @objc.python_method
+    def _updateSelection(self) -> None:
+        # Show aggregate information for several selected glyphs
+        codepoints = self.engine.selection_codepoints(self.selectedGlyphs, self.font)
+        self.selection_codepoints = codepoints
+        blocks = self.engine.selection_blocks(codepoints)
+        self.w.uni_name.set(f"{len(self.selectedGlyphs)} glyphs selected")
+        self.w.code.set(f"{len(codepoints)} codepoints in {len(blocks)} blocks")
+        self.w.glyph_name.set(
+            ", ".join(
+                f"{self.block_completeness(block, self.font)} {block} ({count})"
+                for block, count in blocks
+            )
+        )
+        self.case = None
+        self.w.case.enable(False)
+        # Select the block with the most selected codepoints
+        self.selectBlock(name=blocks[0][0] if blocks else "")
+        self._updateOrthographies()
+
+    @objc.python_method
+    def _updateSelectionOrthographies(self) -> None:
+        support = self.engine.selection_support(
+            self.ortho,
+            self.font_fallback,
+            self.selection_codepoints,
+            self.include_optional,
+        )
+        self.ortho_list = support.orthographies
+        self.orthographies_in_popup = [o.name for o in self.ortho_list]
+        self.w.orthography_list.setItems(self.engine.selection_ui_strings(support))
+        if not self.ortho_list:
+            self.w.orthography_list.enable(False)
+            self.w.show_orthography.enable(False)
+            self.w.orthography_add_missing.enable(False)
+            if self.selection_codepoints:
+                self.w.speakers_supported_label.set(
+                    "⚠ These characters are not used in\u00a0"
+                    + self.ortho.source_display_name
+                    + "."
+                )
+            return
+
+        self.w.orthography_list.enable(True)
+        self.w.show_orthography.enable(self.in_font_view and not self.filtered)
+        try:
+            new_index = self.orthographies_in_popup.index(self.selected_orthography)
+            self.selectOrthography(index=new_index)
+        except ValueError:
+            self.selectOrthography(index=-1)
+        if support.speakers == 0:
+            self.w.speakers_supported_label.set(
+                "⚠ These characters do not help support any\u00a0speakers."
+            )
+        else:
+            self.w.speakers_supported_label.set(
+                f"All base characters of {support.full} of "
+                f"{len(self.ortho_list)} orthographies selected. "
+                "These characters help support "
+                + speakers_as_string(support.speakers)
+                + "."
+            )
+
+    @objc.python_method
+    @timed("_updateOrthographies")
     def _updateOrthographies(self) -> None:
         self.w.speakers_label.set("")
         self.w.speakers_supported_label.set("")
+        self.w.audit.enable(self.ortho is not None and self.font_fallback is not None)
+        if self.ortho is None:
+            # The database is still loading, or loading has failed
+            self.ortho_list = []
+            self.orthographies_in_popup = []
+            self.w.orthography_list.setItems([self.ortho_error or "Loading…"])
+            self.w.orthography_list.enable(False)
+            self.w.show_orthography.enable(False)
+            self.w.orthography_add_missing.enable(False)
+            return
+
+        if self.selectedGlyphs:
+            self._updateSelectionOrthographies()
+            return
+
         # Check which orthographies use current unicode
         if self.glyph is None:
             # Show all
             self.ortho_list = self.ortho.orthographies
         else:
-            if self.include_optional:
-                self.ortho_list = self.ortho.get_orthographies_for_unicode_any(
-                    self.unicode
-                )
-            else:
-                self.ortho_list = self.ortho.get_orthographies_for_unicode(self.unicode)
+            self.ortho_list = self.engine.get_orthographies_for_unicode(
+                self.ortho, self.unicode, self.include_optional
+            )
         self.orthographies_in_popup = [o.name for o in self.ortho_list]
-        orthography_list_ui_strings = []
-        # TODO: We need a strategy for when multiple glyphs are selected
-        for o in self.ortho_list:
-            if o.support_full:
-                ui_string = "● " + o.name
-            elif o.support_basic:
-                ui_string = "◑ " + o.name
-            else:
-                ui_string = "○ " + o.name
-            if not o.uses_unicode_base(self.unicode):
-                ui_string += " [optional]"
-            orthography_list_ui_strings.append(ui_string)
-        self.w.orthography_list.setItems(orthography_list_ui_strings)
+        self.w.orthography_list.setItems(
+            self.engine.orthography_ui_strings(
+                self.ortho, self.font_fallback, self.ortho_list, self.unicode
+            )
+        )
         if len(self.ortho_list) == 0:
             self.w.orthography_list.enable(False)
             self.w.show_orthography.enable(False)
             if not self.include_optional:
-                if len(self.ortho.get_orthographies_for_unicode_any(self.unicode)) != 0:
+                if self.engine.get_orthographies_for_unicode(
+                    self.ortho, self.unicode, include_optional=True
+                ):
                     self.w.speakers_supported_label.set(
                         "Optional character. Activate “include optional” to show the languages."
                     )
@@ -876,7 +1289,9 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
                 self.selectOrthography(index=new_index)
             except ValueError:
                 self.selectOrthography(index=-1)
-            speakers_supported = self.ortho.speakers_supported_by_unicode(self.unicode)
+            speakers_supported = self.engine.speakers_supported_by_unicode(
+                self.ortho, self.font_fallback, self.unicode
+            )
             if speakers_supported == 0:
                 # [Tim] This was the main goal of extending this tool:
                 # To detect useless characters, i.e. those that are not required or optional
@@ -902,5 +1317,16 @@ class UnicodeInfo(GeneralPlugin, UnicodeInfoWindow):
     @objc.python_method
     def windowClosed(self, sender) -> None:
         if self.hasNotification:
-            Glyphs.removeCallback(self.updateInfo)
+            Glyphs.removeCallback(self.scheduleUpdateInfo)
             self.hasNotification = False
+        self.update_scheduler.cancel()
+        self.list_jobs.cancel()
+        self.compare_jobs.cancel()
+        # Let the jobs stop before the caches they may use are saved
+        self.list_jobs.wait()
+        self.compare_jobs.wait()
+        # The databases stay loaded in the process for the next window
+        self.ortho_loader.shutdown()
+        self.ortho_loader = None
+        clear_font_indexes()
+        self._saveNamesCache()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import math
+import os
+import pstats
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Callable, TextIO, TypeVar
+
+# Profiling is enabled by the defaults key or the environment variable
+PROFILING_KEY = "de.kutilek.unicodeinfo.profiling"
+PROFILING_ENV = "UNICODEINFO_PROFILE"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def profiling_requested(default_value: Any = None) -> bool:
+    """
+    Return whether profiling was requested in the environment or by the value of
+    the defaults key.
+    """
+    if os.environ.get(PROFILING_ENV, "") not in ("", "0"):
+        return True
+    return bool(default_value)
+
+
+def percentile(values: list[float], pc: float) -> float:
+    """
+    Return the nearest-rank percentile of sorted values.
+    """
+    i = max(0, min(len(values) - 1, math.ceil(pc / 100 * len(values)) - 1))
+    return values[i]
+
+
+class Profiler:
+    """
+    Record the durations of named spans in a bounded ring buffer.
+
+    While disabled, `timed` functions only check the `enabled` attribute.
+
+    :param maxlen: The maximum number of spans to keep.
+    :param clock: The clock used to measure the spans.
+    """
+
+    def __init__(
+        self, maxlen: int = 2000, clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        self.enabled = False
+        self.clock = clock
+        self.spans: deque[tuple[str, float]] = deque(maxlen=maxlen)
+        self._depth = 0
+        self._profile: cProfile.Profile | None = None
+        self._profile_remaining = 0
+        self.profile_stats: pstats.Stats | None = None
+
+    def record(self, name: str, duration: float) -> None:
+        self.spans.append((name, duration))
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def call(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call a function and record its duration as a span.
+        """
+        profile = None
+        if self._depth == 0 and self._profile_remaining > 0:
+            # Capture this top-level callback with cProfile
+            profile = self._profile
+            profile.enable()
+        self._depth += 1
+        start = self.clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(name, self.clock() - start)
+            self._depth -= 1
+            if profile is not None:
+                profile.disable()
+                self._profile_remaining -= 1
+                if self._profile_remaining == 0:
+                    self._finish_profile()
+
+    # Summaries
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Return the number of spans and the p50, p95 and maximum durations in
+        seconds for each span name.
+        """
+        durations: dict[str, list[float]] = {}
+        for name, duration in self.spans:
+            durations.setdefault(name, []).append(duration)
+        result = {}
+        for name, values in durations.items():
+            values.sort()
+            result[name] = {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "max": values[-1],
+            }
+        return result
+
+    def dump(self, file: TextIO | None = None) -> None:
+        """
+        Print the summary as a table, slowest p95 first.
+        """
+        summary = self.summary()
+        print(
+            f"{'span':<32} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}",
+            file=file,
+        )
+        for name, s in sorted(summary.items(), key=lambda item: -item[1]["p95"]):
+            print(
+                f"{name:<32} {s['count']:>6} {s['p50'] * 1000:9.2f} "
+                f"{s['p95'] * 1000:9.2f} {s['max'] * 1000:9.2f}",
+                file=file,
+            )
+
+    # cProfile
+
+    def profile_next(self, count: int) -> None:
+        """
+        Capture the next `count` top-level callbacks with cProfile. The statistics
+        are printed when the last one has finished.
+        """
+        self._profile = cProfile.Profile()
+        self._profile_remaining = count
+        self.profile_stats = None
+
+    def _finish_profile(self) -> None:
+        stream = io.StringIO()
+        self.profile_stats = pstats.Stats(self._profile, stream=stream)
+        self.profile_stats.sort_stats("cumulative").print_stats(30)
+        self._profile = None
+        print(stream.getvalue())
+
+
+profiler = Profiler()
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorate a function to record its duration as a span of the shared profiler.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            return profiler.call(name, func, *args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
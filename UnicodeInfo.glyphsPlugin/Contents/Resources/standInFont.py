@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Protocol
+
+
+class GlyphProtocol(Protocol):
+    """
+    The parts of GSGlyph that the headless engine uses.
+    """
+
+    name: str
+    unicode: str | None
+    unicodes: list[str] | None
+    export: bool
+    lastChange: object
+
+
+class GlyphsProtocol(Protocol):
+    """
+    The parts of a GSFont's glyphs proxy that the headless engine uses.
+    """
+
+    def __iter__(self) -> Iterator[GlyphProtocol]: ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, name: str) -> GlyphProtocol | None: ...
+
+
+class FontProtocol(Protocol):
+    """
+    The parts of GSFont that the headless engine uses.
+    """
+
+    glyphs: GlyphsProtocol
+    disablesNiceNames: bool
+
+    def __iter__(self) -> Iterator[GlyphProtocol]: ...
+
+
+# The attributes of a glyph whose changes are recorded in lastChange
+TRACKED_ATTRIBUTES = {"name", "unicodes", "export"}
+
+
+class StandInGlyph:
+    """
+    An in-memory glyph with the same attributes as GSGlyph. Changes of the name,
+    Unicode values and export status of a glyph in a font update the lastChange
+    counters of the glyph and the font.
+    """
+
+    def __init__(
+        self,
+        name: str = "newGlyph",
+        unicodes: Iterable[str] | None = None,
+        export: bool = True,
+    ) -> None:
+        self.parent: StandInFont | None = None
+        self.lastChange = 0
+        self.name = name
+        self.unicodes = list(unicodes) if unicodes else None
+        self.export = export
+        self.selected = False
+
+    def __setattr__(self, name: str, value) -> None:
+        if name == "name" and self.parent is not None and value != self.name:
+            self.parent.glyphs._rename(self, value)
+        object.__setattr__(self, name, value)
+        if name in TRACKED_ATTRIBUTES and self.parent is not None:
+            self.parent.changed(self)
+
+    @property
+    def unicode(self) -> str | None:
+        if not self.unicodes:
+            return None
+        return self.unicodes[0]
+
+    @unicode.setter
+    def unicode(self, value: str | None) -> None:
+        self.unicodes = None if value is None else [value]
+
+    def __repr__(self) -> str:
+        return f'<StandInGlyph "{self.name}">'
+
+
+class StandInGlyphs:
+    """
+    The glyphs of a StandInFont, accessible by index or by name like the glyphs of a
+    GSFont.
+    """
+
+    def __init__(self, font: StandInFont) -> None:
+        self._font = font
+        self._glyphs: list[StandInGlyph] = []
+        self._by_name: dict[str, StandInGlyph] = {}
+
+    def __iter__(self) -> Iterator[StandInGlyph]:
+        return iter(self._glyphs)
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __getitem__(self, key: int | str) -> StandInGlyph | None:
+        if isinstance(key, int):
+            return self._glyphs[key]
+        return self._by_name.get(key)
+
+    def __delitem__(self, name: str) -> None:
+        glyph = self._by_name.pop(name)
+        self._glyphs.remove(glyph)
+        glyph.parent = None
+        self._font.changed()
+
+    def keys(self) -> list[str]:
+        return [g.name for g in self._glyphs]
+
+    def append(self, glyph: StandInGlyph) -> None:
+        if glyph.name in self._by_name:
+            raise KeyError(f"Duplicate glyph name: {glyph.name}")
+        glyph.parent = self._font
+        self._glyphs.append(glyph)
+        self._by_name[glyph.name] = glyph
+        self._font.changed(glyph)
+
+    def _rename(self, glyph: StandInGlyph, name: str) -> None:
+        """
+        Re-key a glyph of the font before its name is changed to `name`.
+        """
+        if name in self._by_name:
+            raise KeyError(f"Duplicate glyph name: {name}")
+        del self._by_name[glyph.name]
+        self._by_name[name] = glyph
+
+    def extend(self, glyphs: Iterable[StandInGlyph]) -> None:
+        for glyph in glyphs:
+            self.append(glyph)
+
+
+class StandInFont:
+    """
+    An in-memory font with the same attributes as GSFont, for use of the headless
+    engine outside of Glyphs.
+    """
+
+    def __init__(
+        self, glyphs: Iterable[StandInGlyph] = (), disablesNiceNames: bool = True
+    ) -> None:
+        self.lastChange = 0
+        self.glyphs = StandInGlyphs(self)
+        self.glyphs.extend(glyphs)
+        self.disablesNiceNames = disablesNiceNames
+
+    def changed(self, glyph: StandInGlyph | None = None) -> None:
+        """
+        Record a change of the font, made to the glyph if given.
+        """
+        self.lastChange += 1
+        if glyph is not None:
+            glyph.lastChange = self.lastChange
+
+    @classmethod
+    def from_cmap(cls, cmap: dict[int, str], **kwargs) -> StandInFont:
+        """
+        Build a font from a map of codepoints to glyph names.
+        """
+        glyphs: dict[str, list[str]] = {}
+        for u, name in sorted(cmap.items()):
+            glyphs.setdefault(name, []).append("%04X" % u)
+        return cls(
+            [StandInGlyph(name, unicodes) for name, unicodes in glyphs.items()],
+            **kwargs,
+        )
+
+    @property
+    def selection(self) -> list[StandInGlyph]:
+        return [g for g in self.glyphs if g.selected]
+
+    @selection.setter
+    def selection(self, glyphs: Iterable[StandInGlyph]) -> None:
+        for g in self.glyphs:
+            g.selected = False
+        for g in glyphs:
+            g.selected = True
+
+    def disableUpdateInterface(self) -> None:
+        pass
+
+    def enableUpdateInterface(self) -> None:
+        pass
+
+    def __iter__(self) -> Iterator[StandInGlyph]:
+        return iter(self.glyphs)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.glyphs
+
+    def __getitem__(self, key: int | str) -> StandInGlyph | None:
+        return self.glyphs[key]
+
+    def __repr__(self) -> str:
+        return f"<StandInFont with {len(self.glyphs)} glyphs>"
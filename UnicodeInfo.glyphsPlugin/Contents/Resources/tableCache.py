@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable, Union
+
+# A table is an array of numbers or a list of strings
+Table = Union[array, "list[str]"]
+
+MAGIC = b"UITC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sI")
+ALIGNMENT = 8
+
+
+def aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the directory for cache files: ~/Library/Application Support/UnicodeInfo
+    on macOS, $XDG_CACHE_HOME/UnicodeInfo elsewhere.
+    """
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "UnicodeInfo"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "UnicodeInfo"
+
+
+class TableCache:
+    """
+    A directory of versioned cache files for derived Unicode tables.
+
+    Each file contains named tables, which are arrays of numbers (stored in their
+    machine representation) or lists of strings (stored as UTF-8), and is tagged
+    with a key, e.g. the versions of the data it was derived from. A file whose key
+    doesn't match is treated as missing.
+
+    :param directory: The cache directory. If None, the default directory for the
+        platform is used.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = default_cache_dir() if directory is None else Path(directory)
+
+    def path(self, name: str) -> Path:
+        return self.directory / f"{name}.bin"
+
+    def load(self, name: str, key: str) -> dict[str, Table] | None:
+        """
+        Return the tables of a cache file, or None if the file is missing, stale or
+        unreadable.
+        """
+        try:
+            with open(self.path(name), "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    return self._read(m, key)
+        except (OSError, ValueError, KeyError, TypeError, UnicodeDecodeError):
+            return None
+
+    def _read(self, m: mmap.mmap, key: str) -> dict[str, Table] | None:
+        magic, header_size = HEADER.unpack_from(m)
+        if magic != MAGIC:
+            return None
+
+        header = json.loads(m[HEADER.size : HEADER.size + header_size])
+        start = aligned(HEADER.size + header_size)
+        if (
+            header["format"] != FORMAT_VERSION
+            or header["key"] != key
+            or header["byteorder"] != sys.byteorder
+        ):
+            return None
+
+        tables: dict[str, Table] = {}
+        for name, typecode, itemsize, offset, size, count in header["tables"]:
+            data = m[start + offset : start + offset + size]
+            if len(data) != size:
+                return None
+
+            if typecode == "str":
+                tables[name] = data.decode("utf-8").split("\0") if count else []
+            else:
+                values = array(typecode)
+                if values.itemsize != itemsize:
+                    return None
+
+                values.frombytes(data)
+                tables[name] = values
+        return tables
+
+    def save(self, name: str, key: str, tables: dict[str, Table]) -> bool:
+        """
+        Write the tables to a cache file. Return False if the file could not be
+        written.
+        """
+        blobs = []
+        for table_name, table in tables.items():
+            if isinstance(table, array):
+                blobs.append(
+                    (table_name, table.typecode, table.itemsize, table.tobytes(), 0)
+                )
+            else:
+                data = "\0".join(table).encode("utf-8")
+                blobs.append((table_name, "str", 1, data, len(table)))
+
+        # Offsets are relative to the start of the data, which follows the header
+        entries = []
+        offset = 0
+        for table_name, typecode, itemsize, data, count in blobs:
+            entries.append([table_name, typecode, itemsize, offset, len(data), count])
+            offset = aligned(offset + len(data))
+        header_bytes = json.dumps(
+            {
+                "format": FORMAT_VERSION,
+                "key": key,
+                "byteorder": sys.byteorder,
+                "tables": entries,
+            }
+        ).encode("utf-8")
+        start = aligned(HEADER.size + len(header_bytes))
+
+        path = self.path(name)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, len(header_bytes)))
+                f.write(header_bytes)
+                for entry, (_, _, _, data, _) in zip(entries, blobs):
+                    # Pad to the aligned offset
+                    f.write(b"\0" * (start + entry[3] - f.tell()))
+                    f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return False
+
+        return True
+
+    def load_or_build(
+        self, name: str, key: str, build: Callable[[], dict[str, Table]]
+    ) -> dict[str, Table]:
+        """
+        Return the tables of a cache file. If the file is missing or stale, build
+        the tables and write them to the cache.
+        """
+        tables = self.load(name, key)
+        if tables is None:
+            tables = build()
+            self.save(name, key, tables)
+        return tables
@@ -0,0 +1,860 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+from weakref import WeakKeyDictionary
+
+from blockIndex import BlockCompleteness, get_block_index
+from codepointBitmap import get_assigned_bitmap
+from coveragePlanner import CoveragePlan, CoveragePlanner
+from familyCoverage import CoverageMatrix, FontSnapshot, compute_coverage_matrix
+from fontIndex import FontIndex, get_font_index, invalidate_font_index
+from glyphNames import GlyphNameResolver
+from jkUnicode import UniInfo
+from jkUnicode.aglfn import getGlyphnameForUnicode, getUnicodeForGlyphname
+from jkUnicode.uniCase import uniLowerCaseMapping, uniUpperCaseMapping
+from orthographyIndex import OrthographySupport
+from standInFont import StandInGlyph
+
+if TYPE_CHECKING:
+    from backgroundJob import CancellationToken
+    from jkUnicode.orthography import Orthography
+    from orthographyDatabase import OrthographyDatabase
+    from standInFont import FontProtocol, GlyphProtocol
+    from tableCache import TableCache
+
+# How many codepoints a glyph list job handles between cancellation checks
+CHECK_INTERVAL = 256
+
+
+def default_name_resolver() -> GlyphNameResolver:
+    """
+    Return a name resolver that doesn't need Glyphs. It uses AGLFN names for both
+    naming modes.
+    """
+    return GlyphNameResolver(getGlyphnameForUnicode, getUnicodeForGlyphname, "aglfn")
+
+
+class InsertionPlan:
+    """
+    The glyphs that will be added to a font by Fill Block or Fill Orth.
+
+    :param names: The names of the glyphs to add, in order.
+    :param existing: The names that were skipped because they are in the font.
+    """
+
+    def __init__(self, names: list[str], existing: list[str]) -> None:
+        self.names = names
+        self.existing = existing
+        self.applied = False
+        # Durations of the steps in seconds
+        self.timings: dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        timings = ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in self.timings.items())
+        return (
+            f"<InsertionPlan add={len(self.names)} existing={len(self.existing)} "
+            f"applied={self.applied} ({timings})>"
+        )
+
+
+def format_codepoint(value: int | None) -> str | None:
+    return None if value is None else "%04X" % value
+
+
+class ReassignmentPlan:
+    """
+    The Unicode values that Assign All will change in a font.
+
+    :param changes: The accepted changes as (glyph name, old codepoint, new
+        codepoint) tuples. A new codepoint of None removes the Unicode value.
+    :param conflicts: The rejected changes as (glyph name, old codepoint, new
+        codepoint, name of the glyph that already uses the new codepoint) tuples.
+    :param unchanged: The names of the glyphs whose Unicode value is already
+        correct.
+    """
+
+    def __init__(
+        self,
+        changes: list[tuple[str, int | None, int | None]],
+        conflicts: list[tuple[str, int | None, int, str]],
+        unchanged: list[str],
+    ) -> None:
+        self.changes = changes
+        self.conflicts = conflicts
+        self.unchanged = unchanged
+        self.applied = False
+        # Durations of the steps in seconds
+        self.timings: dict[str, float] = {}
+
+    def as_dict(self) -> dict:
+        return {
+            "changes": [
+                {"glyph": n, "old": format_codepoint(old), "new": format_codepoint(new)}
+                for n, old, new in self.changes
+            ],
+            "conflicts": [
+                {
+                    "glyph": n,
+                    "old": format_codepoint(old),
+                    "new": format_codepoint(new),
+                    "used_by": other,
+                }
+                for n, old, new, other in self.conflicts
+            ],
+            "unchanged": len(self.unchanged),
+            "applied": self.applied,
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def describe(self) -> list[str]:
+        """
+        Return one line of text for each change and conflict.
+        """
+        lines = [
+            f"{n}: {format_codepoint(old)} -> {format_codepoint(new)}"
+            for n, old, new in self.changes
+        ]
+        lines.extend(
+            f"{n}: {format_codepoint(old)} -> {format_codepoint(new)} "
+            f"-- Ignored: already in use (/{other})."
+            for n, old, new, other in self.conflicts
+        )
+        return lines
+
+    def __repr__(self) -> str:
+        timings = ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in self.timings.items())
+        return (
+            f"<ReassignmentPlan changes={len(self.changes)} "
+            f"conflicts={len(self.conflicts)} unchanged={len(self.unchanged)} "
+            f"applied={self.applied} ({timings})>"
+        )
+
+
+class SelectionSupport:
+    """
+    The orthographies that use the codepoints of a selection of glyphs.
+
+    :param orthographies: The orthographies, those whose base characters are all
+        selected first, then the others, each in the order of the database.
+    :param selected: The number of selected base characters of each orthography.
+    :param full: The number of orthographies whose base characters are all
+        selected.
+    :param speakers: The number of speakers of the orthographies with basic support
+        in the font that use any of the selected codepoints in any role.
+    :param symbols: The support indicator of each orthography in the font.
+    """
+
+    def __init__(
+        self,
+        orthographies: list[Orthography],
+        selected: list[int],
+        full: int,
+        speakers: int,
+        symbols: list[str],
+    ) -> None:
+        self.orthographies = orthographies
+        self.selected = selected
+        self.full = full
+        self.speakers = speakers
+        self.symbols = symbols
+
+    def __repr__(self) -> str:
+        return (
+            f"<SelectionSupport orthographies={len(self.orthographies)} "
+            f"full={self.full} speakers={self.speakers}>"
+        )
+
+
+class UselessCharacter:
+    """
+    A codepoint of a font that doesn't help support any speakers.
+
+    :param codepoint: The codepoint.
+    :param glyphs: The names of the glyph for the codepoint and its suffixed
+        variants.
+    :param orthographies: The number of orthographies that use the codepoint, none
+        of which has basic support in the font.
+    :param size: The estimated share of the glyphs in the file size.
+    """
+
+    def __init__(
+        self, codepoint: int, glyphs: list[str], orthographies: int, size: int
+    ) -> None:
+        self.codepoint = codepoint
+        self.glyphs = glyphs
+        self.orthographies = orthographies
+        self.size = size
+
+    def __repr__(self) -> str:
+        return (
+            f"<UselessCharacter {self.codepoint:04X} glyphs={' '.join(self.glyphs)} "
+            f"orthographies={self.orthographies} size={self.size}>"
+        )
+
+
+class UnicodeInfoEngine:
+    """
+    The Glyphs-independent logic of the Unicode Info window.
+
+    All methods work on any font that implements the minimal font protocol from
+    `standInFont`, i.e. a GSFont or a StandInFont.
+
+    :param name_resolver: The resolver for codepoints and glyph names. If None, a
+        resolver that uses AGLFN names is used.
+    :param ui: The UniInfo object to use. If None, one will be instantiated.
+    :param cache: The cache for derived Unicode tables. If None, the tables are
+        built from the jkUnicode data.
+    """
+
+    def __init__(
+        self,
+        name_resolver: GlyphNameResolver | None = None,
+        ui: UniInfo | None = None,
+        cache: TableCache | None = None,
+    ) -> None:
+        self.name_resolver = (
+            default_name_resolver() if name_resolver is None else name_resolver
+        )
+        self.info = UniInfo(0) if ui is None else ui
+        self.block_status = BlockCompleteness(
+            get_block_index(cache), get_assigned_bitmap(cache)
+        )
+        # The orthography support of each font for each source
+        self._supports: WeakKeyDictionary[
+            FontIndex, dict[str, tuple[int, OrthographySupport]]
+        ] = WeakKeyDictionary()
+
+    # Blocks
+
+    def block_names(self) -> list[str]:
+        """
+        Return the names of all Unicode blocks, sorted alphabetically.
+        """
+        return sorted(self.block_status.block_index.assigned)
+
+    def block_completeness(self, block: str, font: FontProtocol | None) -> str:
+        """
+        Return the support indicator of the block for the font.
+        """
+        if font is None:
+            return "○"
+        self.block_status.sync(get_font_index(font))
+        return self.block_status.symbol(block)
+
+    def missing_codepoints_for_block(
+        self, block: str, font: FontProtocol | None
+    ) -> list[int]:
+        """
+        Return the sorted assigned codepoints of the block that the font doesn't
+        have.
+        """
+        if font is None:
+            return list(self.block_status.block_index.assigned[block])
+        self.block_status.sync(get_font_index(font))
+        return self.block_status.missing_codepoints(block)
+
+    def get_block_glyph_list(
+        self, block: str, font: FontProtocol | None, markers=True, reserved=True
+    ) -> list[str]:
+        return list(self.iter_block_glyph_names(block, font, markers, reserved))
+
+    def block_codepoints(self, block: str, reserved=True) -> Iterable[int]:
+        """
+        Return the codepoints of a block in codepoint order.
+
+        :param reserved: Include the unassigned codepoints of the block.
+        """
+        if reserved:
+            low, high = self.block_status.block_index.bounds[block]
+            return range(low, high + 1)
+        return self.block_status.block_index.assigned[block]
+
+    def iter_block_glyph_names(
+        self,
+        block: str,
+        font: FontProtocol | None,
+        markers=True,
+        reserved=True,
+        token: CancellationToken | None = None,
+    ) -> Iterator[str]:
+        """
+        Generate the glyph names of a block in codepoint order, each name once. The
+        suffixed variants of a glyph in the font follow its name.
+
+        :param reserved: Include the names of unassigned codepoints of the block.
+        :param token: Checked regularly to stop when the job is cancelled.
+        """
+        if markers:
+            yield f"** {block} **"
+        if font is not None:
+            yield from self._iter_glyph_names(
+                self.block_codepoints(block, reserved),
+                font,
+                {},
+                variants=True,
+                token=token,
+            )
+        if markers:
+            yield "** End **"
+            yield ".notdef"
+
+    def get_missing_glyphs_for_block(
+        self, block: str, font: FontProtocol | None
+    ) -> list[str]:
+        return list(self.iter_missing_glyphs_for_block(block, font))
+
+    def iter_missing_glyphs_for_block(
+        self,
+        block: str,
+        font: FontProtocol | None,
+        token: CancellationToken | None = None,
+    ) -> Iterator[str]:
+        """
+        Generate the names of the glyphs for the block's assigned codepoints that
+        the font doesn't have, in codepoint order. The missing codepoints are taken
+        from the bitmaps, so a complete block needs no name lookups. A glyph that is
+        in the font under the name of a missing codepoint, but not encoded, is not
+        generated.
+        """
+        if font is None:
+            return
+
+        existing = get_font_index(font).names
+        missing = self.missing_codepoints_for_block(block, font)
+        for n in self._iter_glyph_names(missing, font, {}, token=token):
+            if n not in existing:
+                yield n
+
+    def has_missing_glyphs_for_block(
+        self,
+        block: str,
+        font: FontProtocol | None,
+        token: CancellationToken | None = None,
+    ) -> bool:
+        if font is None:
+            return False
+
+        self.block_status.sync(get_font_index(font))
+        if not self.block_status.counts(block)[1]:
+            # No codepoint is missing
+            return False
+
+        missing = self.iter_missing_glyphs_for_block(block, font, token)
+        return next(missing, None) is not None
+
+    # Orthographies
+
+    def get_orthography_glyph_list(
+        self,
+        orthography: Orthography,
+        font: FontProtocol | None,
+        markers=True,
+        include_optional=False,
+    ) -> list[str]:
+        return list(
+            self.iter_orthography_glyph_names(
+                orthography, font, markers, include_optional
+            )
+        )
+
+    def orthography_codepoints(
+        self, orthography: Orthography, include_optional=False
+    ) -> list[int]:
+        """
+        Return the codepoints of the glyph list of an orthography, including the
+        case mappings of the characters, in no particular order.
+        """
+        codepoints = self._expanded_codepoints(orthography.unicodes_base_punctuation)
+        if include_optional:
+            codepoints += self._expanded_codepoints(orthography.unicodes_optional)
+        return codepoints
+
+    def iter_orthography_glyph_names(
+        self,
+        orthography: Orthography,
+        font: FontProtocol | None,
+        markers=True,
+        include_optional=False,
+        token: CancellationToken | None = None,
+    ) -> Iterator[str]:
+        """
+        Generate the glyph names of the base, punctuation and optionally the
+        optional characters of an orthography, each section in codepoint order and
+        including the case mappings of the characters. Each name is generated once.
+
+        :param token: Checked regularly to stop when the job is cancelled.
+        """
+        seen: dict[str, None] = {}
+        if markers:
+            yield f"** {orthography.name} **"
+        if font is not None:
+            yield from self._iter_glyph_names(
+                self._expanded_codepoints(orthography.unicodes_base),
+                font,
+                seen,
+                token=token,
+            )
+        if markers:
+            yield "** Punctuation **"
+        if font is not None:
+            yield from self._iter_glyph_names(
+                self._expanded_codepoints(orthography.unicodes_punctuation),
+                font,
+                seen,
+                token=token,
+            )
+        if include_optional:
+            if markers:
+                yield "** Optional **"
+            if font is not None:
+                yield from self._iter_glyph_names(
+                    self._expanded_codepoints(orthography.unicodes_optional),
+                    font,
+                    seen,
+                    token=token,
+                )
+        if markers:
+            yield "** End **"
+            yield ".notdef"
+
+    def _expanded_codepoints(self, codepoints: Iterable[int]) -> list[int]:
+        """
+        Return the sorted codepoints together with their case mappings, like
+        jkUnicode's get_expanded_glyph_list. The case mapping tables are used
+        directly instead of UniInfo, which computes all properties of a codepoint.
+        """
+        expanded = set()
+        for u in codepoints:
+            expanded.add(u)
+            mapped = uniLowerCaseMapping.get(u)
+            if mapped is None:
+                mapped = uniUpperCaseMapping.get(u)
+            if mapped is not None:
+                expanded.add(mapped)
+        return sorted(expanded)
+
+    def _iter_glyph_names(
+        self,
+        codepoints: Iterable[int],
+        font: FontProtocol,
+        seen: dict[str, None],
+        variants=False,
+        token: CancellationToken | None = None,
+    ) -> Iterator[str]:
+        """
+        Generate the glyph names for codepoints that are not in `seen` yet, and add
+        them to it. If variants is True, the sorted suffixed variants of each glyph
+        in the font follow its name. The token is checked every CHECK_INTERVAL
+        codepoints.
+        """
+        name_for_codepoint = self.name_resolver.name_for_codepoint
+        nice_names = not font.disablesNiceNames
+        ext_map = self.get_extension_map(font) if variants else {}
+        for i, u in enumerate(codepoints):
+            if token is not None and i % CHECK_INTERVAL == 0:
+                token.check()
+            name = name_for_codepoint(u, nice_names)
+            if name is None or name in seen:
+                continue
+
+            seen[name] = None
+            yield name
+            extensions = ext_map.get(name)
+            if extensions:
+                for n in sorted(extensions):
+                    if n not in seen:
+                        seen[n] = None
+                        yield n
+
+    def get_orthographies_for_unicode(
+        self, ortho: OrthographyDatabase, u: int | None, include_optional=False
+    ) -> list[Orthography]:
+        """
+        Return the orthographies that use the codepoint as base or punctuation
+        character, or in any role if include_optional is True.
+        """
+        return ortho.index.orthographies_for_unicode(u, include_optional)
+
+    def orthography_support(
+        self, ortho: OrthographyDatabase, font: FontProtocol | None
+    ) -> OrthographySupport:
+        """
+        Return the support of the orthographies by the font. It is kept for each
+        font and updated from the changed codepoints when the font index changes.
+        """
+        if font is None:
+            return OrthographySupport(ortho.index)
+
+        index = get_font_index(font)
+        supports = self._supports.setdefault(index, {})
+        version, support = supports.get(ortho.source, (None, None))
+        if support is None:
+            support = OrthographySupport(ortho.index, index.codepoints)
+        elif version != index.version:
+            support.set_codepoints(index.codepoints)
+        supports[ortho.source] = (index.version, support)
+        return support
+
+    def speakers_supported_by_unicode(
+        self, ortho: OrthographyDatabase, font: FontProtocol | None, u: int | None
+    ) -> int:
+        """
+        Return the number of speakers the codepoint helps support.
+        """
+        return self.orthography_support(ortho, font).speakers_supported_by_unicode(u)
+
+    def orthography_ui_strings(
+        self,
+        ortho: OrthographyDatabase,
+        font: FontProtocol | None,
+        ortho_list: list[Orthography],
+        u: int | None,
+    ) -> list[str]:
+        """
+        Return the popup entries for a list of orthographies, with support
+        indicator and optional marker for the codepoint.
+        """
+        support = self.orthography_support(ortho, font)
+        orthography_list_ui_strings = []
+        for o in ortho_list:
+            ui_string = support.symbol(o) + " " + o.name
+            if not o.uses_unicode_base(u):
+                ui_string += " [optional]"
+            orthography_list_ui_strings.append(ui_string)
+        return orthography_list_ui_strings
+
+    def audit_useless_characters(
+        self,
+        ortho: OrthographyDatabase,
+        font: FontProtocol,
+        size_func: Callable[[GlyphProtocol], int] | None = None,
+    ) -> list[UselessCharacter]:
+        """
+        Return the encoded characters of the font that don't help support any
+        speakers, the one with the largest estimated file size impact first.
+
+        :param size_func: A function that estimates the share of a glyph in the
+            file size. If None, each glyph counts as 1.
+        """
+        index = get_font_index(font)
+        support = self.orthography_support(ortho, font)
+        speakers = support.speakers_by_codepoint(index.cmap)
+        entries = ortho.index.entries
+        result = []
+        for u, count in speakers.items():
+            if count:
+                continue
+
+            name = index.cmap[u]
+            names = [name] + index.variants.get(name, [])
+            if size_func is None:
+                size = len(names)
+            else:
+                size = sum(size_func(font.glyphs[n]) for n in names)
+            result.append(UselessCharacter(u, names, len(entries.get(u, ())), size))
+        result.sort(key=lambda c: (-c.size, c.codepoint))
+        return result
+
+    def plan_coverage(
+        self,
+        ortho: OrthographyDatabase,
+        font: FontProtocol,
+        budget: int,
+        scripts: Iterable[str] | None = None,
+    ) -> CoveragePlan:
+        """
+        Return the codepoints to add to the font that give the most speakers basic
+        support, adding at most `budget` codepoints.
+
+        :param scripts: If given, only orthographies of these scripts (Unicode script
+            names like "Latin") are considered.
+        """
+        planner = ortho.shared("coverage planner", CoveragePlanner)
+        return planner.plan(get_font_index(font).codepoints, budget, scripts)
+
+    # Comparison of several fonts
+
+    def coverage_matrix(
+        self,
+        snapshots: list[FontSnapshot],
+        ortho: OrthographyDatabase | None = None,
+        token: CancellationToken | None = None,
+    ) -> CoverageMatrix:
+        """
+        Return the block and orthography support of several fonts. The fonts are
+        passed as snapshots, so this can run in a worker thread.
+
+        :param ortho: The orthography database. If None, only blocks are compared.
+        :param token: Checked after each font to stop when the job is cancelled.
+        """
+        return compute_coverage_matrix(
+            snapshots,
+            self.block_status.block_index,
+            self.block_status.assigned,
+            ortho,
+            token,
+        )
+
+    # Selections of several glyphs
+
+    def selection_codepoints(
+        self, names: Iterable[str], font: FontProtocol | None
+    ) -> set[int]:
+        """
+        Return the codepoints of a selection of glyphs, derived from their names
+        like for a single glyph.
+        """
+        unicodes = self.get_unicodes_for_glyphnames(names, font)
+        return {u for u in unicodes.values() if u is not None}
+
+    def selection_blocks(self, codepoints: Iterable[int]) -> list[tuple[str, int]]:
+        """
+        Return the blocks touched by the codepoints with the number of codepoints in
+        each block, the block with the most codepoints first.
+        """
+        block_for_codepoint = self.block_status.block_index.block_for_codepoint
+        counts = Counter(block_for_codepoint(u) for u in codepoints)
+        counts.pop(None, None)
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def selection_support(
+        self,
+        ortho: OrthographyDatabase,
+        font: FontProtocol | None,
+        codepoints: Iterable[int],
+        include_optional=False,
+    ) -> SelectionSupport:
+        """
+        Return the orthographies that use the codepoints of a selection, computed in
+        one pass over the inverted index.
+        """
+        codepoints = set(codepoints)
+        support = self.orthography_support(ortho, font)
+        counts = ortho.index.selection_counts(codepoints, include_optional)
+        all_orthographies = ortho.orthographies
+        full = []
+        partial = []
+        for i in sorted(counts):
+            o = all_orthographies[i]
+            if o.unicodes_base and counts[i] == len(o.unicodes_base):
+                full.append(i)
+            else:
+                partial.append(i)
+        indices = full + partial
+        orthographies = [all_orthographies[i] for i in indices]
+        return SelectionSupport(
+            orthographies,
+            [counts[i] for i in indices],
+            len(full),
+            support.speakers_supported_by_codepoints(codepoints),
+            [support.symbol(o) for o in orthographies],
+        )
+
+    def selection_ui_strings(self, support: SelectionSupport) -> list[str]:
+        """
+        Return the popup entries for the orthographies of a selection, with support
+        indicator and the number of selected base characters.
+        """
+        return [
+            f"{symbol} {o.name} ({n}/{len(o.unicodes_base)})"
+            for o, n, symbol in zip(
+                support.orthographies, support.selected, support.symbols
+            )
+        ]
+
+    # Glyph names
+
+    def get_glyphname_for_unicode(
+        self, value: int | None, font: FontProtocol | None
+    ) -> str | None:
+        if value is None or font is None:
+            return None
+
+        return self.name_resolver.name_for_codepoint(
+            value, nice_names=not font.disablesNiceNames
+        )
+
+    def get_unicode_for_glyphname(
+        self, name: str | None, font: FontProtocol | None
+    ) -> int | None:
+        if name is None or font is None:
+            return None
+
+        return self.get_unicodes_for_glyphnames([name], font)[name]
+
+    def get_unicodes_for_glyphnames(
+        self, names: Iterable[str], font: FontProtocol | None
+    ) -> dict[str, int | None]:
+        """
+        Return a map of glyph names to the codepoints their names stand for. With
+        nice names, the glyphs are looked up in the font, so its own glyph data is
+        used, and names of glyphs that are not in the font map to None. The results
+        are cached in the font index.
+        """
+        if font is None:
+            return {}
+
+        if font.disablesNiceNames:
+            return self.name_resolver.codepoints_for_names(names, nice_names=False)
+
+        cache = get_font_index(font).name_unicodes
+        codepoint_for_glyph = self.name_resolver.codepoint_for_glyph
+        result = {}
+        for name in names:
+            try:
+                result[name] = cache[name]
+            except KeyError:
+                glyph = font.glyphs[name]
+                u = None if glyph is None else codepoint_for_glyph(glyph)
+                result[name] = cache[name] = u
+        return result
+
+    def get_extensions(self, font: FontProtocol | None) -> list[str]:
+        """
+        Return all used glyph name extensions in the font
+        """
+        if font is None:
+            return []
+        return list(get_font_index(font).suffixes)
+
+    def get_extension_map(self, font: FontProtocol | None) -> dict[str, list[str]]:
+        """
+        Return a map of base glyph names to extension names for the font. The map is
+        shared with the font index and must not be modified.
+        """
+        if font is None:
+            return {}
+        return get_font_index(font).variants
+
+    def plan_glyph_insertion(
+        self, glyph_names: Iterable[str], font: FontProtocol
+    ) -> InsertionPlan:
+        """
+        Compute which glyphs of a glyph list need to be added to the font, using the
+        cached name index of the font. The font is not modified.
+        """
+        start = time.perf_counter()
+        existing_names = get_font_index(font).names
+        names = []
+        existing = []
+        for n in dict.fromkeys(glyph_names):
+            if n.startswith("**"):
+                continue
+            if n in existing_names:
+                existing.append(n)
+            else:
+                names.append(n)
+        plan = InsertionPlan(names, existing)
+        plan.timings["plan"] = time.perf_counter() - start
+        return plan
+
+    def insert_glyphs(
+        self,
+        plan: InsertionPlan,
+        font: FontProtocol,
+        glyph_factory: Callable[[str], GlyphProtocol] = StandInGlyph,
+    ) -> list[GlyphProtocol]:
+        """
+        Add the planned glyphs to the font in one batch and select them. Interface
+        updates are suspended while the font is modified.
+        """
+        start = time.perf_counter()
+        index = get_font_index(font)
+        glyphs = [glyph_factory(n) for n in plan.names]
+        font.disableUpdateInterface()
+        try:
+            font.glyphs.extend(glyphs)
+            index.add_glyphs(glyphs)
+            font.selection = glyphs
+        finally:
+            font.enableUpdateInterface()
+        plan.applied = True
+        plan.timings["insert"] = time.perf_counter() - start
+        return glyphs
+
+    # Unicode values
+
+    def plan_unicode_reassignment(self, font: FontProtocol) -> ReassignmentPlan:
+        """
+        Compute which Unicode values Assign All will change, based on the glyph
+        names. The font is not modified.
+
+        A change conflicts if the new codepoint is still used after the plan is
+        applied, by a glyph that keeps it or by an earlier glyph that is changed to
+        it. Codepoints that other glyphs give up in the same plan are free.
+        """
+        start = time.perf_counter()
+        current = [
+            (g.name, None if g.unicode is None else int(g.unicode, 16)) for g in font
+        ]
+        new_unicodes = self.get_unicodes_for_glyphnames(
+            [name for name, _ in current], font
+        )
+        wanted = [
+            (name, old, new_unicodes[name])
+            for name, old in current
+            if new_unicodes[name] != old
+        ]
+        # Rejecting a change keeps the old codepoint of the glyph, which may in turn
+        # conflict with an accepted change, so repeat until nothing is rejected
+        rejected: set[str] = set()
+        while True:
+            kept = {
+                old: name
+                for name, old in reversed(current)
+                if old is not None and (name in rejected or new_unicodes[name] == old)
+            }
+            claimed: dict[int, str] = {}
+            new_conflicts = []
+            for name, _, new in wanted:
+                if new is None or name in rejected:
+                    continue
+                if new in kept or new in claimed:
+                    new_conflicts.append(name)
+                else:
+                    claimed[new] = name
+            if not new_conflicts:
+                break
+            rejected.update(new_conflicts)
+
+        changes = [c for c in wanted if c[0] not in rejected]
+        conflicts = [
+            (name, old, new, kept.get(new) or claimed[new])
+            for name, old, new in wanted
+            if name in rejected
+        ]
+        unchanged = [name for name, old in current if new_unicodes[name] == old]
+        plan = ReassignmentPlan(changes, conflicts, unchanged)
+        plan.timings["plan"] = time.perf_counter() - start
+        return plan
+
+    def apply_unicode_reassignment(
+        self, plan: ReassignmentPlan, font: FontProtocol
+    ) -> None:
+        """
+        Write the accepted changes of the plan to the font in one batch. Interface
+        updates are suspended while the font is modified.
+        """
+        start = time.perf_counter()
+        font.disableUpdateInterface()
+        try:
+            for name, _, new in plan.changes:
+                font.glyphs[name].unicode = format_codepoint(new)
+        finally:
+            font.enableUpdateInterface()
+        invalidate_font_index(font)
+        plan.applied = True
+        plan.timings["apply"] = time.perf_counter() - start
+
+    def reassign_unicodes(self, font: FontProtocol) -> ReassignmentPlan:
+        """
+        Assign Unicode values to all glyphs of the font based on their names.
+        """
+        plan = self.plan_unicode_reassignment(font)
+        self.apply_unicode_reassignment(plan, font)
+        return plan
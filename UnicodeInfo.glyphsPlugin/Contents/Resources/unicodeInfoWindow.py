@@ -14,11 +14,13 @@ class UnicodeInfoWindow:
             FloatingWindow,
             ImageButton,
             PopUpButton,
+            ProgressSpinner,
             TextBox,
         )
 
         width = 320
-        height = 240
+        # Includes a row for the Compare button
+        height = 262
 
         if manual_update:
             # Make room for an additional button
@@ -131,10 +133,24 @@ class UnicodeInfoWindow:
             sizeStyle="small",
         )
         y += 20
-        self.w.speakers_label = TextBox((axis, y, 220, 20), "", sizeStyle="small")
+        self.w.speakers_label = TextBox((axis, y, -80, 20), "", sizeStyle="small")
+        self.w.audit = Button(
+            (-72, y - 2, -10, 25),
+            "Audit",
+            callback=self.auditFont,
+            sizeStyle="small",
+        )
         y += 24
         self.w.speakers_supported_label = TextBox(
-            (axis, y, 220, 32), "", sizeStyle="small"
+            (axis, y, -80, 32), "", sizeStyle="small"
+        )
+        # Below the Audit button, next to the second line of the label
+        y += 22
+        self.w.compare = Button(
+            (-72, y - 2, -10, 25),
+            "Compare",
+            callback=self.compareFonts,
+            sizeStyle="small",
         )
         y += 12
 
@@ -152,6 +168,11 @@ class UnicodeInfoWindow:
                 callback=self.addMissingOrthography,
                 sizeStyle="small",
             )
+            self.w.progress = ProgressSpinner(
+                (axis + 156, y - 2, 16, 16),
+                displayWhenStopped=False,
+                sizeStyle="small",
+            )
             self.w.reset_filter = Button(
                 (-88, y - 6, -10, 25),
                 "Reset Filter",
@@ -164,13 +185,9 @@ class UnicodeInfoWindow:
             #     callback=self.updateInfo,
             #     sizeStyle="small",
             # )
-        block_list_ui_strings = [""]
-        for block in self.blocks_in_popup[1:]:
-            block_list_ui_strings.append(
-                self.block_completeness(block, self.font_fallback) + " " + block
-            )
         self.w.reassign_unicodes.enable(False)
-        self.w.block_list.setItems(block_list_ui_strings)
+        self.w.audit.enable(False)
+        self.w.block_list.setItems(self.block_list_ui_strings())
         self.w.show_block.enable(False)
         self.w.case.enable(False)
 
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Hashable
+
+
+class UpdateScheduler:
+    """
+    Coalesce bursts of update notifications into at most one update per interval.
+
+    The scheduler is independent of Glyphs: the clock and the function that
+    schedules a delayed call are passed in, so it can be driven by a fake clock.
+
+    :param callback: The function that performs the update.
+    :param call_later: A function `call_later(delay, func)` that calls `func` after
+        `delay` seconds, e.g. `PyObjCTools.AppHelper.callLater`.
+    :param key_func: An optional function returning a hashable key of the state the
+        update depends on. If the key is unchanged since the last processed update,
+        the update is skipped.
+    :param interval: The minimum time between two updates in seconds.
+    :param clock: A monotonic clock returning seconds.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[], Any],
+        call_later: Callable[[float, Callable[[], Any]], Any],
+        key_func: Callable[[], Hashable] | None = None,
+        interval: float = 1 / 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.callback = callback
+        self.call_later = call_later
+        self.key_func = key_func
+        self.interval = interval
+        self.clock = clock
+        self.reset_stats()
+        self._pending = False
+        self._generation = 0
+        self._last_run: float | None = None
+        self._last_key: Hashable = object()
+
+    def reset_stats(self) -> None:
+        self.received = 0
+        self.coalesced = 0
+        self.skipped = 0
+        self.processed = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the counters of received, coalesced, skipped and processed events.
+        """
+        return {
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "processed": self.processed,
+        }
+
+    def notify(self, sender=None) -> None:
+        """
+        Request an update. Requests that arrive while an update is pending are
+        merged into it.
+        """
+        self.received += 1
+        if self._pending:
+            self.coalesced += 1
+            return
+
+        self._pending = True
+        delay = 0.0
+        if self._last_run is not None:
+            delay = max(0.0, self._last_run + self.interval - self.clock())
+        generation = self._generation
+        self.call_later(delay, lambda: self._fire(generation))
+
+    def cancel(self) -> None:
+        """
+        Drop a pending update and forget the last key.
+        """
+        self._generation += 1
+        self._pending = False
+        self._last_key = object()
+
+    def _fire(self, generation: int) -> None:
+        if generation != self._generation:
+            return
+
+        self._pending = False
+        self._last_run = self.clock()
+        if self.key_func is not None:
+            key = self.key_func()
+            if key == self._last_key:
+                self.skipped += 1
+                return
+
+            self._last_key = key
+        self.processed += 1
+        self.callback()
+
+    def __repr__(self) -> str:
+        return (
+            f"<UpdateScheduler received={self.received} coalesced={self.coalesced} "
+            f"skipped={self.skipped} processed={self.processed}>"
+        )
@@ -0,0 +1,351 @@
+"""
+Benchmarks for the hot paths of the Unicode Info window.
+
+The benchmarks run the headless engine against synthetic stand-in fonts, so they
+don't need Glyphs. They need the jkUnicode Python package.
+
+Usage:
+
+    python benchmarks/benchmark.py [--sizes 500 5000 50000] [--repeat 5]
+        [--output results.json]
+
+The results are written as JSON, so they can be compared between commits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+RESOURCES = (
+    Path(__file__).resolve().parent.parent
+    / "UnicodeInfo.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+sys.path.insert(0, str(RESOURCES))
+
+from blockIndex import BlockCompleteness, data_version, get_block_index  # noqa: E402
+from fontIndex import FontIndex, checks_fonts_once, get_font_index  # noqa: E402
+from jkUnicode import UniInfo  # noqa: E402
+from jkUnicode.aglfn import getGlyphnameForUnicode  # noqa: E402
+from jkUnicode.orthography import OrthographyInfo  # noqa: E402
+from jkUnicode.uniName import uniName  # noqa: E402
+from orthographyDatabase import (  # noqa: E402
+    OrthographyDatabase,
+    get_orthography_database,
+)
+from orthographyIndex import OrthographySupport  # noqa: E402
+from orthographyLoader import SOURCES, OrthographyLoader  # noqa: E402
+from standInFont import StandInFont, StandInGlyph  # noqa: E402
+from unicodeInfoEngine import UnicodeInfoEngine  # noqa: E402
+
+LARGE_BLOCKS = ["CJK Unified Ideographs", "Hangul Syllables", "Latin Extended-B"]
+SUFFIXES = ["sc", "alt", "ss01", "ss02", "case"]
+COMMON_LATIN = 0x0065  # e
+
+
+def synthetic_font(size: int) -> StandInFont:
+    """
+    Return a font with `size` glyphs: encoded glyphs for assigned codepoints, and
+    suffixed variants of every tenth glyph.
+    """
+    codepoints = [u for u in sorted(uniName) if uniName[u] != "<control>"]
+    glyphs: list[StandInGlyph] = []
+    names: list[str] = []
+    for u in codepoints:
+        if len(glyphs) >= size:
+            break
+        name = getGlyphnameForUnicode(u)
+        glyphs.append(StandInGlyph(name, ["%04X" % u]))
+        names.append(name)
+        if len(names) % 10 == 0:
+            for suffix in SUFFIXES[:2]:
+                if len(glyphs) < size:
+                    glyphs.append(StandInGlyph(f"{name}.{suffix}"))
+    i = 0
+    while len(glyphs) < size:
+        # Fill up with more variants
+        name = names[i % len(names)]
+        suffix = SUFFIXES[i // len(names) % len(SUFFIXES)]
+        glyphs.append(StandInGlyph(f"{name}.{suffix}{i // len(names)}"))
+        i += 1
+    return StandInFont(glyphs)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def summarize(times: list[float]) -> dict[str, float]:
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "max": max(times),
+    }
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """
+    Return the peak size in bytes of the memory allocated while calling func.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=RESOURCES,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def update_orthographies(
+    engine: UnicodeInfoEngine,
+    ortho: OrthographyDatabase,
+    font: StandInFont,
+    u: int,
+    include_optional: bool,
+) -> None:
+    # The same queries as UnicodeInfo._updateOrthographies
+    ortho_list = engine.get_orthographies_for_unicode(ortho, u, include_optional)
+    engine.orthography_ui_strings(ortho, font, ortho_list, u)
+    engine.speakers_supported_by_unicode(ortho, font, u)
+
+
+def load_database(source: str) -> OrthographyDatabase:
+    # get_orthography_database loads each source once per process, the benchmark
+    # needs a new database in each run
+    return OrthographyDatabase(source, OrthographyInfo(ui=UniInfo(0), source=source))
+
+
+def database_loading(repeat: int) -> list[dict[str, Any]]:
+    """
+    Measure how long opening the window is blocked by loading the orthography
+    databases, and how long it takes until the Usage popup shows the orthographies
+    of the active database, eagerly like before, and in the background.
+    """
+    font = synthetic_font(500)
+    get_font_index(font)
+    active = SOURCES[0]
+    blocked: dict[str, list[float]] = {"eager": [], "background": []}
+    populated: dict[str, list[float]] = {"eager": [], "background": []}
+    for _ in range(repeat):
+        # The engine caches the support per source, the databases are new
+        engine = UnicodeInfoEngine()
+        start = time.perf_counter()
+        databases = {source: load_database(source) for source in SOURCES}
+        blocked["eager"].append(time.perf_counter() - start)
+        update_orthographies(engine, databases[active], font, COMMON_LATIN, False)
+        populated["eager"].append(time.perf_counter() - start)
+
+        engine = UnicodeInfoEngine()
+        start = time.perf_counter()
+        loader = OrthographyLoader(load_func=load_database)
+        for source in SOURCES:
+            loader.load(source)
+        blocked["background"].append(time.perf_counter() - start)
+        # Like UnicodeInfo._databaseLoaded, while the other database is loading
+        ortho = loader.wait(active)
+        update_orthographies(engine, ortho, font, COMMON_LATIN, False)
+        populated["background"].append(time.perf_counter() - start)
+        # Wait outside of the measurement, so the next run doesn't compete with it
+        for source in SOURCES:
+            loader.wait(source)
+        loader.shutdown()
+
+    results = []
+    for name, times in (
+        ("window open: load databases", blocked),
+        ("window open: usage popup populated", populated),
+    ):
+        for mode in ("eager", "background"):
+            result = {"name": name, "mode": mode, "repeat": repeat}
+            result.update(summarize(times[mode]))
+            results.append(result)
+            print(
+                f"{name + ' (' + mode + ')':<47} {result['median'] * 1000:10.2f} ms",
+                file=sys.stderr,
+            )
+    return results
+
+
+def run_benchmarks(sizes: list[int], repeat: int) -> list[dict[str, Any]]:
+    results = database_loading(repeat)
+
+    def record(
+        name: str, glyphs: int, func: Callable[[], Any], memory=False, **extra
+    ) -> None:
+        result = {"name": name, "glyphs": glyphs, "repeat": repeat}
+        result.update(extra)
+        result.update(measure(func, repeat))
+        line = f"{name:<40} {glyphs:>6} {result['median'] * 1000:10.2f} ms"
+        if memory:
+            result["peak_bytes"] = peak_memory(func)
+            line += f" {result['peak_bytes'] / 1024:10.1f} KiB"
+        results.append(result)
+        print(line, file=sys.stderr)
+
+    engine = UnicodeInfoEngine()
+    ortho = get_orthography_database("Hyperglot")
+    orthographies = ortho.orthographies[:10]
+    block_index = get_block_index()
+
+    for size in sizes:
+        font = synthetic_font(size)
+        index = get_font_index(font)
+
+        record("font index rebuild", size, lambda: FontIndex(font))
+        record("font index cached lookup", size, lambda: get_font_index(font))
+
+        @checks_fonts_once
+        def window_open_block_completeness():
+            engine.block_status = BlockCompleteness(block_index)
+            for block in block_index.assigned:
+                engine.block_completeness(block, font)
+
+        record("block completeness (all blocks)", size, window_open_block_completeness)
+
+        for block in LARGE_BLOCKS:
+            record(
+                "get_block_glyph_list",
+                size,
+                lambda: engine.get_block_glyph_list(block, font),
+                memory=True,
+                block=block,
+            )
+            record(
+                "fill block: plan_glyph_insertion",
+                size,
+                lambda: engine.plan_glyph_insertion(
+                    engine.iter_block_glyph_names(block, font, False), font
+                ),
+                memory=True,
+                block=block,
+            )
+            record(
+                "get_missing_glyphs_for_block",
+                size,
+                lambda: engine.get_missing_glyphs_for_block(block, font),
+                block=block,
+            )
+
+        record(
+            "orthography support",
+            size,
+            lambda: OrthographySupport(ortho.index, index.codepoints),
+            memory=True,
+        )
+        for include_optional in (False, True):
+
+            def orthography_glyph_lists():
+                for o in orthographies:
+                    engine.get_orthography_glyph_list(
+                        o, font, include_optional=include_optional
+                    )
+
+            record(
+                "get_orthography_glyph_list (10)",
+                size,
+                orthography_glyph_lists,
+                memory=True,
+                include_optional=include_optional,
+            )
+            record(
+                "update orthographies",
+                size,
+                lambda: update_orthographies(
+                    engine, ortho, font, COMMON_LATIN, include_optional
+                ),
+                include_optional=include_optional,
+                codepoint=COMMON_LATIN,
+            )
+
+        record(
+            "audit useless characters",
+            size,
+            lambda: engine.audit_useless_characters(ortho, font),
+        )
+
+        for budget in (100, 500):
+            record(
+                "plan_coverage",
+                size,
+                lambda: engine.plan_coverage(ortho, font, budget),
+                budget=budget,
+            )
+
+        selection = [g.name for g in font][:1000]
+
+        @checks_fonts_once
+        def selection_summary():
+            # The same queries as UnicodeInfo._updateSelection
+            codepoints = engine.selection_codepoints(selection, font)
+            for block, _ in engine.selection_blocks(codepoints):
+                engine.block_completeness(block, font)
+            support = engine.selection_support(ortho, font, codepoints)
+            engine.selection_ui_strings(support)
+
+        record("selection summary", size, selection_summary, selected=len(selection))
+
+        record(
+            "plan_unicode_reassignment",
+            size,
+            lambda: engine.plan_unicode_reassignment(font),
+        )
+        record("reassign_unicodes", size, lambda: engine.reassign_unicodes(font))
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Unicode Info engine.")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[500, 5000, 50000], help="Glyph counts"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", help="Output JSON file, default: stdout")
+    options = parser.parse_args()
+
+    results = run_benchmarks(options.sizes, options.repeat)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jkUnicode": data_version(),
+        "revision": git_revision(),
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
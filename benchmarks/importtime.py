@@ -0,0 +1,128 @@
+"""
+Measure the import time of the plugin's modules with `python -X importtime`.
+
+The plugin module itself needs Glyphs, so the script imports the Python modules
+that plugin.py imports when Glyphs loads the plugin, before and after the imports
+were deferred, and those that are imported when the Unicode Info window is opened
+for the first time.
+
+Usage:
+
+    python benchmarks/importtime.py [--repeat 5] [--top 10]
+
+Each scenario runs in a fresh interpreter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+RESOURCES = (
+    Path(__file__).resolve().parent.parent
+    / "UnicodeInfo.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+
+# The imports of plugin.py at module level, without Glyphs and PyObjC
+PLUGIN_LOAD = """
+import importlib.util
+import os
+import urllib.parse
+import webbrowser
+import fontIndex
+import profiling
+import updateScheduler
+importlib.util.find_spec("jkUnicode")
+"""
+
+# The imports of plugin.py at module level before they were deferred to
+# showWindow_, without Glyphs and PyObjC. The window needed no further imports.
+PLUGIN_LOAD_BASELINE = """
+import urllib.parse
+import webbrowser
+from jkUnicode import UniInfo, get_expanded_glyph_list
+from jkUnicode.aglfn import getGlyphnameForUnicode, getUnicodeForGlyphname
+from jkUnicode.orthography import OrthographyInfo
+from jkUnicode.uniBlock import get_block, get_codepoints, uniNameToBlock
+from jkUnicode.uniName import uniName
+"""
+
+# The additional imports of showWindow_ and the first update of the window
+WINDOW_OPEN = """
+import backgroundJob
+import blockIndex
+import glyphNames
+import jkUnicode
+import jkUnicode.uniBlock
+import orthographyLoader
+import tableCache
+import unicodeInfoEngine
+"""
+
+SCENARIOS = {
+    "plugin load (before, eager imports)": PLUGIN_LOAD_BASELINE,
+    "plugin load (deferred imports)": PLUGIN_LOAD,
+    "first window open (deferred imports)": PLUGIN_LOAD + WINDOW_OPEN,
+}
+
+
+def importtime(code: str) -> dict[str, int]:
+    """
+    Run the code in a fresh interpreter and return the cumulative import times
+    of the top-level imports in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=RESOURCES,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            # Header line
+            continue
+        if name.startswith("  "):
+            # Nested import, already contained in the cumulative time
+            continue
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure plugin import times.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=10, help="Number of slowest modules to list"
+    )
+    options = parser.parse_args()
+
+    baseline = importtime("pass")
+    for scenario, code in SCENARIOS.items():
+        totals = []
+        slowest: dict[str, int] = {}
+        for _ in range(options.repeat):
+            times = importtime(code)
+            # Don't count the modules that are imported by the interpreter itself
+            times = {k: v for k, v in times.items() if k not in baseline}
+            totals.append(sum(times.values()))
+            for name, t in times.items():
+                slowest[name] = min(t, slowest.get(name, t))
+        print(f"{scenario}: {statistics.median(totals) / 1000:.1f} ms")
+        for name, t in sorted(slowest.items(), key=lambda item: -item[1])[
+            : options.top
+        ]:
+            print(f"    {t / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Measure the memory that stays allocated when the Unicode Info window is opened
+several times, with tracemalloc.
+
+The script simulates the window headlessly: each opening creates the engines like
+`UnicodeInfo.showWindow_` and runs the orthography queries of the window, the
+audit, the coverage plan and the comparison of open fonts for a synthetic font.
+The orthography databases are loaded once, like by the plugin's loader.
+
+Usage:
+
+    python benchmarks/memory.py [--opens 5] [--glyphs 5000] [--keep]
+
+With --keep, the engines of all openings stay referenced, as if the windows were
+still open.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any
+
+from benchmark import COMMON_LATIN, synthetic_font
+
+from familyCoverage import FontSnapshot
+from fontIndex import get_font_index
+from jkUnicode import UniInfo
+from orthographyLoader import SOURCES, OrthographyLoader
+from unicodeInfoEngine import UnicodeInfoEngine, default_name_resolver
+
+
+def traced_mib() -> float:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] / 2**20
+
+
+def open_window(
+    loader: OrthographyLoader, info: UniInfo, resolver: Any, font: Any
+) -> tuple[UnicodeInfoEngine, UnicodeInfoEngine]:
+    """
+    Create the engines of a window and run the orthography queries of the window.
+    """
+    engine = UnicodeInfoEngine(resolver, ui=info)
+    worker_engine = UnicodeInfoEngine(resolver)
+    codepoints = sorted(get_font_index(font).codepoints)[:1000]
+    for source in SOURCES:
+        ortho = loader.wait(source)
+        ortho_list = engine.get_orthographies_for_unicode(ortho, COMMON_LATIN)
+        engine.orthography_ui_strings(ortho, font, ortho_list, COMMON_LATIN)
+        engine.speakers_supported_by_unicode(ortho, font, COMMON_LATIN)
+        engine.selection_ui_strings(engine.selection_support(ortho, font, codepoints))
+        engine.audit_useless_characters(ortho, font)
+    ortho = loader.wait(SOURCES[0])
+    engine.plan_coverage(ortho, font, 100)
+    engine.coverage_matrix([FontSnapshot.from_font(font, "Font")], ortho)
+    return engine, worker_engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure the memory of repeated window openings."
+    )
+    parser.add_argument("--opens", type=int, default=5)
+    parser.add_argument("--glyphs", type=int, default=5000)
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the engines of all openings"
+    )
+    options = parser.parse_args()
+
+    font = synthetic_font(options.glyphs)
+    get_font_index(font)
+    resolver = default_name_resolver()
+    tracemalloc.start()
+    start = traced_mib()
+
+    loader = OrthographyLoader()
+    for source in SOURCES:
+        loader.wait(source)
+    info = UniInfo(0)
+    loaded = traced_mib()
+    print(f"{'databases loaded':<20} {loaded - start:8.1f} MiB")
+
+    windows = []
+    previous = loaded
+    for i in range(options.opens):
+        window = open_window(loader, info, resolver, font)
+        if options.keep:
+            windows.append(window)
+        del window
+        current = traced_mib()
+        print(
+            f"{f'window open {i + 1}':<20} {current - start:8.1f} MiB "
+            f"({current - previous:+.1f} MiB)"
+        )
+        previous = current
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    print(f"{'peak':<20} {peak - start:8.1f} MiB")
+    loader.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+RESOURCES = (
+    Path(__file__).resolve().parent.parent
+    / "UnicodeInfo.glyphsPlugin"
+    / "Contents"
+    / "Resources"
+)
+sys.path.insert(0, str(RESOURCES))
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable
+
+from backgroundJob import JobRunner
+
+
+class MainThread:
+    """
+    A dispatch function that queues calls until they are run explicitly, like the
+    run loop of the main thread.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[Callable[[], Any]] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, func: Callable[[], Any]) -> None:
+        with self.lock:
+            self.calls.append(func)
+
+    def run_pending(self) -> int:
+        with self.lock:
+            calls, self.calls = self.calls, []
+        for func in calls:
+            func()
+        return len(calls)
+
+
+def test_prepare_steps_run_one_per_turn_before_the_job():
+    main = MainThread()
+    runner = JobRunner(dispatch=main)
+    log = []
+
+    def prepare():
+        for i in range(3):
+            log.append(f"step {i}")
+            yield
+
+    runner.submit(lambda token: log.append("job") or 42, log.append, prepare=prepare())
+    assert log == []
+    for i in range(3):
+        assert main.run_pending() == 1
+        assert log[-1] == f"step {i}"
+    # The last turn finds the steps exhausted and starts the job
+    main.run_pending()
+    runner.wait()
+    main.run_pending()
+    assert log == ["step 0", "step 1", "step 2", "job", 42]
+    runner.shutdown()
+
+
+def test_cancelled_job_runs_no_further_steps():
+    main = MainThread()
+    runner = JobRunner(dispatch=main)
+    log = []
+
+    def prepare():
+        for i in range(3):
+            log.append(i)
+            yield
+
+    runner.submit(lambda token: log.append("job"), log.append, prepare=prepare())
+    main.run_pending()
+    assert runner.cancel()
+    while main.run_pending():
+        pass
+    runner.wait()
+    assert log == [0]
+    runner.shutdown()
+
+
+def test_failing_step_reports_the_error():
+    runner = JobRunner()
+    errors = []
+
+    def prepare():
+        yield
+        raise ValueError("no names")
+
+    runner.submit(lambda token: None, print, errors.append, prepare())
+    assert [str(e) for e in errors] == ["no names"]
+    assert not runner.running
+    runner.shutdown()
+
+
+def test_job_without_dispatch():
+    runner = JobRunner()
+    results = []
+    runner.submit(lambda token: 1, results.append, prepare=iter([None, None]))
+    runner.wait()
+    assert results == [1]
+    runner.shutdown()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest.importorskip("jkUnicode")
+
+from blockIndex import (  # noqa: E402
+    BlockCompleteness,
+    BlockIndex,
+    data_version,
+    get_block_index,
+)
+from fontIndex import get_font_index  # noqa: E402
+from jkUnicode.uniBlock import uniNameToBlock  # noqa: E402
+from jkUnicode.uniName import uniName  # noqa: E402
+from standInFont import StandInFont  # noqa: E402
+
+
+def baseline_completeness(block: str, codepoints: set[int]) -> str:
+    """
+    The support indicator computed codepoint by codepoint, like before the bitmaps.
+    """
+    any_found = None
+    any_missing = None
+    low, high = uniNameToBlock[block]
+    for cp in range(low, high + 1):
+        if cp in uniName:
+            if cp in codepoints:
+                if any_missing:
+                    return "◑"
+                any_found = True
+            else:
+                if any_found:
+                    return "◑"
+                any_missing = True
+    return "●" if any_found else "○"
+
+
+@pytest.fixture(scope="module")
+def completeness() -> BlockCompleteness:
+    return BlockCompleteness(get_block_index())
+
+
+@pytest.fixture(scope="module")
+def font() -> StandInFont:
+    # Complete, partial and empty blocks
+    rnd = random.Random(0)
+    assigned = sorted(uniName)
+    codepoints = set(range(0x20, 0x7F)) | set(range(0x370, 0x400))
+    codepoints |= set(rnd.sample(assigned, 3000))
+    return StandInFont.from_cmap({u: f"u{u:05X}" for u in codepoints})
+
+
+def test_block_index_matches_jkunicode():
+    index = get_block_index()
+    assert set(index.bounds) == set(uniNameToBlock)
+    for block, (low, high) in uniNameToBlock.items():
+        assert index.bounds[block] == (low, high)
+        assert list(index.assigned[block]) == sorted(
+            u for u in uniName if low <= u <= high
+        )
+        assert index.block_for_codepoint(low) == block
+        assert index.block_for_codepoint(high) == block
+
+
+def test_block_index_round_trips_through_tables():
+    index = get_block_index()
+    copy = BlockIndex(index.to_tables())
+    assert copy.ranges == index.ranges
+    assert copy.assigned == index.assigned
+
+
+def test_completeness_matches_baseline(completeness, font):
+    index = get_font_index(font)
+    completeness.sync(index)
+    codepoints = set(index.codepoints)
+    symbols = set()
+    for block, (low, high) in uniNameToBlock.items():
+        symbol = completeness.symbol(block)
+        assert symbol == baseline_completeness(block, codepoints), block
+        symbols.add(symbol)
+        assigned = [u for u in uniName if low <= u <= high]
+        found = sum(1 for u in assigned if u in codepoints)
+        assert completeness.counts(block) == (found, len(assigned) - found)
+        assert completeness.missing_codepoints(block) == sorted(
+            u for u in assigned if u not in codepoints
+        )
+    assert symbols == {"○", "◑", "●"}
+
+
+def test_counts_follow_font_changes():
+    completeness = BlockCompleteness(get_block_index())
+    assigned = get_block_index().assigned["Basic Latin"]
+    font = StandInFont.from_cmap({u: f"u{u:05X}" for u in assigned})
+    completeness.sync(get_font_index(font))
+    assert completeness.symbol("Basic Latin") == "●"
+    font.glyphs["u00041"].unicodes = None
+    completeness.sync(get_font_index(font))
+    assert completeness.symbol("Basic Latin") == "◑"
+    assert completeness.missing_codepoints("Basic Latin") == [0x41]
+    for glyph in font:
+        glyph.export = False
+    completeness.sync(get_font_index(font))
+    assert completeness.symbol("Basic Latin") == "○"
+    assert completeness.counts("Basic Latin") == (0, len(assigned))
+
+
+def test_data_version_is_looked_up_once(monkeypatch):
+    version = data_version()
+    assert version
+
+    def fail(name):
+        raise AssertionError("looked up again")
+
+    monkeypatch.setattr("importlib.metadata.version", fail)
+    assert data_version() == version
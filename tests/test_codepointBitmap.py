@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from codepointBitmap import NUM_BYTES, SIZE, CodepointBitmap
+
+# Codepoints at byte boundaries, range ends and the end of the codespace
+EDGES = [0, 1, 7, 8, 9, 15, 16, 0xFF, 0x100, 0xFFFF, 0x10000, SIZE - 8, SIZE - 1]
+
+RANGES = [
+    (0, SIZE - 1),
+    (0, 0),
+    (0, 7),
+    (1, 8),
+    (7, 8),
+    (8, 15),
+    (9, 16),
+    (3, 3),
+    (0xF8, 0x107),
+    (0xFFFF, 0x10000),
+    (SIZE - 9, SIZE - 1),
+]
+
+
+@pytest.fixture(scope="module")
+def bitmaps():
+    rnd = random.Random(0)
+    a = set(EDGES) | set(rnd.sample(range(0x300), 200))
+    b = set(EDGES[::2]) | set(rnd.sample(range(0x300), 200))
+    return a, b, CodepointBitmap.from_codepoints(a), CodepointBitmap.from_codepoints(b)
+
+
+def test_set_operations(bitmaps):
+    a, b, bitmap_a, bitmap_b = bitmaps
+    assert len(bitmap_a) == len(a)
+    assert list(bitmap_a) == sorted(a)
+    assert list(bitmap_a & bitmap_b) == sorted(a & b)
+    assert list(bitmap_a | bitmap_b) == sorted(a | b)
+    assert list(bitmap_a - bitmap_b) == sorted(a - b)
+    assert all(u in bitmap_a for u in a)
+    assert -1 not in bitmap_a
+    assert SIZE not in bitmap_a
+
+
+@pytest.mark.parametrize("low, high", RANGES)
+def test_range_queries(bitmaps, low, high):
+    a, b, bitmap_a, bitmap_b = bitmaps
+    in_range = {u for u in a if low <= u <= high}
+    assert bitmap_a.count(low, high) == len(in_range)
+    assert bitmap_a.codepoints(low, high) == sorted(in_range)
+    assert bitmap_a.count_in(bitmap_b, low, high) == len(in_range & b)
+    assert bitmap_a.codepoints_not_in(bitmap_b, low, high) == sorted(in_range - b)
+
+
+def test_full_and_empty_ranges():
+    full = CodepointBitmap(b"\xff" * NUM_BYTES)
+    empty = CodepointBitmap()
+    assert len(full) == SIZE
+    assert full.count(5, 0x1234) == 0x1230
+    assert full.codepoints_not_in(empty, 0xFFF9, 0x10006) == list(
+        range(0xFFF9, 0x10007)
+    )
+    assert full.codepoints_not_in(full, 0, SIZE - 1) == []
+    assert empty.count_in(full) == 0
+
+
+def test_wrong_size_is_rejected():
+    with pytest.raises(ValueError):
+        CodepointBitmap(bytes(10))
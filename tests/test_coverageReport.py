@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import plistlib
+
+import pytest
+
+from coverageReport import load_font
+
+
+def glyph_info(font) -> dict[str, tuple[list[str] | None, bool]]:
+    return {g.name: (g.unicodes, g.export) for g in font}
+
+
+def test_load_json_cmap_dump(tmp_path):
+    path = tmp_path / "font.json"
+    path.write_text(json.dumps({"0041": "A", "0x42": "B", "U+00C4": "Adieresis"}))
+    assert glyph_info(load_font(str(path))) == {
+        "A": (["0041"], True),
+        "B": (["0042"], True),
+        "Adieresis": (["00C4"], True),
+    }
+
+
+def test_load_text_cmap_dump(tmp_path):
+    path = tmp_path / "font.txt"
+    path.write_text("# A comment\n0041 A\nU+0042\n\n0x0391 Alpha  # Greek\n")
+    assert glyph_info(load_font(str(path))) == {
+        "A": (["0041"], True),
+        "uni0042": (["0042"], True),
+        "Alpha": (["0391"], True),
+    }
+
+
+def test_load_ufo(tmp_path):
+    ufo = tmp_path / "font.ufo"
+    (ufo / "glyphs").mkdir(parents=True)
+    glyphs = {
+        "A": ["0041"],
+        "A.sc": [],
+        "Omega": ["03A9", "2126"],
+        "skipped": ["0042"],
+    }
+    contents = {}
+    for name, unicodes in glyphs.items():
+        file_name = f"{name.replace('.', '_')}.glif"
+        contents[name] = file_name
+        elements = "".join(f'<unicode hex="{u.lower()}"/>' for u in unicodes)
+        (ufo / "glyphs" / file_name).write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<glyph name="{name}" format="2">{elements}<outline/></glyph>\n'
+        )
+    with open(ufo / "glyphs" / "contents.plist", "wb") as f:
+        plistlib.dump(contents, f)
+    with open(ufo / "lib.plist", "wb") as f:
+        plistlib.dump({"public.skipExportGlyphs": ["skipped"]}, f)
+    assert glyph_info(load_font(str(ufo))) == {
+        "A": (["0041"], True),
+        "A.sc": (None, True),
+        "Omega": (["03A9", "2126"], True),
+        "skipped": (["0042"], False),
+    }
+
+
+GLYPHS_2 = """{
+.appVersion = "1352";
+glyphs = (
+{
+glyphname = A;
+unicode = 0041;
+},
+{
+glyphname = Omega;
+unicode = "03A9,2126";
+},
+{
+glyphname = A.sc;
+},
+{
+export = 0;
+glyphname = B;
+unicode = 0042;
+}
+);
+}
+"""
+
+GLYPHS_3 = """{
+.formatVersion = 3;
+glyphs = (
+{
+glyphname = A;
+unicode = 65;
+},
+{
+glyphname = Omega;
+unicode = (937,8486);
+},
+{
+glyphname = A.sc;
+},
+{
+export = 0;
+glyphname = B;
+unicode = 66;
+}
+);
+}
+"""
+
+
+@pytest.mark.parametrize("source", [GLYPHS_2, GLYPHS_3], ids=["Glyphs 2", "Glyphs 3"])
+def test_load_glyphs_source(tmp_path, source):
+    pytest.importorskip("openstep_plist")
+    path = tmp_path / "font.glyphs"
+    path.write_text(source)
+    assert glyph_info(load_font(str(path))) == {
+        "A": (["0041"], True),
+        "Omega": (["03A9", "2126"], True),
+        "A.sc": (None, True),
+        "B": (["0042"], False),
+    }
+
+
+def test_font_coverage(tmp_path):
+    pytest.importorskip("jkUnicode")
+    import coverageReport
+
+    path = tmp_path / "font.txt"
+    path.write_text("\n".join("%04X" % u for u in range(0x20, 0x7F)))
+    coverageReport._init_worker("Hyperglot", (5, None))
+    entry = coverageReport.font_coverage(str(path))
+    assert entry["codepoints"] == 0x5F
+    assert list(entry["blocks"]) == ["Basic Latin"]
+    assert entry["blocks"]["Basic Latin"]["found"] == 0x5F
+    # Indonesian only needs ASCII letters
+    assert entry["orthographies"]["id"]["support_basic"]
+    assert entry["plan"]
+    assert all(step["codepoints"] for step in entry["plan"])
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("jkUnicode")
+
+from blockIndex import get_block_index  # noqa: E402
+from codepointBitmap import get_assigned_bitmap  # noqa: E402
+from coveragePlanner import CoveragePlanner  # noqa: E402
+from familyCoverage import FontSnapshot, compute_coverage_matrix  # noqa: E402
+from orthographyDatabase import get_orthography_database  # noqa: E402
+from orthographyIndex import OrthographyMasks, OrthographySupport  # noqa: E402
+
+LATIN = set(range(0x20, 0x7F)) | set(range(0xA0, 0x180))
+
+
+@pytest.fixture(scope="module")
+def ortho():
+    return get_orthography_database("Hyperglot")
+
+
+def test_masks_are_shared_by_the_planner(ortho):
+    masks = ortho.shared("orthography masks", OrthographyMasks)
+    planner = CoveragePlanner(ortho)
+    assert planner.masks is masks
+    for o, mask in zip(ortho.orthographies, masks.basic):
+        assert set(masks.codepoints_for_mask(mask)) == o.unicodes_base_punctuation
+
+
+def test_plan_gives_basic_support(ortho):
+    planner = ortho.shared("coverage planner", CoveragePlanner)
+    plan = planner.plan(LATIN, 50, ["Latin"])
+    assert len(plan.codepoints) <= 50
+    support = OrthographySupport(ortho.index, LATIN | set(plan.codepoints))
+    for step in plan.steps:
+        for o in step.orthographies:
+            assert support.support_basic(o)
+
+
+def test_matrix_matches_orthography_support(ortho):
+    snapshots = [
+        FontSnapshot("Latin", LATIN),
+        FontSnapshot("ASCII", range(0x20, 0x7F)),
+    ]
+    matrix = compute_coverage_matrix(
+        snapshots, get_block_index(), get_assigned_bitmap(), ortho
+    )
+    assert matrix.fonts == ["Latin", "ASCII"]
+    supports = [OrthographySupport(ortho.index, s.codepoints) for s in snapshots]
+    expected = sorted(
+        (o.name, symbols)
+        for o in ortho.orthographies
+        for symbols in [[support.symbol(o) for support in supports]]
+        if symbols != ["○", "○"]
+    )
+    assert matrix.orthographies == expected
+    assert matrix.orthographies
+    blocks = {name: found for name, _, found in matrix.blocks}
+    assert blocks["Basic Latin"] == [95, 95]
+    assert blocks["Latin Extended-A"] == [128, 0]
+    assert "Latin Extended-A" in matrix.divergent_blocks()
+
+
+def test_matrix_without_orthographies():
+    matrix = compute_coverage_matrix(
+        [FontSnapshot("ASCII", range(0x41, 0x5B))],
+        get_block_index(),
+        get_assigned_bitmap(),
+    )
+    assert matrix.orthographies == []
+    assert matrix.blocks == [("Basic Latin", 128, [26])]
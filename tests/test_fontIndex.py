@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from fontIndex import check_fonts_once, get_font_index, invalidate_font_index
+from standInFont import StandInFont, StandInGlyph
+
+
+def make_font() -> StandInFont:
+    return StandInFont(
+        [
+            StandInGlyph("a", ["0061"]),
+            StandInGlyph("b", ["0062"]),
+            StandInGlyph("a.sc"),
+        ]
+    )
+
+
+def test_index_is_current_until_the_font_changes():
+    font = make_font()
+    index = get_font_index(font)
+    assert index.is_current()
+    assert get_font_index(font) is index
+    assert dict(index.cmap) == {0x61: "a", 0x62: "b"}
+    assert index.variants == {"a": ["a.sc"], "b": []}
+
+
+def test_rename_of_another_glyph_is_detected():
+    font = make_font()
+    index = get_font_index(font)
+    font.glyphs["b"].name = "bee"
+    assert not index.is_current()
+    index = get_font_index(font, font.glyphs["a"])
+    assert index.cmap[0x62] == "bee"
+    assert "b" not in index.names
+
+
+def test_reencoding_of_another_glyph_is_detected():
+    font = make_font()
+    get_font_index(font)
+    font.glyphs["b"].unicodes = ["0063"]
+    index = get_font_index(font, font.glyphs["a"])
+    assert sorted(index.codepoints) == [0x61, 0x63]
+
+
+def test_delete_and_add_is_detected():
+    font = make_font()
+    get_font_index(font)
+    del font.glyphs["b"]
+    font.glyphs.append(StandInGlyph("c", ["0063"]))
+    index = get_font_index(font)
+    assert sorted(index.codepoints) == [0x61, 0x63]
+    assert list(index.names) == ["a", "a.sc", "c"]
+
+
+def test_change_of_the_current_glyph_is_synced():
+    font = make_font()
+    index = get_font_index(font)
+    version = index.version
+    glyph = font.glyphs["a"]
+    glyph.unicodes = ["0061", "00E0"]
+    assert get_font_index(font, glyph) is index
+    assert index.cmap[0xE0] == "a"
+    assert index.version == version + 1
+    assert index.is_current()
+
+
+def test_invalidated_index_is_rebuilt():
+    font = make_font()
+    index = get_font_index(font)
+    invalidate_font_index(font)
+    assert not index.is_current()
+    assert get_font_index(font, font.glyphs["a"]).is_current()
+
+
+def test_font_is_checked_once_per_round():
+    font = make_font()
+    index = get_font_index(font)
+    with check_fonts_once():
+        get_font_index(font)
+        font.glyphs["b"].unicodes = ["0063"]
+        with check_fonts_once():
+            assert 0x62 in get_font_index(font).cmap
+        invalidate_font_index(font)
+        assert sorted(get_font_index(font).codepoints) == [0x61, 0x63]
+        font.glyphs["b"].unicodes = ["0064"]
+        assert 0x64 not in get_font_index(font).cmap
+    assert get_font_index(font) is index
+    assert sorted(index.codepoints) == [0x61, 0x64]
+
+
+class UntimedGlyph:
+    def __init__(self, name: str, unicodes: list[str]) -> None:
+        self.name = name
+        self.unicodes = unicodes
+        self.export = True
+
+
+class UntimedFont:
+    """
+    A font whose glyphs have no change time.
+    """
+
+    disablesNiceNames = True
+
+    def __init__(self, glyphs: list[UntimedGlyph]) -> None:
+        self.glyphs = glyphs
+
+
+def test_index_of_font_without_change_times_is_never_current():
+    font = UntimedFont([UntimedGlyph("a", ["0061"]), UntimedGlyph("b", ["0062"])])
+    index = get_font_index(font)
+    assert not index.is_current()
+    font.glyphs[1].unicodes = ["0063"]
+    assert sorted(get_font_index(font).codepoints) == [0x61, 0x63]
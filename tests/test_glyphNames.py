@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("jkUnicode")
+
+from glyphNames import GlyphNameResolver  # noqa: E402
+
+
+class NiceNames:
+    """
+    Nice name lookups that count their calls.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def name(self, value: int) -> str | None:
+        self.calls += 1
+        return None if value >= 0xE000 else f"nice{value:04X}"
+
+    def unicode(self, name: str) -> int | None:
+        self.calls += 1
+        return int(name[4:], 16) if name.startswith("nice") else None
+
+
+def make_resolver(maxsize: int = 0x10000) -> tuple[GlyphNameResolver, NiceNames]:
+    nice = NiceNames()
+    return GlyphNameResolver(nice.name, nice.unicode, "1", maxsize), nice
+
+
+def test_lookups_are_cached():
+    resolver, nice = make_resolver()
+    assert resolver.name_for_codepoint(0x41) == "nice0041"
+    assert resolver.name_for_codepoint(0x41) == "nice0041"
+    # PUA codepoints get a fallback name
+    assert resolver.name_for_codepoint(0xE000) == "uniE000"
+    assert resolver.codepoint_for_name("nice0042") == 0x42
+    assert resolver.codepoint_for_name("nice0042") == 0x42
+    assert nice.calls == 3
+    # AGLFN names don't use the nice name functions
+    assert resolver.name_for_codepoint(0x41, nice_names=False) == "A"
+    assert nice.calls == 3
+
+
+def test_uncached_and_snapshot():
+    resolver, nice = make_resolver()
+    resolver.name_for_codepoint(0x41)
+    assert resolver.uncached([0x41, 0x42, 0x43]) == [0x42, 0x43]
+    assert resolver.uncached([0x41], nice_names=False) == [0x41]
+    for u in resolver.uncached(range(0x41, 0x44)):
+        resolver.name_for_codepoint(u)
+    calls = nice.calls
+    snapshot = resolver.snapshot(range(0x41, 0x44))
+    assert nice.calls == calls
+    assert [snapshot.name_for_codepoint(u) for u in range(0x41, 0x44)] == [
+        "nice0041",
+        "nice0042",
+        "nice0043",
+    ]
+    # The snapshot never calls the nice name functions
+    assert snapshot.name_for_codepoint(0x44) == "uni0044"
+    assert nice.calls == calls
+
+
+def test_cache_is_bounded():
+    resolver, nice = make_resolver(maxsize=2)
+    for u in (0x41, 0x42, 0x43):
+        resolver.name_for_codepoint(u)
+    assert resolver.uncached([0x41, 0x42, 0x43]) == [0x41]
+
+
+def test_dirty_until_tables_are_taken():
+    resolver, nice = make_resolver()
+    assert not resolver.dirty
+    # AGLFN lookups are not saved
+    resolver.name_for_codepoint(0x41, nice_names=False)
+    assert not resolver.dirty
+    resolver.name_for_codepoint(0x41)
+    resolver.codepoint_for_name("nice0042")
+    assert resolver.dirty
+    tables = resolver.to_tables()
+    assert not resolver.dirty
+    # Cached lookups don't change the tables
+    resolver.name_for_codepoint(0x41)
+    assert not resolver.dirty
+
+    loaded, nice = make_resolver()
+    loaded.load_tables(tables)
+    assert not loaded.dirty
+    assert loaded.name_for_codepoint(0x41) == "nice0041"
+    assert loaded.codepoint_for_name("nice0042") == 0x42
+    assert nice.calls == 0
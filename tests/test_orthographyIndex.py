@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest.importorskip("jkUnicode")
+
+from jkUnicode import UniInfo  # noqa: E402
+from jkUnicode.orthography import OrthographyInfo  # noqa: E402
+from orthographyDatabase import get_orthography_database  # noqa: E402
+from orthographyIndex import OrthographySupport  # noqa: E402
+
+
+@pytest.fixture(scope="module", params=["Hyperglot", "CLDR"])
+def databases(request):
+    """
+    The shared database of a source and a separate OrthographyInfo of the same
+    source, which computes the support with a full scan of its cmap.
+    """
+    return (
+        get_orthography_database(request.param),
+        OrthographyInfo(ui=UniInfo(0), source=request.param),
+    )
+
+
+def assert_same_support(support: OrthographySupport, reference: OrthographyInfo):
+    reference.cmap = {u: "x" for u in support.codepoints}
+    for i, (o, r) in enumerate(
+        zip(support.index.orthographies, reference.orthographies)
+    ):
+        assert o.identifier == r.identifier
+        assert (
+            support.missing_base[i],
+            support.missing_punctuation[i],
+            support.missing_optional[i],
+        ) == (r.num_missing_base, r.num_missing_punctuation, r.num_missing_optional)
+        assert support.support_basic(o) == r.support_basic
+        assert support.support_full(o) == r.support_full
+
+
+def all_codepoints(database) -> list[int]:
+    return sorted({u for o in database.orthographies for u in o.unicodes_any})
+
+
+@pytest.mark.parametrize("max_delta", [OrthographySupport.max_delta, 10**6])
+@pytest.mark.parametrize("size", [1, 20, 255, 257, 2000])
+def test_delta_update_matches_full_scan(databases, size, max_delta):
+    database, reference = databases
+    rnd = random.Random(size)
+    candidates = all_codepoints(database)
+    codepoints = set(range(0x20, 0x250))
+    support = OrthographySupport(database.index, codepoints)
+    # Without a limit, large changes are applied as delta, too
+    support.max_delta = max_delta
+    for _ in range(3):
+        changed = rnd.sample(candidates, size)
+        codepoints.symmetric_difference_update(changed)
+        support.set_codepoints(codepoints)
+        assert support.codepoints == codepoints
+        assert_same_support(support, reference)
+
+
+def test_speakers_match_full_scan(databases):
+    database, reference = databases
+    codepoints = set(range(0x20, 0x250))
+    support = OrthographySupport(database.index, range(0x20, 0x80))
+    support.set_codepoints(codepoints)
+    reference.cmap = {u: "x" for u in codepoints}
+    sample = random.Random(0).sample(all_codepoints(database), 300)
+    expected = {u: reference.speakers_supported_by_unicode(u) for u in sample}
+    assert {u: support.speakers_supported_by_unicode(u) for u in sample} == expected
+    # Cached values are dropped when the codepoints change
+    codepoints.difference_update(range(0x61, 0x7B))
+    support.set_codepoints(codepoints)
+    reference.cmap = {u: "x" for u in codepoints}
+    expected = {u: reference.speakers_supported_by_unicode(u) for u in sample}
+    assert support.speakers_by_codepoint(sample) == expected
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from standInFont import StandInFont, StandInGlyph
+
+
+def test_renamed_glyph_is_found_by_its_new_name():
+    font = StandInFont([StandInGlyph("A", ["0041"]), StandInGlyph("B", ["0042"])])
+    glyph = font.glyphs["A"]
+    change = font.lastChange
+    glyph.name = "Aalt"
+    assert font.glyphs["Aalt"] is glyph
+    assert font.glyphs["A"] is None
+    assert "A" not in font
+    assert font.glyphs.keys() == ["Aalt", "B"]
+    assert font.lastChange > change
+    assert glyph.lastChange == font.lastChange
+
+
+def test_rename_to_an_existing_name_is_rejected():
+    font = StandInFont([StandInGlyph("A"), StandInGlyph("B")])
+    with pytest.raises(KeyError):
+        font.glyphs["A"].name = "B"
+    assert font.glyphs["A"].name == "A"
+    assert font.glyphs["B"].name == "B"
+
+
+def test_removed_glyph_can_be_renamed_freely():
+    font = StandInFont([StandInGlyph("A"), StandInGlyph("B")])
+    glyph = font.glyphs["A"]
+    del font.glyphs["A"]
+    glyph.name = "B"
+    assert font.glyphs["B"] is not glyph
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from array import array
+
+from tableCache import TableCache
+
+TABLES = {
+    "codepoints": array("I", [0x41, 0x10FFFF, 0]),
+    "offsets": array("i", [-1, 2, 3]),
+    "flags": array("B", [1, 0, 255]),
+    "names": ["A", "uni10FFFF", "ä.sc"],
+    "empty": [],
+}
+
+
+def test_tables_round_trip(tmp_path):
+    cache = TableCache(tmp_path)
+    assert cache.save("test", "1.0", TABLES)
+    loaded = cache.load("test", "1.0")
+    assert loaded == TABLES
+    assert loaded["codepoints"].typecode == "I"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_missing_or_stale_file_is_not_loaded(tmp_path):
+    cache = TableCache(tmp_path)
+    assert cache.load("test", "1.0") is None
+    cache.save("test", "1.0", TABLES)
+    assert cache.load("test", "2.0") is None
+
+
+def test_corrupt_file_is_not_loaded(tmp_path):
+    cache = TableCache(tmp_path)
+    cache.save("test", "1.0", TABLES)
+    path = cache.path("test")
+    path.write_bytes(path.read_bytes()[:40])
+    assert cache.load("test", "1.0") is None
+    path.write_bytes(b"")
+    assert cache.load("test", "1.0") is None
+
+
+def test_load_or_build(tmp_path):
+    cache = TableCache(tmp_path)
+    builds = []
+
+    def build(version):
+        def build_tables():
+            builds.append(version)
+            return {"version": [version]}
+
+        return build_tables
+
+    assert cache.load_or_build("test", "1.0", build("1.0")) == {"version": ["1.0"]}
+    assert cache.load_or_build("test", "1.0", build("1.0")) == {"version": ["1.0"]}
+    assert builds == ["1.0"]
+    # A new key rebuilds the tables and replaces the file
+    assert cache.load_or_build("test", "2.0", build("2.0")) == {"version": ["2.0"]}
+    assert builds == ["1.0", "2.0"]
+    assert cache.load("test", "1.0") is None
+    assert cache.load("test", "2.0") == {"version": ["2.0"]}
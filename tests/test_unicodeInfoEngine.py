@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("jkUnicode")
+
+from standInFont import StandInFont, StandInGlyph  # noqa: E402
+from unicodeInfoEngine import UnicodeInfoEngine  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def engine() -> UnicodeInfoEngine:
+    return UnicodeInfoEngine()
+
+
+def unicodes(font: StandInFont) -> dict[str, str | None]:
+    return {g.name: g.unicode for g in font}
+
+
+# Reassignment of Unicode values
+
+
+def test_reassignment_plan(engine):
+    font = StandInFont(
+        [
+            StandInGlyph("A", ["0041"]),
+            StandInGlyph("B", ["0043"]),
+            StandInGlyph("uni0044"),
+            StandInGlyph("foo", ["0045"]),
+            StandInGlyph("E"),
+            StandInGlyph("a.sc"),
+        ]
+    )
+    plan = engine.plan_unicode_reassignment(font)
+    assert plan.changes == [
+        ("B", 0x43, 0x42),
+        ("uni0044", None, 0x44),
+        ("foo", 0x45, None),
+        ("E", None, 0x45),
+    ]
+    assert plan.conflicts == []
+    assert plan.unchanged == ["A", "a.sc"]
+    # Planning doesn't modify the font
+    assert font.glyphs["B"].unicode == "0043"
+
+
+def test_reassignment_conflicts_with_kept_codepoints(engine):
+    font = StandInFont(
+        [
+            StandInGlyph("A", ["0041"]),
+            StandInGlyph("alpha", ["0041"]),
+            StandInGlyph("uni0042"),
+            StandInGlyph("B"),
+        ]
+    )
+    plan = engine.plan_unicode_reassignment(font)
+    assert plan.changes == [("alpha", 0x41, 0x3B1), ("uni0042", None, 0x42)]
+    assert plan.conflicts == [("B", None, 0x42, "uni0042")]
+    assert plan.unchanged == ["A"]
+
+
+def test_reassignment_plan_json_round_trip(engine):
+    font = StandInFont(
+        [
+            StandInGlyph("A", ["0042"]),
+            StandInGlyph("B", ["0043"]),
+            StandInGlyph("uni0041"),
+            StandInGlyph("C"),
+        ]
+    )
+    plan = engine.plan_unicode_reassignment(font)
+    data = json.loads(plan.to_json())
+    assert data == plan.as_dict()
+    assert data == {
+        "changes": [
+            {"glyph": "A", "old": "0042", "new": "0041"},
+            {"glyph": "B", "old": "0043", "new": "0042"},
+            {"glyph": "C", "old": None, "new": "0043"},
+        ],
+        "conflicts": [
+            {"glyph": "uni0041", "old": None, "new": "0041", "used_by": "A"},
+        ],
+        "unchanged": 0,
+        "applied": False,
+    }
+
+
+def test_reassignment_uses_codepoints_vacated_in_the_plan(engine):
+    font = StandInFont([StandInGlyph("foo", ["0042"]), StandInGlyph("B")])
+    plan = engine.plan_unicode_reassignment(font)
+    assert plan.changes == [("foo", 0x42, None), ("B", None, 0x42)]
+    assert plan.conflicts == []
+    engine.apply_unicode_reassignment(plan, font)
+    assert unicodes(font) == {"foo": None, "B": "0042"}
+
+
+def test_rejected_change_keeps_its_codepoint(engine):
+    # A can't get 0041, which uni0041 keeps, so A keeps 0042 and B can't take it
+    font = StandInFont(
+        [
+            StandInGlyph("uni0041", ["0041"]),
+            StandInGlyph("B"),
+            StandInGlyph("A", ["0042"]),
+        ]
+    )
+    plan = engine.plan_unicode_reassignment(font)
+    assert plan.changes == []
+    assert plan.conflicts == [("B", None, 0x42, "A"), ("A", 0x42, 0x41, "uni0041")]
+    assert plan.unchanged == ["uni0041"]
+
+
+def test_swap_is_applied(engine):
+    font = StandInFont([StandInGlyph("A", ["0042"]), StandInGlyph("B", ["0041"])])
+    plan = engine.reassign_unicodes(font)
+    assert plan.conflicts == []
+    assert unicodes(font) == {"A": "0041", "B": "0042"}
+
+
+def test_apply_reassignment(engine):
+    font = StandInFont([StandInGlyph("A", ["0042"]), StandInGlyph("uni0043")])
+    plan = engine.reassign_unicodes(font)
+    assert plan.applied
+    assert json.loads(plan.to_json())["applied"] is True
+    assert unicodes(font) == {"A": "0041", "uni0043": "0043"}
+    assert engine.plan_unicode_reassignment(font).changes == []
+
+
+# Block glyph lists
+
+
+def test_missing_glyphs_for_block(engine):
+    font = StandInFont(
+        [
+            StandInGlyph("A", ["0041"]),
+            StandInGlyph("A.sc"),
+            # Unencoded, but in the font under the name of a missing codepoint
+            StandInGlyph("B"),
+            # Encoded under another name
+            StandInGlyph("cee", ["0043"]),
+        ]
+    )
+    missing = engine.get_missing_glyphs_for_block("Basic Latin", font)
+    assert "A" not in missing
+    assert "B" not in missing
+    assert "C" not in missing
+    assert missing[0x20:0x23] == ["space", "exclam", "quotedbl"]
+    assert missing == [
+        n
+        for n in engine.get_block_glyph_list("Basic Latin", font, False, False)
+        if n not in ("A", "A.sc", "B", "C")
+    ]
+    assert engine.has_missing_glyphs_for_block("Basic Latin", font)
+
+
+def test_complete_block_has_no_missing_glyphs(engine):
+    codepoints = engine.block_codepoints("Basic Latin", reserved=False)
+    font = StandInFont.from_cmap({u: f"u{u:05X}" for u in codepoints})
+    assert engine.block_completeness("Basic Latin", font) == "●"
+    assert not engine.has_missing_glyphs_for_block("Basic Latin", font)
+    assert engine.get_missing_glyphs_for_block("Basic Latin", font) == []
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from updateScheduler import UpdateScheduler
+
+
+class FakeClock:
+    """
+    A clock and a `call_later` function whose delayed calls only run when the
+    clock is advanced.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.calls: list[tuple[float, Callable[[], Any]]] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def call_later(self, delay: float, func: Callable[[], Any]) -> None:
+        self.calls.append((self.now + delay, func))
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+        due = [c for c in self.calls if c[0] <= self.now]
+        self.calls = [c for c in self.calls if c[0] > self.now]
+        for _, func in sorted(due, key=lambda c: c[0]):
+            func()
+
+
+def make_scheduler(key_func=None) -> tuple[UpdateScheduler, FakeClock, list[int]]:
+    clock = FakeClock()
+    updates: list[int] = []
+    scheduler = UpdateScheduler(
+        lambda: updates.append(1),
+        clock.call_later,
+        key_func=key_func,
+        interval=0.1,
+        clock=clock,
+    )
+    return scheduler, clock, updates
+
+
+def test_burst_is_coalesced_into_one_update():
+    scheduler, clock, updates = make_scheduler()
+    for _ in range(5):
+        scheduler.notify()
+    clock.advance(0)
+    assert len(updates) == 1
+    assert scheduler.stats() == {
+        "received": 5,
+        "coalesced": 4,
+        "skipped": 0,
+        "processed": 1,
+    }
+
+
+def test_next_update_waits_for_the_interval():
+    scheduler, clock, updates = make_scheduler()
+    scheduler.notify()
+    clock.advance(0)
+    scheduler.notify()
+    clock.advance(0.05)
+    assert len(updates) == 1
+    clock.advance(0.05)
+    assert len(updates) == 2
+
+
+def test_unchanged_key_is_skipped():
+    key = ["a"]
+    scheduler, clock, updates = make_scheduler(key_func=lambda: key[0])
+    scheduler.notify()
+    clock.advance(0)
+    scheduler.notify()
+    clock.advance(0.1)
+    assert len(updates) == 1
+    key[0] = "b"
+    scheduler.notify()
+    clock.advance(0.1)
+    assert len(updates) == 2
+    assert scheduler.stats() == {
+        "received": 3,
+        "coalesced": 0,
+        "skipped": 1,
+        "processed": 2,
+    }
+
+
+def test_cancel_drops_the_pending_update_and_the_last_key():
+    scheduler, clock, updates = make_scheduler(key_func=lambda: "a")
+    scheduler.notify()
+    clock.advance(0)
+    scheduler.notify()
+    scheduler.cancel()
+    clock.advance(0.1)
+    assert len(updates) == 1
+    # The same key is processed again after cancelling
+    scheduler.notify()
+    clock.advance(0.1)
+    assert len(updates) == 2
+    scheduler.reset_stats()
+    assert scheduler.stats() == {
+        "received": 0,
+        "coalesced": 0,
+        "skipped": 0,
+        "processed": 0,
+    }